@@ -1,6 +1,7 @@
 import logging
 from contextlib import asynccontextmanager
 
+from anyio import to_thread
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from decouple import config
 from fastapi import FastAPI, Request
@@ -9,7 +10,7 @@ from fastapi.middleware.gzip import GZipMiddleware
 from starlette.responses import StreamingResponse
 
 from chalicelib.utils import helper
-from chalicelib.utils import pg_client
+from chalicelib.utils import pg_client, pg_client_async
 from routers import core, core_dynamic
 from crons import core_crons, core_dynamic_crons
 from routers.subs import insights, metrics, v1_api, health
@@ -26,8 +27,11 @@ async def lifespan(app: FastAPI):
     ap_logger = logging.getLogger('apscheduler')
     ap_logger.setLevel(loglevel)
 
+    # Sync routes run in anyio's threadpool, its size bounds the concurrent blocking (DB/HTTP) calls
+    to_thread.current_default_thread_limiter().total_tokens = config("API_THREADS", cast=int, default=40)
     app.schedule = AsyncIOScheduler()
     await pg_client.init()
+    await pg_client_async.init()
     app.schedule.start()
 
     for job in core_crons.cron_jobs + core_dynamic_crons.cron_jobs:
@@ -43,6 +47,7 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logging.info(">>>>> shutting down <<<<<")
     app.schedule.shutdown(wait=False)
+    await pg_client_async.terminate()
     await pg_client.terminate()
 
 
@@ -3,6 +3,7 @@ from typing import Optional
 from fastapi import Request
 from fastapi.security import APIKeyHeader
 from starlette import status
+from starlette.concurrency import run_in_threadpool
 from starlette.exceptions import HTTPException
 
 from chalicelib.core import authorizers
@@ -15,7 +16,7 @@ class APIKeyAuth(APIKeyHeader):
 
     async def __call__(self, request: Request) -> Optional[CurrentAPIContext]:
         api_key: Optional[str] = await super(APIKeyAuth, self).__call__(request)
-        r = authorizers.api_key_authorizer(api_key)
+        r = await run_in_threadpool(authorizers.api_key_authorizer, api_key)
         if r is None:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
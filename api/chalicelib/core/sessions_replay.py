@@ -1,9 +1,82 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from time import time
+
+from decouple import config
+from fastapi import HTTPException, status
+
 import schemas
 from chalicelib.core import events, metadata, events_ios, \
     sessions_mobs, issues, resources, assist, sessions_devtool, sessions_notes
 from chalicelib.utils import errors_helper
 from chalicelib.utils import pg_client, helper
 
+# The independent parts of a replay are fetched concurrently, each part with its own pooled connection.
+# The workers are bounded by the connections the request threads leave in the pool, so that the parts,
+# even the ones still running after a timeout, can't exhaust it; the other parts wait in the queue.
+__executor = ThreadPoolExecutor(max_workers=config("REPLAY_FAN_OUT_WORKERS", cast=int,
+                                                   default=max(config("PG_MAXCONN", cast=int, default=80)
+                                                               - config("API_THREADS", cast=int, default=40), 1)),
+                                thread_name_prefix="replay")
+# assist calls don't use a connection, they never wait behind the database parts
+__assist_executor = ThreadPoolExecutor(max_workers=config("REPLAY_ASSIST_WORKERS", cast=int,
+                                                          default=config("API_THREADS", cast=int, default=40)),
+                                       thread_name_prefix="replay-assist")
+PART_TIMEOUT = config("REPLAY_PART_TIMEOUT", cast=int, default=30)
+ASSIST_TIMEOUT = config("REPLAY_ASSIST_TIMEOUT", cast=int, default=3)
+# default of the parts without fallback: the replay fails if they don't complete in time
+__REQUIRED = object()
+
+
+def __run(started, f, kwargs):
+    started.append(time())
+    return f(**kwargs)
+
+
+def __submit(parts):
+    """Starts {name: (function, kwargs, timeout, default, executor)} concurrently, __gather returns their results"""
+    submitted = {}
+    for name, (f, kwargs, timeout, default, executor) in parts.items():
+        started = []
+        submitted[name] = (executor.submit(__run, started, f, kwargs), started, timeout, default)
+    return time(), submitted
+
+
+def __gather(submitted):
+    """Returns {name: result}.
+    A part with a default is given timeout seconds from its submission, then replaced by its default.
+    A required part is given timeout seconds from when it starts running, time spent waiting for a worker
+    doesn't count; if it runs longer the whole replay fails instead of returning it incomplete."""
+    start, futures = submitted
+    results = {}
+    for name, (future, started, timeout, default) in futures.items():
+        while True:
+            if default is not __REQUIRED:
+                wait = max(start + timeout - time(), 0)
+            else:
+                wait = max(started[0] + timeout - time(), 0) if started else timeout
+            try:
+                results[name] = future.result(timeout=wait)
+                break
+            except FutureTimeoutError:
+                if default is not __REQUIRED:
+                    logging.warning(f"!! replay part {name} timed out after {timeout}s")
+                    results[name] = default
+                    break
+                if not started or time() < started[0] + timeout:
+                    # still queued, or started while we were waiting
+                    continue
+                logging.warning(f"!! replay part {name} timed out after {timeout}s")
+                for f, _, _, _ in futures.values():
+                    f.cancel()
+                raise HTTPException(status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+                                    detail=f"session {name} could not be fetched in time")
+    return results
+
+
+def __db_part(f, **kwargs):
+    return f, kwargs, PART_TIMEOUT, __REQUIRED, __executor
+
 
 def __group_metadata(session, project_metadata):
     meta = {}
@@ -14,9 +87,8 @@ def __group_metadata(session, project_metadata):
     return meta
 
 
-# for backward compatibility
-def get_by_id2_pg(project_id, session_id, context: schemas.CurrentContext, full_data=False, include_fav_viewed=False,
-                  group_metadata=False, live=True):
+def __get_session(project_id, session_id, context: schemas.CurrentContext, include_fav_viewed=False,
+                  group_metadata=False):
     with pg_client.PostgresClient() as cur:
         extra_query = []
         if include_fav_viewed:
@@ -46,103 +118,111 @@ def get_by_id2_pg(project_id, session_id, context: schemas.CurrentContext, full_
         cur.execute(query=query)
 
         data = cur.fetchone()
-        if data is not None:
-            data = helper.dict_to_camel_case(data)
-            if full_data:
-                if data["platform"] == 'ios':
-                    data['events'] = events_ios.get_by_sessionId(project_id=project_id, session_id=session_id)
-                    for e in data['events']:
-                        if e["type"].endswith("_IOS"):
-                            e["type"] = e["type"][:-len("_IOS")]
-                    data['crashes'] = events_ios.get_crashes_by_session_id(session_id=session_id)
-                    data['userEvents'] = events_ios.get_customs_by_sessionId(project_id=project_id,
-                                                                             session_id=session_id)
-                    data['mobsUrl'] = sessions_mobs.get_ios(session_id=session_id)
-                else:
-                    data['events'] = events.get_by_session_id(project_id=project_id, session_id=session_id,
-                                                              group_clickrage=True)
-                    all_errors = events.get_errors_by_session_id(session_id=session_id, project_id=project_id)
-                    data['stackEvents'] = [e for e in all_errors if e['source'] != "js_exception"]
-                    # to keep only the first stack
-                    # limit the number of errors to reduce the response-body size
-                    data['errors'] = [errors_helper.format_first_stack_frame(e) for e in all_errors
-                                      if e['source'] == "js_exception"][:500]
-                    data['userEvents'] = events.get_customs_by_session_id(project_id=project_id,
-                                                                          session_id=session_id)
-                    data['domURL'] = sessions_mobs.get_urls(session_id=session_id, project_id=project_id,
-                                                            check_existence=False)
-                    data['mobsUrl'] = sessions_mobs.get_urls_depercated(session_id=session_id, check_existence=False)
-                    data['devtoolsURL'] = sessions_devtool.get_urls(session_id=session_id, project_id=project_id,
-                                                                    check_existence=False)
-                    data['resources'] = resources.get_by_session_id(session_id=session_id, project_id=project_id,
-                                                                    start_ts=data["startTs"], duration=data["duration"])
-
-                data['notes'] = sessions_notes.get_session_notes(tenant_id=context.tenant_id, project_id=project_id,
-                                                                 session_id=session_id, user_id=context.user_id)
-                data['metadata'] = __group_metadata(project_metadata=data.pop("projectMetadata"), session=data)
-                data['issues'] = issues.get_by_session_id(session_id=session_id, project_id=project_id)
-                data['live'] = live and assist.is_live(project_id=project_id, session_id=session_id,
-                                                       project_key=data["projectKey"])
-            data["inDB"] = True
-            return data
-        elif live:
-            return assist.get_live_session_by_id(project_id=project_id, session_id=session_id)
-        else:
-            return None
+    # the connection is released before fetching the other parts
+    if data is not None:
+        data = helper.dict_to_camel_case(data)
+    return data
+
+
+def __events_parts(project_id, session_id, platform, start_ts, duration):
+    if platform == 'ios':
+        return {"events": __db_part(events_ios.get_by_sessionId, project_id=project_id, session_id=session_id),
+                "crashes": __db_part(events_ios.get_crashes_by_session_id, session_id=session_id),
+                "userEvents": __db_part(events_ios.get_customs_by_sessionId, project_id=project_id,
+                                        session_id=session_id)}
+    return {"events": __db_part(events.get_by_session_id, project_id=project_id, session_id=session_id,
+                                group_clickrage=True),
+            "allErrors": __db_part(events.get_errors_by_session_id, session_id=session_id, project_id=project_id),
+            "userEvents": __db_part(events.get_customs_by_session_id, project_id=project_id, session_id=session_id),
+            "resources": __db_part(resources.get_by_session_id, session_id=session_id, project_id=project_id,
+                                   start_ts=start_ts, duration=duration)}
+
+
+def __set_events(data, parts, platform):
+    data['events'] = parts["events"]
+    data['userEvents'] = parts["userEvents"]
+    if platform == 'ios':
+        for e in data['events']:
+            if e["type"].endswith("_IOS"):
+                e["type"] = e["type"][:-len("_IOS")]
+        data['crashes'] = parts["crashes"]
+    else:
+        all_errors = parts["allErrors"]
+        data['stackEvents'] = [e for e in all_errors if e['source'] != "js_exception"]
+        # to keep only the first stack
+        # limit the number of errors to reduce the response-body size
+        data['errors'] = [errors_helper.format_first_stack_frame(e) for e in all_errors
+                          if e['source'] == "js_exception"][:500]
+        data['resources'] = parts["resources"]
+
+
+def __set_urls(data, project_id, session_id, context: schemas.CurrentContext):
+    if data["platform"] == 'ios':
+        data['mobsUrl'] = sessions_mobs.get_ios(session_id=session_id)
+    else:
+        data['domURL'] = sessions_mobs.get_urls(session_id=session_id, project_id=project_id,
+                                                check_existence=False)
+        data['mobsUrl'] = sessions_mobs.get_urls_depercated(session_id=session_id, check_existence=False)
+        data['devtoolsURL'] = sessions_devtool.get_urls(session_id=session_id, project_id=project_id,
+                                                        check_existence=False)
+
+
+def __live_part(project_id, session_id, project_key):
+    # a slow assist peer only costs ASSIST_TIMEOUT, the session is then reported as not live
+    return assist.is_live, {"project_id": project_id, "session_id": session_id, "project_key": project_key}, \
+        ASSIST_TIMEOUT, False, __assist_executor
+
+
+# for backward compatibility
+def get_by_id2_pg(project_id, session_id, context: schemas.CurrentContext, full_data=False, include_fav_viewed=False,
+                  group_metadata=False, live=True):
+    data = __get_session(project_id=project_id, session_id=session_id, context=context,
+                         include_fav_viewed=include_fav_viewed, group_metadata=group_metadata)
+    if data is not None:
+        if full_data:
+            parts = __events_parts(project_id=project_id, session_id=session_id, platform=data["platform"],
+                                   start_ts=data["startTs"], duration=data["duration"])
+            parts["notes"] = __db_part(sessions_notes.get_session_notes, tenant_id=context.tenant_id,
+                                       project_id=project_id, session_id=session_id, user_id=context.user_id)
+            parts["issues"] = __db_part(issues.get_by_session_id, session_id=session_id, project_id=project_id)
+            if live:
+                parts["live"] = __live_part(project_id=project_id, session_id=session_id,
+                                            project_key=data["projectKey"])
+            submitted = __submit(parts)
+            # the urls are signed while the parts are fetched
+            __set_urls(data=data, project_id=project_id, session_id=session_id, context=context)
+            parts = __gather(submitted)
+            __set_events(data=data, parts=parts, platform=data["platform"])
+            data['notes'] = parts["notes"]
+            data['metadata'] = __group_metadata(project_metadata=data.pop("projectMetadata"), session=data)
+            data['issues'] = parts["issues"]
+            data['live'] = live and parts["live"]
+        data["inDB"] = True
+        return data
+    elif live:
+        return assist.get_live_session_by_id(project_id=project_id, session_id=session_id)
+    else:
+        return None
 
 
 def get_replay(project_id, session_id, context: schemas.CurrentContext, full_data=False, include_fav_viewed=False,
                group_metadata=False, live=True):
-    with pg_client.PostgresClient() as cur:
-        extra_query = []
-        if include_fav_viewed:
-            extra_query.append("""COALESCE((SELECT TRUE
-                                 FROM public.user_favorite_sessions AS fs
-                                 WHERE s.session_id = fs.session_id
-                                   AND fs.user_id = %(userId)s), FALSE) AS favorite""")
-            extra_query.append("""COALESCE((SELECT TRUE
-                                 FROM public.user_viewed_sessions AS fs
-                                 WHERE s.session_id = fs.session_id
-                                   AND fs.user_id = %(userId)s), FALSE) AS viewed""")
-        query = cur.mogrify(
-            f"""\
-            SELECT
-                s.*,
-                s.session_id::text AS session_id,
-                (SELECT project_key FROM public.projects WHERE project_id = %(project_id)s LIMIT 1) AS project_key
-                {"," if len(extra_query) > 0 else ""}{",".join(extra_query)}
-                {(",json_build_object(" + ",".join([f"'{m}',p.{m}" for m in metadata.column_names()]) + ") AS project_metadata") if group_metadata else ''}
-            FROM public.sessions AS s {"INNER JOIN public.projects AS p USING (project_id)" if group_metadata else ""}
-            WHERE s.project_id = %(project_id)s
-                AND s.session_id = %(session_id)s;""",
-            {"project_id": project_id, "session_id": session_id, "userId": context.user_id}
-        )
-        # print("===============")
-        # print(query)
-        cur.execute(query=query)
-
-        data = cur.fetchone()
-        if data is not None:
-            data = helper.dict_to_camel_case(data)
-            if full_data:
-                if data["platform"] == 'ios':
-                    data['mobsUrl'] = sessions_mobs.get_ios(session_id=session_id)
-                else:
-                    data['domURL'] = sessions_mobs.get_urls(session_id=session_id, project_id=project_id,
-                                                            check_existence=False)
-                    data['mobsUrl'] = sessions_mobs.get_urls_depercated(session_id=session_id, check_existence=False)
-                    data['devtoolsURL'] = sessions_devtool.get_urls(session_id=session_id, project_id=project_id,
-                                                                    check_existence=False)
-
-                data['metadata'] = __group_metadata(project_metadata=data.pop("projectMetadata"), session=data)
-                data['live'] = live and assist.is_live(project_id=project_id, session_id=session_id,
-                                                       project_key=data["projectKey"])
-            data["inDB"] = True
-            return data
-        elif live:
-            return assist.get_live_session_by_id(project_id=project_id, session_id=session_id)
-        else:
-            return None
+    data = __get_session(project_id=project_id, session_id=session_id, context=context,
+                         include_fav_viewed=include_fav_viewed, group_metadata=group_metadata)
+    if data is not None:
+        if full_data:
+            # the assist call runs while the urls are signed
+            submitted = __submit({"live": __live_part(project_id=project_id, session_id=session_id,
+                                                      project_key=data["projectKey"])} if live else {})
+            __set_urls(data=data, project_id=project_id, session_id=session_id, context=context)
+            data['metadata'] = __group_metadata(project_metadata=data.pop("projectMetadata"), session=data)
+            data['live'] = live and __gather(submitted)["live"]
+        data["inDB"] = True
+        return data
+    elif live:
+        return assist.get_live_session_by_id(project_id=project_id, session_id=session_id)
+    else:
+        return None
 
 
 def get_events(project_id, session_id):
@@ -159,36 +239,18 @@ def get_events(project_id, session_id):
         cur.execute(query=query)
 
         s_data = cur.fetchone()
-        if s_data is not None:
-            s_data = helper.dict_to_camel_case(s_data)
-            data = {}
-            if s_data["platform"] == 'ios':
-                data['events'] = events_ios.get_by_sessionId(project_id=project_id, session_id=session_id)
-                for e in data['events']:
-                    if e["type"].endswith("_IOS"):
-                        e["type"] = e["type"][:-len("_IOS")]
-                data['crashes'] = events_ios.get_crashes_by_session_id(session_id=session_id)
-                data['userEvents'] = events_ios.get_customs_by_sessionId(project_id=project_id,
-                                                                         session_id=session_id)
-            else:
-                data['events'] = events.get_by_session_id(project_id=project_id, session_id=session_id,
-                                                          group_clickrage=True)
-                all_errors = events.get_errors_by_session_id(session_id=session_id, project_id=project_id)
-                data['stackEvents'] = [e for e in all_errors if e['source'] != "js_exception"]
-                # to keep only the first stack
-                # limit the number of errors to reduce the response-body size
-                data['errors'] = [errors_helper.format_first_stack_frame(e) for e in all_errors
-                                  if e['source'] == "js_exception"][:500]
-                data['userEvents'] = events.get_customs_by_session_id(project_id=project_id,
-                                                                      session_id=session_id)
-                data['resources'] = resources.get_by_session_id(session_id=session_id, project_id=project_id,
-                                                                start_ts=s_data["startTs"], duration=s_data["duration"])
-
-            data['issues'] = issues.get_by_session_id(session_id=session_id, project_id=project_id)
-            data['issues'] = reduce_issues(data['issues'])
-            return data
-        else:
-            return None
+    if s_data is not None:
+        s_data = helper.dict_to_camel_case(s_data)
+        data = {}
+        parts = __events_parts(project_id=project_id, session_id=session_id, platform=s_data["platform"],
+                               start_ts=s_data["startTs"], duration=s_data["duration"])
+        parts["issues"] = __db_part(issues.get_by_session_id, session_id=session_id, project_id=project_id)
+        parts = __gather(__submit(parts))
+        __set_events(data=data, parts=parts, platform=s_data["platform"])
+        data['issues'] = reduce_issues(parts["issues"])
+        return data
+    else:
+        return None
 
 
 # To reduce the number of issues in the replay;
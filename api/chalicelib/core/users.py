@@ -11,6 +11,12 @@ from chalicelib.utils import email_helper
 from chalicelib.utils import helper
 from chalicelib.utils import pg_client
 from chalicelib.utils.TimeUTC import TimeUTC
+from chalicelib.utils.ttl_cache import TTLCache
+
+
+# Users of the valid tokens by (userId, tenantId, iat, aud), saves the auth queries of JWTAuth
+__auth_cache = TTLCache(max_size=config("AUTH_CACHE_SIZE", cast=int, default=10000),
+                        ttl=config("AUTH_CACHE_TTL", cast=int, default=30))
 
 
 def __generate_invitation_token():
@@ -83,8 +89,8 @@ def restore_member(user_id, email, invitation_token, admin, name, owner=False):
         cur.execute(query)
         result["invitation_token"] = cur.fetchone()["invitation_token"]
         result["created_at"] = TimeUTC.datetime_to_timestamp(result["created_at"])
-
-        return helper.dict_to_camel_case(result)
+    invalidate_auth_cache(user_id)
+    return helper.dict_to_camel_case(result)
 
 
 def generate_new_invitation(user_id):
@@ -167,6 +173,7 @@ def update(tenant_id, user_id, changes, output=True):
                                 (CASE WHEN users.role = 'member' THEN TRUE ELSE FALSE END) AS member;""",
                             {"user_id": user_id, **changes})
             )
+    invalidate_auth_cache(user_id)
     if not output:
         return None
     return get(user_id=user_id, tenant_id=tenant_id)
@@ -460,6 +467,7 @@ def delete_member(user_id, tenant_id, id_to_delete):
                            SET password= NULL
                            WHERE user_id=%(user_id)s;""",
                         {"user_id": id_to_delete}))
+    invalidate_auth_cache(id_to_delete)
     return {"data": get_members(tenant_id=tenant_id)}
 
 
@@ -578,6 +586,27 @@ def auth_exists(user_id, tenant_id, jwt_iat, jwt_aud):
              )
 
 
+def get_auth_context(user_id, tenant_id, jwt_iat, jwt_aud):
+    """Returns the user of a valid token or None, valid tokens are cached for AUTH_CACHE_TTL seconds"""
+    key = (user_id, tenant_id, jwt_iat, jwt_aud)
+    user = __auth_cache.get(key)
+    if user is None:
+        if not auth_exists(user_id=user_id, tenant_id=tenant_id, jwt_iat=jwt_iat, jwt_aud=jwt_aud):
+            return None
+        user = get(user_id=user_id, tenant_id=tenant_id)
+        if user is not None:
+            __auth_cache.set(key, user)
+    return user
+
+
+def invalidate_auth_cache(user_id=None):
+    """Forgets the cached tokens of user_id, or of all the users"""
+    if user_id is None:
+        __auth_cache.clear()
+    else:
+        __auth_cache.delete_where(lambda key: key[0] == user_id)
+
+
 def change_jwt_iat(user_id):
     with pg_client.PostgresClient() as cur:
         query = cur.mogrify(
@@ -587,7 +616,9 @@ def change_jwt_iat(user_id):
                        RETURNING jwt_iat;""",
             {"user_id": user_id})
         cur.execute(query)
-        return cur.fetchone().get("jwt_iat")
+        jwt_iat = cur.fetchone().get("jwt_iat")
+    invalidate_auth_cache(user_id)
+    return jwt_iat
 
 
 def authenticate(email, password, for_change_password=False):
@@ -0,0 +1,112 @@
+import logging
+
+import psycopg
+from decouple import config
+from psycopg import AsyncClientCursor
+from psycopg.rows import dict_row
+from psycopg_pool import AsyncConnectionPool
+
+from chalicelib.utils.pg_client import _PG_CONFIG
+
+logging.getLogger('psycopg.pool').setLevel(config("LOGLEVEL", default=logging.INFO))
+
+# psycopg3 uses the libpq parameter names
+_ASYNC_PG_CONFIG = {**{k: v for k, v in _PG_CONFIG.items() if k != "database"}, "dbname": _PG_CONFIG["database"]}
+ASYNC_PG_CONFIG = dict(_ASYNC_PG_CONFIG)
+if config("PG_TIMEOUT", cast=int, default=0) > 0:
+    ASYNC_PG_CONFIG["options"] = f"-c statement_timeout={config('PG_TIMEOUT', cast=int) * 1000}"
+
+
+class ORAsyncCursor(AsyncClientCursor):
+    """Client-side binding cursor: mogrify() and the %(name)s placeholders work as with psycopg2"""
+
+    async def execute(self, query, params=None, **kwargs):
+        try:
+            return await super().execute(query, params, **kwargs)
+        except psycopg.Error as error:
+            logging.error(f"!!! Error of type:{type(error)} while executing query:")
+            logging.error(query)
+            raise error
+
+
+_CONNECTION_KWARGS = {"cursor_factory": ORAsyncCursor, "row_factory": dict_row}
+
+postgreSQL_pool: AsyncConnectionPool = None
+
+
+class AsyncPostgresClient:
+    """asyncio counterpart of PostgresClient, the rows are dicts:
+        async with AsyncPostgresClient() as cur:
+            await cur.execute(cur.mogrify("SELECT ... WHERE project_id = %(project_id)s", {"project_id": 1}))
+            rows = await cur.fetchall()
+    The transaction is committed on exit, or rolled back if the block raised."""
+    connection = None
+    cursor = None
+
+    def __init__(self, long_query=False, unlimited_query=False, use_pool=True):
+        self.long_query = long_query
+        self.unlimited_query = unlimited_query
+        self.use_pool = use_pool and not long_query and not unlimited_query \
+                        and config('PG_POOL', cast=bool, default=True)
+        self.__pool_connection = None
+
+    async def __aenter__(self):
+        if self.use_pool:
+            self.__pool_connection = postgreSQL_pool.connection()
+            self.connection = await self.__pool_connection.__aenter__()
+        else:
+            single_config = dict(_ASYNC_PG_CONFIG)
+            if self.unlimited_query:
+                single_config["application_name"] += "-UNLIMITED"
+            elif self.long_query:
+                single_config["application_name"] += "-LONG"
+                single_config["options"] = f"-c statement_timeout=" \
+                                           f"{config('pg_long_timeout', cast=int, default=5 * 60) * 1000}"
+            else:
+                single_config["application_name"] += "-NOPOOL"
+                single_config["options"] = f"-c statement_timeout=" \
+                                           f"{config('PG_TIMEOUT', cast=int, default=30) * 1000}"
+            self.connection = await psycopg.AsyncConnection.connect(**single_config, **_CONNECTION_KWARGS)
+        self.cursor = self.connection.cursor()
+        return self.cursor
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        try:
+            await self.cursor.close()
+        finally:
+            if self.use_pool:
+                # The pool commits, or rolls back on error, before taking the connection back
+                await self.__pool_connection.__aexit__(exc_type, exc_val, exc_tb)
+            else:
+                try:
+                    if exc_type is None:
+                        await self.connection.commit()
+                    else:
+                        await self.connection.rollback()
+                finally:
+                    await self.connection.close()
+
+
+async def init():
+    global postgreSQL_pool
+    if config('PG_POOL', cast=bool, default=True):
+        # Sized on its own: it comes on top of the sync pool in every process, against the same max_connections
+        postgreSQL_pool = AsyncConnectionPool(conninfo="", kwargs={**ASYNC_PG_CONFIG, **_CONNECTION_KWARGS},
+                                              min_size=config("PG_ASYNC_MINCONN", cast=int, default=1),
+                                              max_size=config("PG_ASYNC_MAXCONN", cast=int, default=10),
+                                              max_waiting=config("PG_ASYNC_MAX_WAITING", cast=int, default=0),
+                                              timeout=config("PG_ASYNC_POOL_TIMEOUT", cast=int, default=30),
+                                              open=False)
+        await postgreSQL_pool.open()
+        logging.info("Async connection pool created successfully")
+
+
+async def terminate():
+    global postgreSQL_pool
+    if postgreSQL_pool is not None:
+        try:
+            await postgreSQL_pool.close()
+            logging.info("Closed all async connexions to PostgreSQL")
+        except Exception as error:
+            logging.error("Error while closing all async connexions to PostgreSQL", error)
+        postgreSQL_pool = None
@@ -0,0 +1,44 @@
+from collections import OrderedDict
+from threading import Lock
+from time import monotonic
+
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries expire ttl seconds after being set"""
+
+    def __init__(self, max_size: int, ttl: float):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.__data = OrderedDict()
+        self.__lock = Lock()
+
+    def get(self, key):
+        with self.__lock:
+            item = self.__data.get(key)
+            if item is None:
+                return None
+            value, expires_at = item
+            if expires_at <= monotonic():
+                del self.__data[key]
+                return None
+            self.__data.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        if self.max_size <= 0 or self.ttl <= 0:
+            return
+        with self.__lock:
+            self.__data[key] = (value, monotonic() + self.ttl)
+            self.__data.move_to_end(key)
+            while len(self.__data) > self.max_size:
+                self.__data.popitem(last=False)
+
+    def delete_where(self, predicate):
+        """Removes the entries whose key matches predicate(key)"""
+        with self.__lock:
+            for key in [k for k in self.__data if predicate(k)]:
+                del self.__data[key]
+
+    def clear(self):
+        with self.__lock:
+            self.__data.clear()
@@ -0,0 +1,101 @@
+"""
+Load test of the API under mixed dashboard and replay traffic, reports the latency percentiles per route.
+usage:
+    python load_test.py --url http://localhost:8000 --jwt <token> --project-id 1 --session-id 123 \
+        --dashboard-id 1 --concurrency 50 --duration 60
+"""
+import argparse
+import random
+import statistics
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from threading import local
+
+import requests
+
+_local = local()
+
+
+def _session(jwt):
+    if not hasattr(_local, "session"):
+        _local.session = requests.Session()
+        _local.session.headers["Authorization"] = f"Bearer {jwt}"
+    return _local.session
+
+
+def get_scenarios(args):
+    """(weight, name, method, path, body) of the requests sent, dashboard and replay traffic mixed"""
+    p = args.project_id
+    return [
+        (3, "dashboards", "GET", f"/{p}/dashboards", None),
+        (3, "dashboard", "GET", f"/{p}/dashboards/{args.dashboard_id}", None),
+        (2, "dashboard_metrics", "POST", f"/{p}/dashboards/{args.dashboard_id}/metrics",
+         {"startTimestamp": int(time.time() - 7 * 24 * 3600) * 1000, "endTimestamp": int(time.time()) * 1000}),
+        (3, "session", "GET", f"/{p}/sessions/{args.session_id}", None),
+        (3, "replay", "GET", f"/{p}/sessions/{args.session_id}/replay", None),
+        (2, "replay_events", "GET", f"/{p}/sessions/{args.session_id}/events", None),
+        (1, "sessions_search", "POST", f"/{p}/sessions/search",
+         {"startDate": int(time.time() - 7 * 24 * 3600) * 1000, "endDate": int(time.time()) * 1000,
+          "filters": [], "events": [], "limit": 10, "page": 1}),
+    ]
+
+
+def run_client(args, scenarios, deadline):
+    latencies = defaultdict(list)
+    errors = defaultdict(int)
+    weights = [s[0] for s in scenarios]
+    session = _session(args.jwt)
+    while time.time() < deadline:
+        _, name, method, path, body = random.choices(scenarios, weights=weights)[0]
+        start = time.perf_counter()
+        try:
+            r = session.request(method, args.url + path, json=body, timeout=args.timeout)
+            if r.status_code >= 500:
+                errors[name] += 1
+        except requests.RequestException:
+            errors[name] += 1
+        latencies[name].append((time.perf_counter() - start) * 1000)
+    return latencies, errors
+
+
+def percentile(values, p):
+    values = sorted(values)
+    return values[min(int(len(values) * p / 100), len(values) - 1)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mixed dashboard and replay load against the API.")
+    parser.add_argument("--url", default="http://localhost:8000")
+    parser.add_argument("--jwt", required=True)
+    parser.add_argument("--project-id", type=int, required=True)
+    parser.add_argument("--session-id", required=True)
+    parser.add_argument("--dashboard-id", type=int, required=True)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--duration", type=int, default=60, help="seconds")
+    parser.add_argument("--timeout", type=int, default=60, help="seconds per request")
+    args = parser.parse_args()
+
+    scenarios = get_scenarios(args)
+    deadline = time.time() + args.duration
+    with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+        results = list(executor.map(lambda _: run_client(args, scenarios, deadline), range(args.concurrency)))
+
+    latencies = defaultdict(list)
+    errors = defaultdict(int)
+    for l, e in results:
+        for name, values in l.items():
+            latencies[name] += values
+        for name, count in e.items():
+            errors[name] += count
+    latencies["ALL"] = [v for name in list(latencies) for v in latencies[name]]
+    errors["ALL"] = sum(errors.values())
+
+    print(f"{'route':<20}{'requests':>10}{'errors':>8}{'rps':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    for name, values in sorted(latencies.items(), key=lambda x: x[0] == "ALL"):
+        print(f"{name:<20}{len(values):>10}{errors[name]:>8}{len(values) / args.duration:>8.1f}"
+              f"{statistics.median(values):>10.1f}{percentile(values, 95):>10.1f}{percentile(values, 99):>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,14 @@
-import json
+import asyncio
+import functools
 from typing import Callable
 
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import ORJSONResponse
 from fastapi.routing import APIRoute
 from starlette import status
 from starlette.exceptions import HTTPException
 from starlette.requests import Request
-from starlette.responses import Response, JSONResponse
+from starlette.responses import Response
 
 import schemas
 
@@ -17,7 +20,39 @@ async def OR_context(request: Request) -> schemas.CurrentContext:
         raise Exception("currentContext not found")
 
 
+def errors_response(result):
+    """Turns the {"errors": [...]} results of chalicelib into 404 (not found) or 400 responses,
+    the other results are returned untouched to be serialized by the route"""
+    if isinstance(result, dict) and result.get("errors") is not None:
+        errors = result["errors"]
+        not_found = len(errors) > 0 and isinstance(errors[0], str) and "not found" in errors[0]
+        return ORJSONResponse(content=jsonable_encoder(result),
+                              status_code=status.HTTP_404_NOT_FOUND if not_found else status.HTTP_400_BAD_REQUEST)
+    return result
+
+
+def map_errors(endpoint: Callable) -> Callable:
+    # The error check is done on the value returned by the endpoint, before serialization, so the
+    # response body is never parsed back. Sync endpoints stay sync to keep running in the threadpool.
+    if getattr(endpoint, "maps_errors", False):
+        # routes are re-created with their (wrapped) endpoint when a router is included
+        return endpoint
+    if asyncio.iscoroutinefunction(endpoint):
+        @functools.wraps(endpoint)
+        async def wrapper(*args, **kwargs):
+            return errors_response(await endpoint(*args, **kwargs))
+    else:
+        @functools.wraps(endpoint)
+        def wrapper(*args, **kwargs):
+            return errors_response(endpoint(*args, **kwargs))
+    wrapper.maps_errors = True
+    return wrapper
+
+
 class ORRoute(APIRoute):
+    def __init__(self, path: str, endpoint: Callable, **kwargs):
+        super().__init__(path, map_errors(endpoint), **kwargs)
+
     def get_route_handler(self) -> Callable:
         original_route_handler = super().get_route_handler()
 
@@ -26,20 +61,9 @@ class ORRoute(APIRoute):
                 response: Response = await original_route_handler(request)
             except HTTPException as e:
                 if e.status_code // 100 == 4:
-                    return JSONResponse(content={"errors": [e.detail]}, status_code=e.status_code)
+                    return ORJSONResponse(content={"errors": [e.detail]}, status_code=e.status_code)
                 else:
                     raise e
-
-            if isinstance(response, JSONResponse):
-                response: JSONResponse = response
-                body = json.loads(response.body.decode('utf8'))
-                if response.status_code == 200 \
-                        and body is not None and isinstance(body, dict) \
-                        and body.get("errors") is not None:
-                    if "not found" in body["errors"][0]:
-                        response.status_code = status.HTTP_404_NOT_FOUND
-                    else:
-                        response.status_code = status.HTTP_400_BAD_REQUEST
             return response
 
         return custom_route_handler
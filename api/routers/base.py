@@ -1,4 +1,5 @@
 from fastapi import APIRouter, Depends
+from fastapi.responses import ORJSONResponse
 
 from auth.auth_apikey import APIKeyAuth
 from auth.auth_jwt import JWTAuth
@@ -7,10 +8,10 @@ from or_dependencies import ORRoute
 
 
 def get_routers(extra_dependencies=[]) -> (APIRouter, APIRouter, APIRouter):
-    public_app = APIRouter(route_class=ORRoute)
+    public_app = APIRouter(route_class=ORRoute, default_response_class=ORJSONResponse)
     app = APIRouter(dependencies=[Depends(JWTAuth()), Depends(ProjectAuthorizer("projectId"))] + extra_dependencies,
-                    route_class=ORRoute)
+                    route_class=ORRoute, default_response_class=ORJSONResponse)
     app_apikey = APIRouter(
         dependencies=[Depends(APIKeyAuth()), Depends(ProjectAuthorizer("projectKey"))] + extra_dependencies,
-        route_class=ORRoute)
+        route_class=ORRoute, default_response_class=ORJSONResponse)
     return public_app, app, app_apikey
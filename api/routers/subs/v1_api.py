@@ -9,7 +9,7 @@ public_app, app, app_apikey = get_routers()
 
 
 @app_apikey.get('/v1/{projectKey}/users/{userId}/sessions', tags=["api"])
-async def get_user_sessions(projectKey: str, userId: str, start_date: int = None, end_date: int = None):
+def get_user_sessions(projectKey: str, userId: str, start_date: int = None, end_date: int = None):
     projectId = projects.get_internal_project_id(projectKey)
     if projectId is None:
         return {"errors": ["invalid projectKey"]}
@@ -24,7 +24,7 @@ async def get_user_sessions(projectKey: str, userId: str, start_date: int = None
 
 
 @app_apikey.get('/v1/{projectKey}/sessions/{sessionId}/events', tags=["api"])
-async def get_session_events(projectKey: str, sessionId: int):
+def get_session_events(projectKey: str, sessionId: int):
     projectId = projects.get_internal_project_id(projectKey)
     if projectId is None:
         return {"errors": ["invalid projectKey"]}
@@ -37,7 +37,7 @@ async def get_session_events(projectKey: str, sessionId: int):
 
 
 @app_apikey.get('/v1/{projectKey}/users/{userId}', tags=["api"])
-async def get_user_details(projectKey: str, userId: str):
+def get_user_details(projectKey: str, userId: str):
     projectId = projects.get_internal_project_id(projectKey)
     if projectId is None:
         return {"errors": ["invalid projectKey"]}
@@ -50,7 +50,7 @@ async def get_user_details(projectKey: str, userId: str):
 
 
 @app_apikey.delete('/v1/{projectKey}/users/{userId}', tags=["api"])
-async def schedule_to_delete_user_data(projectKey: str, userId: str, _=Body(None)):
+def schedule_to_delete_user_data(projectKey: str, userId: str, _=Body(None)):
     projectId = projects.get_internal_project_id(projectKey)
     if projectId is None:
         return {"errors": ["invalid projectKey"]}
@@ -59,7 +59,7 @@ async def schedule_to_delete_user_data(projectKey: str, userId: str, _=Body(None
 
 
 @app_apikey.get('/v1/{projectKey}/jobs', tags=["api"])
-async def get_jobs(projectKey: str):
+def get_jobs(projectKey: str):
     projectId = projects.get_internal_project_id(projectKey)
     if projectId is None:
         return {"errors": ["invalid projectKey"]}
@@ -67,12 +67,12 @@ async def get_jobs(projectKey: str):
 
 
 @app_apikey.get('/v1/{projectKey}/jobs/{jobId}', tags=["api"])
-async def get_job(projectKey: str, jobId: int):
+def get_job(projectKey: str, jobId: int):
     return {"data": jobs.get(job_id=jobId)}
 
 
 @app_apikey.delete('/v1/{projectKey}/jobs/{jobId}', tags=["api"])
-async def cancel_job(projectKey: str, jobId: int, _=Body(None)):
+def cancel_job(projectKey: str, jobId: int, _=Body(None)):
     job = jobs.get(job_id=jobId)
     job_not_found = len(job.keys()) == 0
 
@@ -86,7 +86,7 @@ async def cancel_job(projectKey: str, jobId: int, _=Body(None)):
 
 
 @app_apikey.get('/v1/projects', tags=["api"])
-async def get_projects(context: schemas.CurrentContext = Depends(OR_context)):
+def get_projects(context: schemas.CurrentContext = Depends(OR_context)):
     records = projects.get_projects(tenant_id=context.tenant_id)
     for record in records:
         del record['projectId']
@@ -95,15 +95,15 @@ async def get_projects(context: schemas.CurrentContext = Depends(OR_context)):
 
 
 @app_apikey.get('/v1/projects/{projectKey}', tags=["api"])
-async def get_project(projectKey: str, context: schemas.CurrentContext = Depends(OR_context)):
+def get_project(projectKey: str, context: schemas.CurrentContext = Depends(OR_context)):
     return {
         "data": projects.get_project_by_key(tenant_id=context.tenant_id, project_key=projectKey)
     }
 
 
 @app_apikey.post('/v1/projects', tags=["api"])
-async def create_project(data: schemas.CreateProjectSchema = Body(...),
-                         context: schemas.CurrentContext = Depends(OR_context)):
+def create_project(data: schemas.CreateProjectSchema = Body(...),
+                   context: schemas.CurrentContext = Depends(OR_context)):
     record = projects.create(
         tenant_id=context.tenant_id,
         user_id=None,
@@ -2,6 +2,7 @@ import logging
 import queue
 from contextlib import asynccontextmanager
 
+from anyio import to_thread
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from decouple import config
 from fastapi import FastAPI, Request
@@ -13,7 +14,7 @@ from starlette.responses import StreamingResponse, JSONResponse
 from chalicelib.core import traces
 from chalicelib.utils import events_queue
 from chalicelib.utils import helper
-from chalicelib.utils import pg_client
+from chalicelib.utils import pg_client, pg_client_async
 from routers import core, core_dynamic, ee, saml
 from crons import core_crons, ee_crons, core_dynamic_crons
 from routers.subs import insights, metrics, v1_api_ee
@@ -31,9 +32,12 @@ async def lifespan(app: FastAPI):
     ap_logger = logging.getLogger('apscheduler')
     ap_logger.setLevel(loglevel)
 
+    # Sync routes run in anyio's threadpool, its size bounds the concurrent blocking (DB/HTTP) calls
+    to_thread.current_default_thread_limiter().total_tokens = config("API_THREADS", cast=int, default=40)
     app.schedule = AsyncIOScheduler()
     app.queue_system = queue.Queue()
     await pg_client.init()
+    await pg_client_async.init()
     await events_queue.init()
     app.schedule.start()
 
@@ -52,6 +56,7 @@ async def lifespan(app: FastAPI):
     app.schedule.shutdown(wait=True)
     await traces.process_traces_queue()
     await events_queue.terminate()
+    await pg_client_async.terminate()
     await pg_client.terminate()
 
 
@@ -58,6 +58,8 @@ rm -rf ./chalicelib/utils/helper.py
 rm -rf ./chalicelib/utils/jira_client.py
 rm -rf ./chalicelib/utils/metrics_helper.py
 rm -rf ./chalicelib/utils/pg_client.py
+rm -rf ./chalicelib/utils/pg_client_async.py
+rm -rf ./chalicelib/utils/ttl_cache.py
 rm -rf ./chalicelib/utils/s3.py
 rm -rf ./chalicelib/utils/smtp.py
 rm -rf ./chalicelib/utils/sql_helper.py
@@ -10,6 +10,7 @@ from decouple import config
 from onelogin.saml2.auth import OneLogin_Saml2_Logout_Request
 
 from chalicelib.core import users, tenants, roles
+from starlette.concurrency import run_in_threadpool
 from starlette.responses import RedirectResponse
 
 
@@ -27,6 +28,10 @@ async def start_sso(request: Request):
 @public_app.post('/sso/saml2/acs/', tags=["saml2"])
 async def process_sso_assertion(request: Request):
     req = await prepare_request(request=request)
+    return await run_in_threadpool(__process_sso_assertion, req)
+
+
+def __process_sso_assertion(req):
     session = req["cookie"]["session"]
     auth = init_saml_auth(req)
 
@@ -114,6 +119,10 @@ async def process_sso_assertion(request: Request):
 @public_app.post('/sso/saml2/acs/{tenantKey}/', tags=["saml2"])
 async def process_sso_assertion_tk(tenantKey: str, request: Request):
     req = await prepare_request(request=request)
+    return await run_in_threadpool(__process_sso_assertion_tk, tenantKey, req)
+
+
+def __process_sso_assertion_tk(tenantKey, req):
     session = req["cookie"]["session"]
     auth = init_saml_auth(req)
 
@@ -197,6 +206,10 @@ async def process_sso_assertion_tk(tenantKey: str, request: Request):
 @public_app.get('/sso/saml2/sls/', tags=["saml2"])
 async def process_sls_assertion(request: Request):
     req = await prepare_request(request=request)
+    return await run_in_threadpool(__process_sls_assertion, req)
+
+
+def __process_sls_assertion(req):
     session = req["cookie"]["session"]
     auth = init_saml_auth(req)
     request_id = None
@@ -10,13 +10,13 @@ public_app, app, app_apikey = get_routers()
 
 
 @app.get('/healthz', tags=["health-check"])
-async def get_global_health_status(context: schemas.CurrentContext = Depends(OR_context)):
+def get_global_health_status(context: schemas.CurrentContext = Depends(OR_context)):
     return {"data": health.get_health(tenant_id=context.tenant_id)}
 
 
 if not tenants.tenants_exists(use_pool=False):
     @public_app.get('/health', tags=["health-check"])
-    async def get_public_health_status():
+    def get_public_health_status():
         if tenants.tenants_exists():
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Not Found")
 
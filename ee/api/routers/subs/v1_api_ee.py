@@ -11,7 +11,7 @@ public_app, app, app_apikey = get_routers()
 
 
 @app_apikey.get('/v1/assist/credentials', tags=["api"])
-async def get_assist_credentials():
+def get_assist_credentials():
     credentials = assist_helper.get_temporary_credentials()
     if "errors" in credentials:
         return credentials
@@ -19,17 +19,17 @@ async def get_assist_credentials():
 
 
 @app_apikey.get('/v1/{projectKey}/assist/sessions', tags=["api"])
-async def get_sessions_live(projectKey: str, userId: str = None, context: schemas.CurrentContext = Depends(OR_context)):
+def get_sessions_live(projectKey: str, userId: str = None, context: schemas.CurrentContext = Depends(OR_context)):
     projectId = projects.get_internal_project_id(projectKey)
     if projectId is None:
         return {"errors": ["invalid projectKey"]}
-    return await core.get_sessions_live(projectId=projectId, userId=userId, context=context)
+    return core.get_sessions_live(projectId=projectId, userId=userId, context=context)
 
 
 @app_apikey.post('/v1/{projectKey}/assist/sessions', tags=["api"])
-async def sessions_live(projectKey: str, data: schemas.LiveSessionsSearchPayloadSchema = Body(...),
-                        context: schemas.CurrentContext = Depends(OR_context)):
+def sessions_live(projectKey: str, data: schemas.LiveSessionsSearchPayloadSchema = Body(...),
+                  context: schemas.CurrentContext = Depends(OR_context)):
     projectId = projects.get_internal_project_id(projectKey)
     if projectId is None:
         return {"errors": ["invalid projectKey"]}
-    return await core.sessions_live(projectId=projectId, data=data, context=context)
+    return core.sessions_live(projectId=projectId, data=data, context=context)
@@ -14,8 +14,11 @@ print('[INFO] Importing from models..')
 from db.models import events_detailed_table_name, events_table_name, sessions_table_name
 print('[INFO] Importing from writer..')
 from db.writer import insert_batch
+from db.utils import ColumnBatch
 print('[INFO] Importing from handler..')
-from handler import handle_message, handle_normal_message, handle_session
+from handler import handle_message, handle_normal_message, handle_session, interest_set
+from utils.consumer_metrics import ConsumerMetrics, consume_batch
+from utils.snapshot import SessionsSnapshot, PartitionsState
 
 DATABASE = config('DATABASE_NAME')
 LEVEL = config('LEVEL')
@@ -33,11 +36,11 @@ elif LEVEL == 'normal':
 def main():
     batch_size = config('events_batch_size', default=4000, cast=int)
     sessions_batch_size = config('sessions_batch_size', default=400, cast=int)
-    batch = []
+    batch = ColumnBatch(LEVEL)
     sessions = defaultdict(lambda: None)
     sessions_batch = []
 
-    codec = MessageCodec()
+    codec = MessageCodec(interest_set(LEVEL), lazy_strings=True)
     ssl_protocol = config('SSL_ENABLED', default=True, cast=bool)
     consumer_settings = {
         "bootstrap.servers": config('KAFKA_SERVER'),
@@ -49,69 +52,97 @@ def main():
         consumer_settings['security.protocol'] = 'SSL'
     consumer = Consumer(consumer_settings)
 
-    consumer.subscribe([config("topic", default="saas-raw")])
+    # Open sessions of each assigned partition are restored from its snapshot, which is saved with every commit
+    snapshot_path = config('sessions_snapshot', default='')
+    state = PartitionsState(sessions, snapshot=SessionsSnapshot(snapshot_path) if snapshot_path else None)
+
+    def flush():
+        """Write the sessions and events batches, then save the snapshot and commit the offsets they hold"""
+        nonlocal batch, sessions_batch
+        if not attempt_session_insert(sessions_batch):
+            raise IOError('Sessions could not be written, stopping before committing their offsets')
+        for s in sessions_batch:
+            sessions.pop(s.sessionid, None)
+        sessions_batch = []
+        if len(batch) > 0 and not attempt_batch_insert(batch):
+            raise IOError('Events could not be written, stopping before committing their offsets')
+        batch = ColumnBatch(LEVEL)
+        # Offsets of the fully processed records, consumer.commit() would also commit the rest of the consumed batch
+        state.commit(consumer, *state.dump())
+
+    def on_revoke(consumer, partitions):
+        # Records of the revoked partitions still in the batches are written and committed while they are ours
+        flush()
+        state.drop(partitions)
+
+    consumer.subscribe([config("topic", default="saas-raw")], on_assign=state.on_assign, on_revoke=on_revoke)
     print("Kafka consumer subscribed")
+    # consume_batch_size records are read at once, waiting at most consume_max_wait seconds
+    consume_batch_size = config('consume_batch_size', default=500, cast=int)
+    consume_max_wait = config('consume_max_wait', default=1.0, cast=float)
+    metrics = ConsumerMetrics(consumer)
     t_ = time()
     while True:
-        msg = consumer.poll(1.0)
-        if msg is None:
-            continue
-        #value = json.loads(msg.value().decode('utf-8'))
-        messages = codec.decode_detailed(msg.value())
-        session_id = codec.decode_key(msg.key())
-        if messages is None:
-            print('-')
-            continue
-
-        for message in messages:
-            if LEVEL == 'detailed':
-                n = handle_message(message)
-            elif LEVEL == 'normal':
-                n = handle_normal_message(message)
-
-            #session_id = codec.decode_key(msg.key)
-            sessions[session_id] = handle_session(sessions[session_id], message)
-            if sessions[session_id]:
-                sessions[session_id].sessionid = session_id
-
-            # put in a batch for insertion if received a SessionEnd
-            if isinstance(message, SessionEnd):
-                if sessions[session_id]:
-                    sessions_batch.append(sessions[session_id])
-
-            # try to insert sessions
-            if len(sessions_batch) >= sessions_batch_size:
-                t2 = time()
-                attempt_session_insert(sessions_batch)
-                t2_ = time()
-                print(f'[INFO] Inserted sessions into Redshift - time spent: {t2_-t2}')
-                t_ += t2_-t2
-                for s in sessions_batch:
-                    try:
-                        del sessions[s.sessionid]
-                    except KeyError  as e:
-                        print(repr(e))
-                sessions_batch = []
-
-            if n:
-                n.sessionid = session_id
-                n.received_at = int(datetime.now().timestamp() * 1000)
-                n.batch_order_number = len(batch)
-                batch.append(n)
-            else:
+        for msg in consume_batch(consumer, consume_batch_size, consume_max_wait, metrics):
+            #value = json.loads(msg.value().decode('utf-8'))
+            messages = codec.decode_detailed(msg.value())
+            session_id = codec.decode_key(msg.key())
+            state.track(session_id, msg.topic(), msg.partition())
+            if messages is None:
+                print('-')
                 continue
 
-            # insert a batch of events
+            for message in messages:
+                if LEVEL == 'detailed':
+                    n = handle_message(message)
+                elif LEVEL == 'normal':
+                    n = handle_normal_message(message)
+
+                #session_id = codec.decode_key(msg.key)
+                sessions[session_id] = handle_session(sessions[session_id], message)
+                if sessions[session_id]:
+                    sessions[session_id].sessionid = session_id
+
+                # put in a batch for insertion if received a SessionEnd
+                if isinstance(message, SessionEnd):
+                    if sessions[session_id]:
+                        sessions_batch.append(sessions[session_id])
+
+                # try to insert sessions
+                if len(sessions_batch) >= sessions_batch_size:
+                    t2 = time()
+                    if not attempt_session_insert(sessions_batch):
+                        # Stop without committing, the restart resumes from the last committed offsets
+                        raise IOError('Sessions could not be written, stopping before committing their offsets')
+                    t2_ = time()
+                    print(f'[INFO] Inserted sessions into Redshift - time spent: {t2_-t2}')
+                    t_ += t2_-t2
+                    for s in sessions_batch:
+                        try:
+                            del sessions[s.sessionid]
+                        except KeyError  as e:
+                            print(repr(e))
+                    sessions_batch = []
+
+                if n:
+                    n.sessionid = session_id
+                    n.received_at = int(datetime.now().timestamp() * 1000)
+                    n.batch_order_number = len(batch)
+                    batch.append(n)
+
+            state.offsets[(msg.topic(), msg.partition())] = msg.offset() + 1
+
+            # insert a batch of events, once the record is fully processed so that the snapshot matches its offset
             if len(batch) >= batch_size:
                 t1 = time()
                 print(f'[INFO] Spent time filling ({batch_size})-batch: {t1-t_}')
-                attempt_batch_insert(batch)
+                flush()
                 t1_ = time()
                 t_ = t1_
                 print(f'[INFO] Inserted events into Redshift - time spent: {t1_-t1}')
-                batch = []
-                consumer.commit()
                 print("[INFO] sessions in cache:", len(sessions))
+                print("[INFO] messages decoded: {}, skipped: {}".format(*codec.pop_counters()))
+                metrics.report()
 
 
 def attempt_session_insert(sess_batch):
@@ -120,6 +151,7 @@ def attempt_session_insert(sess_batch):
             print("inserting sessions...")
             insert_batch(db, sess_batch, table=sessions_table_name, level='sessions')
             print("inserted sessions succesfully")
+            return True
         except TypeError as e:
             print("Type conversion error")
             print(repr(e))
@@ -128,6 +160,8 @@ def attempt_session_insert(sess_batch):
             print(repr(e))
         except Exception as e:
             print(repr(e))
+        return False
+    return True
 
 
 def attempt_batch_insert(batch):
@@ -136,6 +170,7 @@ def attempt_batch_insert(batch):
         print("inserting...")
         insert_batch(db=db, batch=batch, table=table_name, level=LEVEL)
         print("inserted succesfully")
+        return True
     except TypeError as e:
         print("Type conversion error")
         print(repr(e))
@@ -144,6 +179,7 @@ def attempt_batch_insert(batch):
         print(repr(e))
     except Exception as e:
         print(repr(e))
+    return False
 
 def decode_key(b) -> int:
     """
@@ -5,25 +5,39 @@ from datetime import datetime
 from collections import defaultdict
 import json
 import asyncio
+import signal
+from threading import Event
 from time import time, sleep
-from copy import deepcopy
 
 from msgcodec.msgcodec import MessageCodec
 from msgcodec.messages import SessionStart, SessionEnd
 from db.api import DBConnection
 from db.models import events_detailed_table_name, events_table_name, sessions_table_name
 from db.writer import insert_batch, update_batch
+from db.utils import ColumnBatch, Row
 from handler import handle_message, handle_normal_message, handle_session
+from pipeline import DecodePool, BatchWriter
 from utils.cache import ProjectFilter as PF
+from utils.consumer_metrics import ConsumerMetrics, consume_batch
+from utils.snapshot import SessionsSnapshot, PartitionsState
+from utils.health import WorkerHealth
 from utils import pg_client
 
 from psycopg2 import InterfaceError
 
-def process_message(msg, codec, sessions, batch, sessions_batch, interesting_sessions, interesting_events, EVENT_TYPE, projectFilter):
-    if msg is None:
+def resolve_projects(decoded, projectFilter):
+    """Cache the projects embedded in SessionStart messages and resolve the other sessions with a single query.
+    decoded: [(session_id, messages), ...]"""
+    if not projectFilter.filter:
         return
-    messages = codec.decode_detailed(msg.value())
-    session_id = codec.decode_key(msg.key())
+    for session_id, messages in decoded:
+        for message in messages:
+            if isinstance(message, SessionStart):
+                projectFilter.set_project(session_id, message.project_id)
+    projectFilter.prefetch(session_id for session_id, _ in decoded)
+
+
+def process_message(session_id, messages, sessions, batch, sessions_batch, interesting_sessions, interesting_events, EVENT_TYPE, projectFilter):
     if messages is None:
         print('-')
         return
@@ -38,28 +52,7 @@ def process_message(msg, codec, sessions, batch, sessions_batch, interesting_ses
             elif EVENT_TYPE == 'normal':
                 n = handle_normal_message(message)
         if message.__id__ in interesting_sessions:
-
-                # Here we create the session if not exists or append message event if session exists
-            sessions[session_id] = handle_session(sessions[session_id], message)
-            if sessions[session_id]:
-                sessions[session_id].sessionid = session_id
-            projectFilter.cached_sessions.add(session_id)
-
-            if isinstance(message, SessionEnd):
-                # Here only if session exists and we get sessionend we start cleanup
-                if sessions[session_id].session_start_timestamp:
-                    projectFilter.handle_clean()
-                    old_status = projectFilter.cached_sessions.close(session_id)
-                    sessions_batch.append((old_status, deepcopy(sessions[session_id])))
-                    sessions_to_delete = projectFilter.cached_sessions.clear_sessions()
-                    for sess_id in sessions_to_delete:
-                        try:
-                            del sessions[sess_id]
-                        except KeyError:
-                            print('[INFO] Session already deleted')
-                else:
-                    print('[WARN] Session not started received SessionEnd message')
-                    del sessions[session_id]
+            process_session_message(session_id, message, sessions, sessions_batch, projectFilter)
 
         if message.__id__ in interesting_events:
             if n:
@@ -71,12 +64,49 @@ def process_message(msg, codec, sessions, batch, sessions_batch, interesting_ses
                 continue
 
 
+def process_session_message(session_id, message, sessions, sessions_batch, projectFilter):
+    # Here we create the session if not exists or append message event if session exists
+    sessions[session_id] = handle_session(sessions[session_id], message)
+    if sessions[session_id]:
+        sessions[session_id].sessionid = session_id
+    projectFilter.cached_sessions.add(session_id)
+
+    if isinstance(message, SessionEnd):
+        # Here only if session exists and we get sessionend we start cleanup
+        if sessions[session_id].session_start_timestamp:
+            projectFilter.handle_clean()
+            old_status = projectFilter.cached_sessions.close(session_id)
+            # Session rows only hold scalars, a shallow copy keeps later updates out of the batch
+            sessions_batch.append((old_status, Row(sessions[session_id])))
+            for sess_id in projectFilter.cached_sessions.clear_sessions():
+                if sessions.pop(sess_id, None) is None:
+                    print('[INFO] Session already deleted')
+        else:
+            print('[WARN] Session not started received SessionEnd message')
+            del sessions[session_id]
+
+
+def process_decoded(decoded, sessions, batch, sessions_batch, projectFilter):
+    """Apply the output of pipeline.decode_records to the session state and the events batch"""
+    resolve_projects([(session_id, session_messages) for session_id, _, session_messages in decoded], projectFilter)
+    for session_id, events, session_messages in decoded:
+        if not projectFilter.is_valid(session_id):
+            # We check using projectFilter if session_id is from the selected projects
+            continue
+        for message in session_messages:
+            process_session_message(session_id, message, sessions, sessions_batch, projectFilter)
+        for n in events:
+            n.batch_order_number = len(batch)
+            batch.append(n)
+
+
 def attempt_session_insert(sess_batch, db, sessions_table_name, try_=0):
     if sess_batch:
         try:
             print("inserting sessions...")
             insert_batch(db, sess_batch, table=sessions_table_name, level='sessions')
             print("inserted sessions succesfully")
+            return True
         except TypeError as e:
             print("Type conversion error")
             print(repr(e))
@@ -87,9 +117,11 @@ def attempt_session_insert(sess_batch, db, sessions_table_name, try_=0):
             if try_ < 3:
                 try_ += 1
                 sleep(try_*2)
-                attempt_session_insert(sess_batch, db, sessions_table_name, try_)
+                return attempt_session_insert(sess_batch, db, sessions_table_name, try_)
         except Exception as e:
             print(repr(e))
+        return False
+    return True
 
 
 def attempt_session_update(sess_batch, db, sessions_table_name):
@@ -97,6 +129,7 @@ def attempt_session_update(sess_batch, db, sessions_table_name):
         try:
             print('updating sessions')
             update_batch(db, sess_batch, table=sessions_table_name)
+            return True
         except TypeError as e:
             print('Type conversion error')
             print(repr(e))
@@ -108,6 +141,8 @@ def attempt_session_update(sess_batch, db, sessions_table_name):
             print(repr(e))
         except Exception as e:
             print(repr(e))
+        return False
+    return True
 
 
 def attempt_batch_insert(batch, db, table_name, EVENT_TYPE, try_=0):
@@ -116,6 +151,7 @@ def attempt_batch_insert(batch, db, table_name, EVENT_TYPE, try_=0):
         print("inserting...")
         insert_batch(db=db, batch=batch, table=table_name, level=EVENT_TYPE)
         print("inserted succesfully")
+        return True
     except TypeError as e:
         print("Type conversion error")
         print(repr(e))
@@ -126,16 +162,17 @@ def attempt_batch_insert(batch, db, table_name, EVENT_TYPE, try_=0):
         if try_ < 3:
             try_ += 1
             sleep(try_*2)
-            attempt_batch_insert(batch, db, table_name, EVENT_TYPE, try_)
+            return attempt_batch_insert(batch, db, table_name, EVENT_TYPE, try_)
         elif try_ == 3:
             # TODO: Restart redshift
             db.restart()
             sleep(2)
-            attempt_batch_insert(batch, db, table_name, EVENT_TYPE, try_ + 1)
+            return attempt_batch_insert(batch, db, table_name, EVENT_TYPE, try_ + 1)
         else:
             print(repr(e))
     except Exception as e:
         print(repr(e))
+    return False
 
 def decode_key(b) -> int:
     """
@@ -147,8 +184,22 @@ def decode_key(b) -> int:
         raise UnicodeDecodeError(f"Error while decoding message key (SessionID) from {b}\n{e}")
     return decoded
 
-        
-async def main():
+
+async def main(worker_id=0, metrics_queue=None, health_port=None):
+    """
+    Consume, decode and load the tracker messages. When started by supervisor.py, worker_id identifies
+    the worker and its metrics are sent to the supervisor through metrics_queue.
+    env:
+        health_port: port of the /health and /metrics endpoints (disabled when 0)
+    """
+    # SIGTERM stops the loop, the current batch is written and committed before leaving the group
+    shutdown = Event()
+    signal.signal(signal.SIGTERM, lambda signum, frame: shutdown.set())
+    signal.signal(signal.SIGINT, lambda signum, frame: shutdown.set())
+    if health_port is None:
+        health_port = config('health_port', default=0, cast=int)
+    health = WorkerHealth(worker_id, health_port, metrics_queue)
+
     await pg_client.init()
     DATABASE = config('CLOUD_SERVICE')
     EVENT_TYPE = config('EVENT_TYPE')
@@ -161,7 +212,7 @@ async def main():
     elif EVENT_TYPE == 'normal':
         table_name = events_table_name
 
-    batch = []
+    batch = ColumnBatch(EVENT_TYPE)
     sessions = defaultdict(lambda: None)
     sessions_batch = []
 
@@ -174,7 +225,7 @@ async def main():
 
     allowed_projects = config('PROJECT_IDS', default=None, cast=Csv(int))
     project_filter = PF(allowed_projects)
-    codec = MessageCodec(filter_events)
+    codec = MessageCodec(filter_events, lazy_strings=True)
     ssl_protocol = config('KAFKA_USE_SSL', default=True, cast=bool)
     consumer_settings = {
         "bootstrap.servers": config('KAFKA_SERVERS'),
@@ -186,27 +237,167 @@ async def main():
         consumer_settings['security.protocol'] = 'SSL'
     consumer = Consumer(consumer_settings)
 
-    consumer.subscribe(config("TOPICS", default="saas-raw").split(','))
+    # Open sessions of each assigned partition are restored from its snapshot, which is saved with every commit
+    # The files are per partition, so all the workers share the directory whatever partitions they are assigned
+    snapshot_path = config('sessions_snapshot', default='')
+    snapshot = SessionsSnapshot(snapshot_path) if snapshot_path else None
+    state = PartitionsState(sessions, project_filter.cached_sessions, snapshot)
+    topics = config("TOPICS", default="saas-raw").split(',')
+
+    # consume_batch_size records are read at once, waiting at most consume_max_wait seconds
+    consume_batch_size = config('consume_batch_size', default=500, cast=int)
+    consume_max_wait = config('consume_max_wait', default=1.0, cast=float)
+    metrics = ConsumerMetrics(consumer)
+
+    decode_workers = config('decode_workers', default=0, cast=int)
+    if decode_workers > 0:
+        run_pipeline(consumer, topics, metrics, consume_batch_size, consume_max_wait, decode_workers, db, table_name,
+                     EVENT_TYPE, filter_events, sessions_events_selection, selected_events, project_filter, upload_rate,
+                     sessions, state, shutdown, health)
+        return
+
+    def flush():
+        """Write the current batch, then save the snapshot and commit the offsets it was built up to"""
+        nonlocal sessions_batch, batch
+        if not write_batches(sessions_batch, batch, db, sessions_table_name, table_name, EVENT_TYPE):
+            # Stop without committing, the restart resumes from the last committed offsets
+            raise IOError('Batch could not be written, stopping before committing its offsets')
+        state.commit(consumer, *state.dump())
+        health.committed()
+        sessions_batch = []
+        batch = ColumnBatch(EVENT_TYPE)
+
+    def on_revoke(consumer, partitions):
+        # The batch holds records of the revoked partitions, they are committed while we still own them
+        flush()
+        state.drop(partitions)
+
+    consumer.subscribe(topics, on_assign=state.on_assign, on_revoke=on_revoke)
     print("[INFO] Kafka consumer subscribed")
 
     c_time = time()
     read_msgs = 0
-    while True:
-        msg = consumer.poll(1.0)
-        process_message(msg, codec, sessions, batch, sessions_batch, sessions_events_selection, selected_events, EVENT_TYPE, project_filter)
-        read_msgs += 1
+    while not shutdown.is_set():
+        health.beat()
+        decoded = list()
+        for msg in consume_batch(consumer, consume_batch_size, consume_max_wait, metrics):
+            session_id = codec.decode_key(msg.key())
+            state.track(session_id, msg.topic(), msg.partition())
+            state.offsets[(msg.topic(), msg.partition())] = msg.offset() + 1
+            decoded.append((session_id, codec.decode_detailed(msg.value())))
+        resolve_projects(decoded, project_filter)
+        for session_id, messages in decoded:
+            process_message(session_id, messages, sessions, batch, sessions_batch, sessions_events_selection, selected_events, EVENT_TYPE, project_filter)
+        read_msgs += len(decoded)
         if time() - c_time > upload_rate:
             print(f'[INFO] {read_msgs} kafka messages read in {upload_rate} seconds')
-            await insertBatch(deepcopy(sessions_batch), deepcopy(batch), db, sessions_table_name, table_name, EVENT_TYPE)
-            consumer.commit()
-            sessions_batch = []
-            batch = []
+            print('[INFO] Tracker messages decoded: {}, skipped: {}'.format(*codec.pop_counters()))
+            health.publish(metrics.report())
+            flush()
             read_msgs = 0
             c_time = time()
 
+    print('[INFO] Shutting down, writing the last batch')
+    flush()
+    consumer.close()
 
 
-async def insertBatch(sessions_batch, batch, db, sessions_table_name, table_name, EVENT_TYPE):
+def run_pipeline(consumer, topics, metrics, consume_batch_size, consume_max_wait, decode_workers, db, table_name,
+                 EVENT_TYPE, filter_events, interesting_sessions, interesting_events, project_filter, upload_rate,
+                 sessions, state, shutdown, health):
+    """
+    Staged version of the main loop (see pipeline.py): this thread polls kafka and keeps the
+    sessions state, decode_workers processes decode the records and a BatchWriter thread loads
+    the batches. Offsets are committed once the batch holding their events was written.
+    env:
+        decode_workers: number of decoding processes (0 keeps everything on the main thread)
+        decode_chunk_size: kafka records sent to a decoding process at once
+    The sessions snapshot is serialized when its batch is handed to the writer, together with the offsets
+    applied so far, and saved to disk once that batch is written, right before committing these same offsets.
+    """
+    chunk_size = config('decode_chunk_size', default=100, cast=int)
+    decoders = DecodePool(decode_workers, filter_events, EVENT_TYPE, interesting_events, interesting_sessions)
+    writer = BatchWriter(lambda sessions_batch, batch: write_batches(sessions_batch, batch, db, sessions_table_name,
+                                                                     table_name, EVENT_TYPE))
+    writer.start()
+
+    batch = ColumnBatch(EVENT_TYPE)
+    sessions_batch = []
+    records = []
+    chunk_offsets = dict()
+
+    def apply(results):
+        for decoded, offsets in results:
+            process_decoded(decoded, sessions, batch, sessions_batch, project_filter)
+            state.offsets.update(offsets)
+
+    def commit(written):
+        offsets, states = written
+        state.commit(consumer, offsets, states)
+        if offsets:
+            health.committed()
+
+    def hand_over():
+        nonlocal sessions_batch, batch, records, chunk_offsets
+        if chunk_offsets:
+            decoders.submit(records, chunk_offsets)
+            records = []
+            chunk_offsets = dict()
+        apply(decoders.drain())
+        # Waits while the previous batch is still being written
+        writer.put(sessions_batch, batch, *state.dump())
+        sessions_batch = []
+        batch = ColumnBatch(EVENT_TYPE)
+
+    def on_revoke(consumer, partitions):
+        if writer.is_alive():
+            # Everything consumed so far is written and committed while the revoked partitions are still ours
+            hand_over()
+            writer.wait()
+            commit(writer.pop_written())
+        state.drop(partitions)
+
+    consumer.subscribe(topics, on_assign=state.on_assign, on_revoke=on_revoke)
+    print("[INFO] Kafka consumer subscribed")
+
+    c_time = time()
+    read_msgs = 0
+    try:
+        while not shutdown.is_set():
+            health.beat()
+            msgs = consume_batch(consumer, consume_batch_size, consume_max_wait, metrics)
+            for msg in msgs:
+                read_msgs += 1
+                session_id = decode_key(msg.key())
+                state.track(session_id, msg.topic(), msg.partition())
+                chunk_offsets[(msg.topic(), msg.partition())] = msg.offset() + 1
+                # Sessions are filtered by project once decoded, SessionStart carries the project
+                records.append((session_id, msg.value()))
+            # A short consume means we caught up, so the partial chunk is not held back
+            if len(records) >= chunk_size or (len(msgs) < consume_batch_size and chunk_offsets):
+                decoders.submit(records, chunk_offsets)
+                records = []
+                chunk_offsets = dict()
+            apply(decoders.results(wait=True))
+
+            if time() - c_time > upload_rate:
+                print(f'[INFO] {read_msgs} kafka messages read in {upload_rate} seconds')
+                health.publish(metrics.report())
+                hand_over()
+                read_msgs = 0
+                c_time = time()
+            commit(writer.pop_written())
+        print('[INFO] Shutting down, writing the last batch')
+        hand_over()
+    finally:
+        decoders.shutdown()
+        writer.stop()
+        commit(writer.pop_written())
+        consumer.close()
+
+
+def write_batches(sessions_batch, batch, db, sessions_table_name, table_name, EVENT_TYPE):
+    """Insert or update the sessions and insert the events. Returns False if any of them was not written"""
     t1 = time()
     print(f'[BG-INFO] Number of events to add {len(batch)}, number of sessions to add {len(sessions_batch)}')
     new_sessions = list()
@@ -217,16 +408,22 @@ async def insertBatch(sessions_batch, batch, db, sessions_table_name, table_name
         else:
             new_sessions.append(session_in_batch)
     print(f'[DEBUG] Number of new sessions {len(new_sessions)}, number of sessions to update {len(updated_sessions)}')
+    written = True
     if new_sessions != []:
-        attempt_session_insert(new_sessions, db, sessions_table_name)
+        written &= attempt_session_insert(new_sessions, db, sessions_table_name)
 
     if updated_sessions != []:
-        attempt_session_update(updated_sessions, db, sessions_table_name)
+        written &= attempt_session_update(updated_sessions, db, sessions_table_name)
 
     # insert a batch of events
-    if batch != []:
-        attempt_batch_insert(batch, db, table_name, EVENT_TYPE)
+    if len(batch) > 0:
+        written &= attempt_batch_insert(batch, db, table_name, EVENT_TYPE)
     print(f'[BG-INFO] Uploaded into S3 in {time()-t1} seconds')
+    return written
+
+
+async def insertBatch(sessions_batch, batch, db, sessions_table_name, table_name, EVENT_TYPE):
+    return write_batches(sessions_batch, batch, db, sessions_table_name, table_name, EVENT_TYPE)
 
 
 if __name__ == '__main__':
@@ -1,4 +1,24 @@
+from clickhouse_driver import Client
 
-def insert_to_clickhouse(db, df, table: str):
-    df.to_sql(table, db.engine, if_exists='append', index=False)
 
+def _get_client(db):
+    """Native clickhouse client built from the connection string of db (kept on db for reuse)"""
+    client = getattr(db, 'clickhouse_client', None)
+    if client is None:
+        url = db.engine.url
+        client = Client(host=url.host,
+                        port=url.port or 9000,
+                        database=url.database or 'default',
+                        user=url.username or 'default',
+                        password=url.password or '')
+        db.clickhouse_client = client
+    return client
+
+
+def insert_to_clickhouse(db, df, table: str):
+    # Columnar insert through the native protocol: the whole batch is sent as one block
+    frame = df.astype(object).where(df.notna(), None)
+    columns = list(frame.columns)
+    _get_client(db).execute(f"INSERT INTO {table} ({', '.join(columns)}) VALUES",
+                            [frame[column].tolist() for column in columns],
+                            columnar=True)
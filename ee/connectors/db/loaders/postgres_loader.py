@@ -1,3 +1,35 @@
+from io import StringIO
+
+from db.utils import update_from_staging_query
+
+
+def _copy_df(cursor, df, table: str):
+    buffer = StringIO()
+    df.to_csv(buffer, index=False, header=False, na_rep='\\N')
+    buffer.seek(0)
+    cursor.copy_expert(f"COPY {table} ({', '.join(df.columns)}) FROM STDIN WITH (FORMAT csv, NULL '\\N')", buffer)
+
 
 def insert_to_postgres(db, df, table: str):
-    df.to_sql(table, db.engine, if_exists='append', index=False)
+    # COPY FROM STDIN streams the whole batch in one statement instead of row by row inserts
+    conn = db.engine.raw_connection()
+    try:
+        with conn.cursor() as cursor:
+            _copy_df(cursor, df, table)
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def update_to_postgres(db, df, table: str):
+    # Stage the updated rows in a temporary table and apply them with a single UPDATE ... FROM
+    staging_table = f"{table}_staging"
+    conn = db.engine.raw_connection()
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute(f"CREATE TEMP TABLE {staging_table} (LIKE {table}) ON COMMIT DROP")
+            _copy_df(cursor, df, staging_table)
+            cursor.execute(update_from_staging_query(table, staging_table, df.columns))
+        conn.commit()
+    finally:
+        conn.close()
@@ -1,4 +1,7 @@
+from uuid import uuid4
+
 from db.models import DetailedEvent
+from db.utils import update_from_staging_query
 from psycopg2.errors import InternalError_
 
 
@@ -9,6 +12,8 @@ def transit_insert_to_redshift(db, df, table):
     except InternalError_ as e:
         print(repr(e))
         print("loading failed. check stl_load_errors")
+        # the caller must not commit the kafka offsets of a batch that wasn't written
+        raise
 
 
 def insert_df(pr, df, table):
@@ -17,3 +22,25 @@ def insert_df(pr, df, table):
                           redshift_table_name=table,
                           append=True,
                           delimiter='|')
+
+
+def transit_update_to_redshift(db, df, table):
+    # Load the updated rows into a temporary staging table (S3 + COPY) and apply them with one UPDATE ... FROM.
+    # The temporary table lives in the session of pandas_redshift's connection and has a unique name, so
+    # concurrent writers (workers, containers, the pipeline writer thread) never share a staging table.
+    pr = db.pdredshift
+    staging_table = f"{table}_staging_{uuid4().hex[:12]}"
+    try:
+        pr.exec_commit(f"CREATE TEMP TABLE {staging_table} (LIKE {table});")
+        insert_df(pr, df, staging_table)
+        pr.exec_commit(update_from_staging_query(table, staging_table, df.columns) + ';')
+    except InternalError_ as e:
+        print(repr(e))
+        print("update failed. check stl_load_errors")
+        raise
+    finally:
+        try:
+            pr.exec_commit(f"DROP TABLE IF EXISTS {staging_table};")
+        except Exception as e:
+            # the temporary table is dropped with the session anyway, keep the original error
+            print(repr(e))
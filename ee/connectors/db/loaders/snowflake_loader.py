@@ -1,5 +1,27 @@
+from snowflake.connector.pandas_tools import write_pandas
+
+from db.utils import update_from_staging_query
+
 
 def insert_to_snowflake(db, df, table):
-    df.to_sql(table, db.engine, if_exists='append', index=False)
+    # write_pandas uploads the batch as parquet into a temporary stage and loads it with a single COPY INTO
+    conn = db.engine.raw_connection()
+    try:
+        write_pandas(conn.connection, df, table_name=table, quote_identifiers=False)
+    finally:
+        conn.close()
 
 
+def update_to_snowflake(db, df, table):
+    # Stage the updated rows in a temporary table and apply them with a single UPDATE ... FROM
+    staging_table = f"{table}_staging"
+    conn = db.engine.raw_connection()
+    try:
+        cursor = conn.cursor()
+        cursor.execute(f"CREATE OR REPLACE TEMPORARY TABLE {staging_table} LIKE {table}")
+        write_pandas(conn.connection, df, table_name=staging_table, quote_identifiers=False)
+        cursor.execute(update_from_staging_query(table, staging_table, df.columns))
+        cursor.execute(f"DROP TABLE IF EXISTS {staging_table}")
+        conn.commit()
+    finally:
+        conn.close()
@@ -1,5 +1,5 @@
 import pandas as pd
-from db.models import DetailedEvent, Event, Session, DATABASE
+from db.models import DATABASE
 
 dtypes_events = {
     'sessionid': "Int64",
@@ -163,63 +163,86 @@ if DATABASE == 'bigquery':
     dtypes_sessions['urls'] = "string"
     dtypes_sessions['issues'] = "string"
 
-detailed_events_col = []
-for col in DetailedEvent.__dict__:
-    if not col.startswith('_'):
-        detailed_events_col.append(col)
 
-events_col = []
-for col in Event.__dict__:
-    if not col.startswith('_'):
-        events_col.append(col)
+class Row(dict):
+    """
+    Plain mapping built by the handlers instead of an ORM instance.
+    Supports attribute access; columns that were never set read as None.
+    """
+    __slots__ = ()
+    __getattr__ = dict.get
+    __setattr__ = dict.__setitem__
 
-sessions_col = []
-for col in Session.__dict__:
-    if not col.startswith('_'):
-        sessions_col.append(col)
+
+class ColumnBatch:
+    """
+    Column oriented accumulator for one connector table. Rows are written straight into
+    one list per column (the keys of the matching dtypes_* map) and converted once per
+    flush into typed pandas arrays, without ORM instances or a per-row dict round trip.
+    """
+    dtypes_by_level = {'normal': dtypes_events,
+                       'detailed': dtypes_detailed_events,
+                       'sessions': dtypes_sessions}
+
+    def __init__(self, level):
+        self.level = level
+        self.dtypes = self.dtypes_by_level[level]
+        self.data = {column: [] for column in self.dtypes}
+        self.size = 0
+
+    @classmethod
+    def from_rows(cls, rows, level):
+        batch = cls(level)
+        for row in rows:
+            batch.append(row)
+        return batch
+
+    def __len__(self):
+        return self.size
+
+    def append(self, row):
+        """Add a row (any mapping of column -> value); keys that are not table columns are ignored"""
+        data = self.data
+        size = self.size
+        for column, value in row.items():
+            values = data.get(column)
+            if values is None:
+                continue
+            if len(values) < size:
+                values.extend([None] * (size - len(values)))
+            values.append(value)
+        self.size = size + 1
+
+    def _column(self, column, values):
+        dtype = self.dtypes[column]
+        if dtype == "string":
+            values = ['NULL' if v is None else str(v)[:255].replace("|", "") for v in values]
+        return pd.array(values, dtype=dtype)
+
+    def to_df(self):
+        size = self.size
+        data = self.data
+        for values in data.values():
+            if len(values) < size:
+                values.extend([None] * (size - len(values)))
+        if self.level == 'detailed':
+            data['inputevent_value'] = [None] * size
+            data['customevent_payload'] = [None] * size
+        if self.level == 'sessions':
+            for column in ('js_exceptions_count', 'inputs_count', 'clicks_count', 'issues_count', 'urls_count'):
+                data[column] = [0 if v is None else v for v in data[column]]
+        return pd.DataFrame({column: self._column(column, values) for column, values in data.items()},
+                            columns=list(self.dtypes))
 
 
 def get_df_from_batch(batch, level):
-    if level == 'normal':
-        df = pd.DataFrame([b.__dict__ for b in batch], columns=events_col)
-    if level == 'detailed':
-        df = pd.DataFrame([b.__dict__ for b in batch], columns=detailed_events_col)
-    if level == 'sessions':
-        df = pd.DataFrame([b.__dict__ for b in batch], columns=sessions_col)
-
-    try:
-        df = df.drop('_sa_instance_state', axis=1)
-    except KeyError:
-        pass
-
-    if level == 'normal':
-        current_types = dtypes_events
-    if level == 'detailed':
-        current_types = dtypes_detailed_events
-        df['inputevent_value'] = None
-        df['customevent_payload'] = None
-    if level == 'sessions':
-        current_types = dtypes_sessions
-        df['js_exceptions_count'] = df['js_exceptions_count'].fillna(0)
-        df['inputs_count'] = df['inputs_count'].fillna(0)
-        df['clicks_count'] = df['clicks_count'].fillna(0)
-        df['issues_count'] = df['issues_count'].fillna(0)
-        df['urls_count'] = df['urls_count'].fillna(0)
-    df = df.astype(current_types)
-
-    if DATABASE == 'clickhouse' and level == 'sessions':
-        df['issues'] = df['issues'].fillna('')
-        df['urls'] = df['urls'].fillna('')
-
-    for x in df.columns:
-        try:
-            if df[x].dtype == "string" or current_types[x] == "string":
-                df[x] = df[x].fillna('NULL')
-                df[x] = df[x].str.slice(0, 255)
-                df[x] = df[x].str.replace("|", "")
-        except TypeError as e:
-            print(repr(e))
-            if df[x].dtype == 'str':
-                df[x] = df[x].str.slice(0, 255)
-                df[x] = df[x].str.replace("|", "")
-    return df
+    if not isinstance(batch, ColumnBatch):
+        batch = ColumnBatch.from_rows(batch, level)
+    return batch.to_df()
+
+
+def update_from_staging_query(table, staging_table, columns, key='sessionid'):
+    """Set-based UPDATE of `table` rows from the rows of `staging_table` with the same key
+    (supported by postgres, redshift and snowflake)"""
+    assignments = ', '.join(f"{column} = s.{column}" for column in columns if column != key)
+    return f"UPDATE {table} SET {assignments} FROM {staging_table} AS s WHERE {table}.{key} = s.{key}"
@@ -1,2 +1,6 @@
 echo "[INFO] Starting service"
-python -u consumer_async.py
+if [ "${CONNECTOR_WORKERS:-1}" -gt 1 ]; then
+    python -u supervisor.py
+else
+    python -u consumer_async.py
+fi
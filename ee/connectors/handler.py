@@ -1,818 +1,682 @@
-from typing import Optional, Union
+from operator import attrgetter
+from typing import Callable, Dict, Optional, Set, Tuple, Union
 
-from db.models import Event, DetailedEvent, Session
+from db.utils import Row
 from msgcodec.messages import *
 
 
-def handle_normal_message(message: Message) -> Optional[Event]:
-
-    n = Event()
-
-    if isinstance(message, ConnectionInformation):
-        n.connectioninformation_downlink = message.downlink
-        n.connectioninformation_type = message.type
-        return n
-
-    if isinstance(message, ConsoleLog):
-        n.consolelog_level = message.level
-        n.consolelog_value = message.value
-        return n
-
-    if isinstance(message, CustomEvent):
-        n.customevent_name = message.name
-        n.customevent_payload = message.payload
-        return n
-
-    if isinstance(message, Metadata):
-        n.metadata_key = message.key
-        n.metadata_value = message.value
-        return n
-
-    if isinstance(message, MouseClick):
-        n.mouseclick_hesitationtime = message.hesitation_time
-        n.mouseclick_id = message.id
-        n.mouseclick_label = message.label
-        n.mouseclick_selector = message.selector
-        return n
-
-    if isinstance(message, NetworkRequest):
-        n.networkrequest_type = message.type
-        n.networkrequest_method = message.method
-        n.networkrequest_url = message.url
-        n.networkrequest_request = message.request
-        n.networkrequest_response = message.response
-        n.networkrequest_status = message.status
-        n.networkrequest_timestamp = message.timestamp
-        n.networkrequest_duration = message.duration
-        return n
-
-    if isinstance(message, PageEvent):
-        n.pageevent_firstcontentfulpaint = message.first_contentful_paint
-        n.pageevent_firstpaint = message.first_paint
-        n.pageevent_messageid = message.message_id
-        n.pageevent_referrer = message.referrer
-        n.pageevent_speedindex = message.speed_index
-        n.pageevent_timestamp = message.timestamp
-        n.pageevent_url = message.url
-        return n
-
-    if isinstance(message, PageRenderTiming):
-        n.pagerendertiming_timetointeractive = message.time_to_interactive
-        n.pagerendertiming_visuallycomplete = message.visually_complete
-        return n
-
-    if isinstance(message, SetViewportSize):
-        n.setviewportsize_height = message.height
-        n.setviewportsize_width = message.width
-        return n
-
-    if isinstance(message, Timestamp):
-        n.timestamp_timestamp = message.timestamp
-        return n
-
-    if isinstance(message, UserAnonymousID):
-        n.user_anonymous_id = message.id
-        return n
-
-    if isinstance(message, UserID):
-        n.user_id = message.id
-        return n
-
-    if isinstance(message, IssueEvent):
-        n.issueevent_messageid = message.message_id
-        n.issueevent_timestamp = message.timestamp
-        n.issueevent_type = message.type
-        n.issueevent_context_string = message.context_string
-        n.issueevent_context = message.context
-        n.issueevent_payload = message.payload
-        n.issueevent_url = message.url
-        return n
-
-    if isinstance(message, CustomIssue):
-        n.customissue_name = message.name
-        n.customissue_payload = message.payload
-        return n
-
-
-def handle_session(n: Session, message: Message) -> Optional[Session]:
+# Columns filled from each message type, {message class: {column: message attribute}}
+NORMAL_EVENT_FIELDS = {
+    ConnectionInformation: {
+        'connectioninformation_downlink': 'downlink',
+        'connectioninformation_type': 'type',
+    },
+    ConsoleLog: {
+        'consolelog_level': 'level',
+        'consolelog_value': 'value',
+    },
+    CustomEvent: {
+        'customevent_name': 'name',
+        'customevent_payload': 'payload',
+    },
+    Metadata: {
+        'metadata_key': 'key',
+        'metadata_value': 'value',
+    },
+    MouseClick: {
+        'mouseclick_hesitationtime': 'hesitation_time',
+        'mouseclick_id': 'id',
+        'mouseclick_label': 'label',
+        'mouseclick_selector': 'selector',
+    },
+    NetworkRequest: {
+        'networkrequest_type': 'type',
+        'networkrequest_method': 'method',
+        'networkrequest_url': 'url',
+        'networkrequest_request': 'request',
+        'networkrequest_response': 'response',
+        'networkrequest_status': 'status',
+        'networkrequest_timestamp': 'timestamp',
+        'networkrequest_duration': 'duration',
+    },
+    PageEvent: {
+        'pageevent_firstcontentfulpaint': 'first_contentful_paint',
+        'pageevent_firstpaint': 'first_paint',
+        'pageevent_messageid': 'message_id',
+        'pageevent_referrer': 'referrer',
+        'pageevent_speedindex': 'speed_index',
+        'pageevent_timestamp': 'timestamp',
+        'pageevent_url': 'url',
+    },
+    PageRenderTiming: {
+        'pagerendertiming_timetointeractive': 'time_to_interactive',
+        'pagerendertiming_visuallycomplete': 'visually_complete',
+    },
+    SetViewportSize: {
+        'setviewportsize_height': 'height',
+        'setviewportsize_width': 'width',
+    },
+    Timestamp: {
+        'timestamp_timestamp': 'timestamp',
+    },
+    UserAnonymousID: {
+        'user_anonymous_id': 'id',
+    },
+    UserID: {
+        'user_id': 'id',
+    },
+    IssueEvent: {
+        'issueevent_messageid': 'message_id',
+        'issueevent_timestamp': 'timestamp',
+        'issueevent_type': 'type',
+        'issueevent_context_string': 'context_string',
+        'issueevent_context': 'context',
+        'issueevent_payload': 'payload',
+        'issueevent_url': 'url',
+    },
+    CustomIssue: {
+        'customissue_name': 'name',
+        'customissue_payload': 'payload',
+    },
+}
+
+DETAILED_EVENT_FIELDS = {
+    Timestamp: {
+        'timestamp_timestamp': 'timestamp',
+    },
+    SessionStart: {
+        'sessionstart_trackerversion': 'tracker_version',
+        'sessionstart_revid': 'rev_id',
+        'sessionstart_timestamp': 'timestamp',
+        'sessionstart_useruuid': 'user_uuid',
+        'sessionstart_useragent': 'user_agent',
+        'sessionstart_useros': 'user_os',
+        'sessionstart_userosversion': 'user_os_version',
+        'sessionstart_userbrowser': 'user_browser',
+        'sessionstart_userbrowserversion': 'user_browser_version',
+        'sessionstart_userdevice': 'user_device',
+        'sessionstart_userdevicetype': 'user_device_type',
+        'sessionstart_userdevicememorysize': 'user_device_memory_size',
+        'sessionstart_userdeviceheapsize': 'user_device_heap_size',
+        'sessionstart_usercountry': 'user_country',
+    },
+    CreateIFrameDocument: {
+        'create_iframedocument_frame_id': 'frame_id',
+        'create_iframedocument_id': 'id',
+    },
+    SetViewportSize: {
+        'setviewportsize_width': 'width',
+        'setviewportsize_height': 'height',
+    },
+    SetViewportScroll: {
+        'setviewportscroll_x': 'x',
+        'setviewportscroll_y': 'y',
+    },
+    SetNodeScroll: {
+        'setnodescroll_id': 'id',
+        'setnodescroll_x': 'x',
+        'setnodescroll_y': 'y',
+    },
+    ConsoleLog: {
+        'consolelog_level': 'level',
+        'consolelog_value': 'value',
+    },
+    PageLoadTiming: {
+        'pageloadtiming_requeststart': 'request_start',
+        'pageloadtiming_responsestart': 'response_start',
+        'pageloadtiming_responseend': 'response_end',
+        'pageloadtiming_domcontentloadedeventstart': 'dom_content_loaded_event_start',
+        'pageloadtiming_domcontentloadedeventend': 'dom_content_loaded_event_end',
+        'pageloadtiming_loadeventstart': 'load_event_start',
+        'pageloadtiming_loadeventend': 'load_event_end',
+        'pageloadtiming_firstpaint': 'first_paint',
+        'pageloadtiming_firstcontentfulpaint': 'first_contentful_paint',
+    },
+    PageRenderTiming: {
+        'pagerendertiming_speedindex': 'speed_index',
+        'pagerendertiming_visuallycomplete': 'visually_complete',
+        'pagerendertiming_timetointeractive': 'time_to_interactive',
+    },
+    IntegrationEvent: {
+        'integrationevent_timestamp': 'timestamp',
+        'integrationevent_source': 'source',
+        'integrationevent_name': 'name',
+        'integrationevent_message': 'message',
+        'integrationevent_payload': 'payload',
+    },
+    UserID: {
+        'userid_id': 'id',
+    },
+    UserAnonymousID: {
+        'useranonymousid_id': 'id',
+    },
+    Metadata: {
+        'metadata_key': 'key',
+        'metadata_value': 'value',
+    },
+    BatchMeta: {
+        'batchmeta_page_no': 'page_no',
+        'batchmeta_first_index': 'first_index',
+        'batchmeta_timestamp': 'timestamp',
+    },
+    BatchMetadata: {
+        'batchmetadata_version': 'version',
+        'batchmetadata_page_no': 'page_no',
+        'batchmetadata_first_index': 'first_index',
+        'batchmetadata_timestamp': 'timestamp',
+        'batchmetadata_location': 'location',
+    },
+    PartitionedMessage: {
+        'partitionedmessage_part_no': 'part_no',
+        'partitionedmessage_part_total': 'part_total',
+    },
+    InputChange: {
+        'inputchange_id': 'id',
+        'inputchange_value': 'value',
+        'inputchange_value_masked': 'value_masked',
+        'inputchange_label': 'label',
+        'inputchange_hesitation_time': 'hesitation_time',
+        'inputchange_input_duration': 'input_duration',
+    },
+    SelectionChange: {
+        'selectionchange_selection_start': 'selection_start',
+        'selectionchange_selection_end': 'selection_end',
+        'selectionchange_selection': 'selection',
+    },
+    MouseThrashing: {
+        'mousethrashing_timestamp': 'timestamp',
+    },
+    UnbindNodes: {
+        'unbindnodes_total_removed_percent': 'total_removed_percent',
+    },
+    ResourceTiming: {
+        'resourcetiming_timestamp': 'timestamp',
+        'resourcetiming_duration': 'duration',
+        'resourcetiming_ttfb': 'ttfb',
+        'resourcetiming_header_size': 'header_size',
+        'resourcetiming_encoded_body_size': 'encoded_body_size',
+        'resourcetiming_decoded_body_size': 'decoded_body_size',
+        'resourcetiming_url': 'url',
+        'resourcetiming_initiator': 'initiator',
+        'resourcetiming_transferred_size': 'transferred_size',
+        'resourcetiming_cached': 'cached',
+    },
+    IssueEvent: {
+        'issueevent_message_id': 'message_id',
+        'issueevent_timestamp': 'timestamp',
+        'issueevent_type': 'type',
+        'issueevent_context_string': 'context_string',
+        'issueevent_context': 'context',
+        'issueevent_payload': 'payload',
+        'issueevent_url': 'url',
+    },
+    SessionEnd: {
+        'sessionend_timestamp': 'timestamp',
+        'sessionend_encryption_key': 'encryption_key',
+    },
+    SessionSearch: {
+        'sessionsearch_timestamp': 'timestamp',
+        'sessionsearch_partition': 'partition',
+    },
+    PerformanceTrack: {
+        'performancetrack_frames': 'frames',
+        'performancetrack_ticks': 'ticks',
+        'performancetrack_totaljsheapsize': 'total_js_heap_size',
+        'performancetrack_usedjsheapsize': 'used_js_heap_size',
+    },
+    PerformanceTrackAggr: {
+        'performancetrackaggr_timestampstart': 'timestamp_start',
+        'performancetrackaggr_timestampend': 'timestamp_end',
+        'performancetrackaggr_minfps': 'min_fps',
+        'performancetrackaggr_avgfps': 'avg_fps',
+        'performancetrackaggr_maxfps': 'max_fps',
+        'performancetrackaggr_mincpu': 'min_cpu',
+        'performancetrackaggr_avgcpu': 'avg_cpu',
+        'performancetrackaggr_maxcpu': 'max_cpu',
+        'performancetrackaggr_mintotaljsheapsize': 'min_total_js_heap_size',
+        'performancetrackaggr_avgtotaljsheapsize': 'avg_total_js_heap_size',
+        'performancetrackaggr_maxtotaljsheapsize': 'max_total_js_heap_size',
+        'performancetrackaggr_minusedjsheapsize': 'min_used_js_heap_size',
+        'performancetrackaggr_avgusedjsheapsize': 'avg_used_js_heap_size',
+        'performancetrackaggr_maxusedjsheapsize': 'max_used_js_heap_size',
+    },
+    ConnectionInformation: {
+        'connectioninformation_downlink': 'downlink',
+        'connectioninformation_type': 'type',
+    },
+    PageEvent: {
+        'pageevent_messageid': 'message_id',
+        'pageevent_timestamp': 'timestamp',
+        'pageevent_url': 'url',
+        'pageevent_referrer': 'referrer',
+        'pageevent_loaded': 'loaded',
+        'pageevent_requeststart': 'request_start',
+        'pageevent_responsestart': 'response_start',
+        'pageevent_responseend': 'response_end',
+        'pageevent_domcontentloadedeventstart': 'dom_content_loaded_event_start',
+        'pageevent_domcontentloadedeventend': 'dom_content_loaded_event_end',
+        'pageevent_loadeventstart': 'load_event_start',
+        'pageevent_loadeventend': 'load_event_end',
+        'pageevent_firstpaint': 'first_paint',
+        'pageevent_firstcontentfulpaint': 'first_contentful_paint',
+        'pageevent_speedindex': 'speed_index',
+    },
+    InputEvent: {
+        'inputevent_messageid': 'message_id',
+        'inputevent_timestamp': 'timestamp',
+        'inputevent_value': 'value',
+        'inputevent_valuemasked': 'value_masked',
+        'inputevent_label': 'label',
+    },
+    CustomEvent: {
+        'customevent_name': 'name',
+        'customevent_payload': 'payload',
+    },
+    LoadFontFace: {
+        'loadfontface_parent_id': 'parent_id',
+        'loadfontface_family': 'family',
+        'loadfontface_source': 'source',
+        'loadfontface_descriptors': 'descriptors',
+    },
+    SetNodeFocus: {
+        'setnodefocus_id': 'id',
+    },
+    AdoptedSSReplaceURLBased: {
+        'adoptedssreplaceurlbased_sheet_id': 'sheet_id',
+        'adoptedssreplaceurlbased_text': 'text',
+        'adoptedssreplaceurlbased_base_url': 'base_url',
+    },
+    AdoptedSSReplace: {
+        'adoptedssreplace_sheet_id': 'sheet_id',
+        'adoptedssreplace_text': 'text',
+    },
+    AdoptedSSInsertRuleURLBased: {
+        'adoptedssinsertruleurlbased_sheet_id': 'sheet_id',
+        'adoptedssinsertruleurlbased_rule': 'rule',
+        'adoptedssinsertruleurlbased_index': 'index',
+        'adoptedssinsertruleurlbased_base_url': 'base_url',
+    },
+    AdoptedSSInsertRule: {
+        'adoptedssinsertrule_sheet_id': 'sheet_id',
+        'adoptedssinsertrule_rule': 'rule',
+        'adoptedssinsertrule_index': 'index',
+    },
+    AdoptedSSDeleteRule: {
+        'adoptedssdeleterule_sheet_id': 'sheet_id',
+        'adoptedssdeleterule_index': 'index',
+    },
+    AdoptedSSAddOwner: {
+        'adoptedssaddowner_sheet_id': 'sheet_id',
+        'adoptedssaddowner_id': 'id',
+    },
+    AdoptedSSRemoveOwner: {
+        'adoptedssremoveowner_sheet_id': 'sheet_id',
+        'adoptedssremoveowner_id': 'id',
+    },
+    JSException: {
+        'jsexception_name': 'name',
+        'jsexception_message': 'message',
+        'jsexception_payload': 'payload',
+        'jsexception_metadata': 'metadata',
+    },
+    Zustand: {
+        'zustand_mutation': 'mutation',
+        'zustand_state': 'state',
+    },
+    Fetch: {
+        'fetch_method': 'method',
+        'fetch_url': 'url',
+        'fetch_request': 'request',
+        'fetch_status': 'status',
+        'fetch_timestamp': 'timestamp',
+        'fetch_duration': 'duration',
+    },
+    SetNodeAttributeDict: {
+        'setnodeattributedict_id': 'id',
+        'setnodeattributedict_name_key': 'name_key',
+        'setnodeattributedict_value_key': 'value_key',
+    },
+    Profiler: {
+        'profiler_name': 'name',
+        'profiler_duration': 'duration',
+        'profiler_args': 'args',
+        'profiler_result': 'result',
+    },
+    GraphQL: {
+        'graphql_operationkind': 'operation_kind',
+        'graphql_operationname': 'operation_name',
+        'graphql_variables': 'variables',
+        'graphql_response': 'response',
+    },
+    MouseClick: {
+        'mouseclick_id': 'id',
+        'mouseclick_hesitationtime': 'hesitation_time',
+        'mouseclick_label': 'label',
+        'mouseclick_selector': 'selector',
+    },
+    SetPageLocation: {
+        'setpagelocation_url': 'url',
+        'setpagelocation_referrer': 'referrer',
+        'setpagelocation_navigationstart': 'navigation_start',
+    },
+    MouseMove: {
+        'mousemove_x': 'x',
+        'mousemove_y': 'y',
+    },
+    LongTask: {
+        'longtasks_timestamp': 'timestamp',
+        'longtasks_duration': 'duration',
+        'longtask_context': 'context',
+        'longtask_containertype': 'container_type',
+        'longtasks_containersrc': 'container_src',
+        'longtasks_containerid': 'container_id',
+        'longtasks_containername': 'container_name',
+    },
+    TechnicalInfo: {
+        'technicalinfo_type': 'type',
+        'technicalinfo_value': 'value',
+    },
+    CustomIssue: {
+        'customissue_name': 'name',
+        'customissue_payload': 'payload',
+    },
+    AssetCache: {
+        'asset_cache_url': 'url',
+    },
+    IOSSessionStart: {
+        'iossessionstart_timestamp': 'timestamp',
+        'iossessionstart_projectid': 'project_id',
+        'iossessionstart_trackerversion': 'tracker_version',
+        'iossessionstart_revid': 'rev_id',
+        'iossessionstart_useruuid': 'user_uuid',
+        'iossessionstart_useros': 'user_os',
+        'iossessionstart_userosversion': 'user_os_version',
+        'iossessionstart_userdevice': 'user_device',
+        'iossessionstart_userdevicetype': 'user_device_type',
+        'iossessionstart_usercountry': 'user_country',
+    },
+    IOSSessionEnd: {
+        'iossessionend_timestamp': 'timestamp',
+    },
+    IOSMetadata: {
+        'iosmetadata_timestamp': 'timestamp',
+        'iosmetadata_length': 'length',
+        'iosmetadata_key': 'key',
+        'iosmetadata_value': 'value',
+    },
+    IOSBatchMeta: {
+        'iosbatchmeta_lenght': 'length',
+        'iosbatchmeta_first_index': 'first_index',
+        'iosbatchmeta_timestamp': 'timestamp',
+    },
+    IOSUserID: {
+        'iosuserid_timestamp': 'timestamp',
+        'iosuserid_length': 'length',
+        'iosuserid_value': 'value',
+    },
+    IOSUserAnonymousID: {
+        'iosuseranonymousid_timestamp': 'timestamp',
+        'iosuseranonymousid_length': 'length',
+        'iosuseranonymousid_value': 'value',
+    },
+    IOSScreenEnter: {
+        'iosscreenenter_timestamp': 'timestamp',
+        'iosscreenenter_length': 'length',
+        'iosscreenenter_title': 'title',
+        'iosscreenenter_view_name': 'view_name',
+    },
+    IOSScreenLeave: {
+        'iosscreenleave_timestamp': 'timestamp',
+        'iosscreenleave_length': 'length',
+        'iosscreenleave_title': 'title',
+        'iosscreenleave_viewname': 'view_name',
+    },
+    IOSScreenChanges: {
+        'iosscreenchanges_timestamp': 'timestamp',
+        'iosscreenchanges_length': 'length',
+        'iosscreenchanges_x': 'x',
+        'iosscreenchanges_y': 'y',
+        'iosscreenchanges_width': 'width',
+        'iosscreenchanges_height': 'height',
+    },
+    IOSClickEvent: {
+        'iosclickevent_timestamp': 'timestamp',
+        'iosclickevent_length': 'length',
+        'iosclickevent_label': 'label',
+        'iosclickevent_x': 'x',
+        'iosclickevent_y': 'y',
+    },
+    IOSInputEvent: {
+        'iosinputevent_timestamp': 'timestamp',
+        'iosinputevent_length': 'length',
+        'iosinputevent_value_masked': 'value_masked',
+        'iosinputevent_label': 'label',
+    },
+    IOSLog: {
+        'ioslog_timestamp': 'timestamp',
+        'ioslog_length': 'length',
+        'ioslog_severity': 'severity',
+        'ioslog_content': 'content',
+    },
+    IOSNetworkCall: {
+        'iosnetworkcall_timestamp': 'timestamp',
+        'iosnetworkcall_length': 'length',
+        'iosnetworkcall_duration': 'duration',
+        'iosnetworkcall_headers': 'headers',
+        'iosnetworkcall_body': 'body',
+        'iosnetworkcall_url': 'url',
+        'iosnetworkcall_success': 'success',
+        'iosnetworkcall_method': 'method',
+        'iosnetworkcall_status': 'status',
+    },
+    IOSIssueEvent: {
+        'iosissueevent_timestamp': 'timestamp',
+        'iosissueevent_type': 'type',
+        'iosissueevent_context_string': 'context_string',
+        'iosissueevent_context': 'context',
+        'iosissueevent_payload': 'payload',
+    },
+    IOSCustomEvent: {
+        'ioscustomevent_timestamp': 'timestamp',
+        'ioscustomevent_length': 'length',
+        'ioscustomevent_name': 'name',
+        'ioscustomevent_payload': 'payload',
+    },
+    IOSInternalError: {
+        'iosinternalerror_timestamp': 'timestamp',
+        'iosinternalerror_length': 'length',
+        'iosinternalerror_content': 'content',
+    },
+    IOSCrash: {
+        'ioscrash_timestamp': 'timestamp',
+        'ioscrash_length': 'length',
+        'ioscrash_name': 'name',
+        'ioscrash_reason': 'reason',
+        'ioscrash_stacktrace': 'stacktrace',
+    },
+    IOSPerformanceEvent: {
+        'iosperformanceevent_timestamp': 'timestamp',
+        'iosperformanceevent_length': 'length',
+        'iosperformanceevent_name': 'name',
+        'iosperformanceevent_value': 'value',
+    },
+    IOSPerformanceAggregated: {
+        'iosperformanceaggregated_timestampstart': 'timestamp_start',
+        'iosperformanceaggregated_timestampend': 'timestamp_end',
+        'iosperformanceaggregated_minfps': 'min_fps',
+        'iosperformanceaggregated_avgfps': 'avg_fps',
+        'iosperformanceaggregated_maxfps': 'max_fps',
+        'iosperformanceaggregated_mincpu': 'min_cpu',
+        'iosperformanceaggregated_avgcpu': 'avg_cpu',
+        'iosperformanceaggregated_maxcpu': 'max_cpu',
+        'iosperformanceaggregated_minmemory': 'min_memory',
+        'iosperformanceaggregated_avgmemory': 'avg_memory',
+        'iosperformanceaggregated_maxmemory': 'max_memory',
+        'iosperformanceaggregated_minbattery': 'min_battery',
+        'iosperformanceaggregated_avgbattery': 'avg_battery',
+        'iosperformanceaggregated_maxbattery': 'max_battery',
+    },
+}
+
+
+def _columns_getter(columns: Dict[str, str]) -> Tuple[Tuple[str, ...], Callable[[Message], tuple]]:
+    """Column names and a getter returning the matching message attributes in a single call"""
+    attributes = tuple(columns.values())
+    if not attributes:
+        return (), lambda message: ()
+    if len(attributes) == 1:
+        get = attrgetter(attributes[0])
+        return tuple(columns), lambda message: (get(message),)
+    return tuple(columns), attrgetter(*attributes)
+
+
+def _columns_mappers(fields: Dict[type, Dict[str, str]]) -> Dict[int, Tuple[Tuple[str, ...], Callable]]:
+    """Dispatch table: message id -> (columns, getter), so a message is mapped with one dict lookup"""
+    return {message_class.__id__: _columns_getter(columns) for message_class, columns in fields.items()}
+
+
+_NORMAL_EVENT_MAPPERS = _columns_mappers(NORMAL_EVENT_FIELDS)
+_DETAILED_EVENT_MAPPERS = _columns_mappers(DETAILED_EVENT_FIELDS)
+
+
+def _map_message(mappers, message: Message) -> Optional[Row]:
+    mapper = mappers.get(message.__id__)
+    if mapper is None:
+        return None
+    columns, get = mapper
+    return Row(zip(columns, get(message)))
+
+
+def handle_normal_message(message: Message) -> Optional[Row]:
+    return _map_message(_NORMAL_EVENT_MAPPERS, message)
+
+
+def handle_message(message: Message) -> Optional[Row]:
+    return _map_message(_DETAILED_EVENT_MAPPERS, message)
+
+
+# Sessions stay in memory until they are closed, so string fields are
+# copied out of the (possibly lazy) message instead of keeping a view on
+# the kafka batch alive
+
+def _copy_fields(columns: Dict[str, str], strings=()) -> Callable[[Row, Message], None]:
+    """Session updater copying message attributes {column: attribute}, `strings` columns are converted with str"""
+    plain_columns, get_plain = _columns_getter({c: a for c, a in columns.items() if c not in strings})
+    str_columns, get_str = _columns_getter({c: a for c, a in columns.items() if c in strings})
+
+    def update(n: Row, message: Message):
+        if plain_columns:
+            n.update(zip(plain_columns, get_plain(message)))
+        if str_columns:
+            n.update(zip(str_columns, map(str, get_str(message))))
+    return update
+
+
+def _count(column: str) -> Callable[[Row, Message], None]:
+    """Session updater counting the messages in `column`"""
+    def update(n: Row, message: Message):
+        n[column] = (n.get(column) or 0) + 1
+    return update
+
+
+def _session_end(n: Row, message: SessionEnd):
+    n.session_end_timestamp = message.timestamp
+    try:
+        n.session_duration = n.session_end_timestamp - n.session_start_timestamp
+    except TypeError:
+        pass
+
+
+_copy_page_event = _copy_fields({'referrer': 'referrer',
+                                 'first_contentful_paint': 'first_contentful_paint',
+                                 'speed_index': 'speed_index',
+                                 'timing_time_to_interactive': 'time_to_interactive',
+                                 'visually_complete': 'visually_complete'}, strings=('referrer',))
+_count_urls = _count('urls_count')
+
+
+def _page_event(n: Row, message: PageEvent):
+    _copy_page_event(n, message)
+    _count_urls(n, message)
+
+
+SESSION_UPDATERS: Dict[type, Callable[[Row, Message], None]] = {
+    SessionStart: _copy_fields({'session_start_timestamp': 'timestamp',
+                                'user_uuid': 'user_uuid',
+                                'user_agent': 'user_agent',
+                                'user_os': 'user_os',
+                                'user_os_version': 'user_os_version',
+                                'user_browser': 'user_browser',
+                                'user_browser_version': 'user_browser_version',
+                                'user_device': 'user_device',
+                                'user_device_type': 'user_device_type',
+                                'user_device_memory_size': 'user_device_memory_size',
+                                'user_device_heap_size': 'user_device_heap_size',
+                                'user_country': 'user_country'},
+                               strings=('user_uuid', 'user_agent', 'user_os', 'user_os_version', 'user_browser',
+                                        'user_browser_version', 'user_device', 'user_device_type', 'user_country')),
+    SessionEnd: _session_end,
+    BatchMeta: _copy_fields({'batchmeta_page_no': 'page_no',
+                             'batchmeta_first_index': 'first_index',
+                             'batchmeta_timestamp': 'timestamp'}),
+    BatchMetadata: _copy_fields({'batchmetadata_version': 'version',
+                                 'batchmetadata_page_no': 'page_no',
+                                 'batchmetadata_first_index': 'first_index',
+                                 'batchmetadata_timestamp': 'timestamp',
+                                 'batchmetadata_location': 'location'}),
+    PartitionedMessage: _copy_fields({'partitionedmessage_part_no': 'part_no',
+                                      'partitionedmessage_part_total': 'part_total'}),
+    ConnectionInformation: _copy_fields({'connection_effective_bandwidth': 'downlink',
+                                         'connection_type': 'type'}, strings=('connection_type',)),
+    Metadata: _copy_fields({'metadata_key': 'key',
+                            'metadata_value': 'value'}, strings=('metadata_key', 'metadata_value')),
+    PageEvent: _page_event,
+    PerformanceTrackAggr: _copy_fields({'avg_cpu': 'avg_cpu',
+                                        'avg_fps': 'avg_fps',
+                                        'max_cpu': 'max_cpu',
+                                        'max_fps': 'max_fps',
+                                        'max_total_js_heap_size': 'max_total_js_heap_size',
+                                        'max_used_js_heap_size': 'max_used_js_heap_size'}),
+    UserID: _copy_fields({'user_id': 'id'}, strings=('user_id',)),
+    UserAnonymousID: _copy_fields({'user_anonymous_id': 'id'}, strings=('user_anonymous_id',)),
+    JSException: _count('js_exceptions_count'),
+    JSExceptionDeprecated: _count('js_exceptions_count'),
+    InputEvent: _count('inputs_count'),
+    MouseClick: _count('clicks_count'),
+    IssueEvent: _count('issues_count'),
+    IssueEventDeprecated: _count('issues_count'),
+}
+
+_SESSION_UPDATERS = {message_class.__id__: update for message_class, update in SESSION_UPDATERS.items()}
+
+
+def handle_session(n: Row, message: Message) -> Optional[Row]:
 
     if not n:
-        n = Session()
-
-    if isinstance(message, SessionStart):
-        n.session_start_timestamp = message.timestamp
-
-        n.user_uuid = message.user_uuid
-        n.user_agent = message.user_agent
-        n.user_os = message.user_os
-        n.user_os_version = message.user_os_version
-        n.user_browser = message.user_browser
-        n.user_browser_version = message.user_browser_version
-        n.user_device = message.user_device
-        n.user_device_type = message.user_device_type
-        n.user_device_memory_size = message.user_device_memory_size
-        n.user_device_heap_size = message.user_device_heap_size
-        n.user_country = message.user_country
-        return n
-
-    if isinstance(message, SessionEnd):
-        n.session_end_timestamp = message.timestamp
-        try:
-            n.session_duration = n.session_end_timestamp - n.session_start_timestamp
-        except TypeError:
-            pass
-        return n
-
-    if isinstance(message, BatchMeta):
-        n.batchmeta_page_no = message.page_no
-        n.batchmeta_first_index = message.first_index
-        n.batchmeta_timestamp = message.timestamp
-        return n
-
-    if isinstance(message, BatchMetadata):
-        n.batchmetadata_version = message.version
-        n.batchmetadata_page_no = message.page_no
-        n.batchmetadata_first_index = message.first_index
-        n.batchmetadata_timestamp = message.timestamp
-        n.batchmetadata_location = message.location
-        return n
-
-
-    if isinstance(message, PartitionedMessage):
-        n.partitionedmessage_part_no = message.part_no
-        n.partitionedmessage_part_total = message.part_total
-        return n
-
-    # if isinstance(message, IOSBatchMeta):
-    #     n.iosbatchmeta_page_no = message.page_no
-    #     n.iosbatchmeta_first_index = message.first_index
-    #     n.iosbatchmeta_timestamp = message.timestamp
-    #     return n
-
-    if isinstance(message, ConnectionInformation):
-        n.connection_effective_bandwidth = message.downlink
-        n.connection_type = message.type
-        return n
-
-    if isinstance(message, Metadata):
-        n.metadata_key = message.key
-        n.metadata_value = message.value
-        return n
-
-    if isinstance(message, PageEvent):
-        n.referrer = message.referrer
-        n.first_contentful_paint = message.first_contentful_paint
-        n.speed_index = message.speed_index
-        n.timing_time_to_interactive = message.time_to_interactive
-        n.visually_complete = message.visually_complete
-        try:
-            n.urls_count += 1
-        except TypeError:
-            n.urls_count = 1
-        #itry:
-        #    n.urls.append(message.url)
-        #except AttributeError:
-        #    n.urls = [message.url]
-        return n
-
-    if isinstance(message, PerformanceTrackAggr):
-        n.avg_cpu = message.avg_cpu
-        n.avg_fps = message.avg_fps
-        n.max_cpu = message.max_cpu
-        n.max_fps = message.max_fps
-        n.max_total_js_heap_size = message.max_total_js_heap_size
-        n.max_used_js_heap_size = message.max_used_js_heap_size
-        return n
-
-    if isinstance(message, UserID):
-        n.user_id = message.id
-        return n
-
-    if isinstance(message, UserAnonymousID):
-        n.user_anonymous_id = message.id
-        return n
-
-    if isinstance(message, JSException) or isinstance(message, JSExceptionDeprecated):
-        try:
-            n.js_exceptions_count += 1
-        except TypeError:
-            n.js_exceptions_count = 1
-        return n
-
-    #if isinstance(message, LongTask):
-    #    try:
-    #        n.long_tasks_total_duration += message.duration
-    #    except TypeError:
-    #        n.long_tasks_total_duration = message.duration
-
-    #    try:
-    #        if n.long_tasks_max_duration > message.duration:
-    #            n.long_tasks_max_duration = message.duration
-    #    except TypeError:
-    #        n.long_tasks_max_duration = message.duration
-
-    #    try:
-    #        n.long_tasks_count += 1
-    #    except TypeError:
-    #        n.long_tasks_count = 1
-    #    return n
-
-    if isinstance(message, InputEvent):
-        try:
-            n.inputs_count += 1
-        except TypeError:
-            n.inputs_count = 1
-        return n
-
-    if isinstance(message, MouseClick):
-        try:
-            n.clicks_count += 1
-        except TypeError:
-            n.clicks_count = 1
-        return n
-
-    if isinstance(message, IssueEvent) or isinstance(message, IssueEventDeprecated):
-        try:
-            n.issues_count += 1
-        except TypeError:
-            n.issues_count = 1
-
-        #try:
-        #    n.issues.append(message.type)
-        #except AttributeError:
-        #    n.issues = [message.type]
-        return n
-
-
-def handle_message(message: Message) -> Optional[DetailedEvent]:
-    n = DetailedEvent()
-
-    # if isinstance(message, SessionEnd):
-    #     n.sessionend = True
-    #     n.sessionend_timestamp = message.timestamp
-    #     return n
-
-    if isinstance(message, Timestamp):
-        n.timestamp_timestamp = message.timestamp
-        return n
-
-    if isinstance(message, SessionStart):
-        n.sessionstart_trackerversion = message.tracker_version
-        n.sessionstart_revid = message.rev_id
-        n.sessionstart_timestamp = message.timestamp
-        n.sessionstart_useruuid = message.user_uuid
-        n.sessionstart_useragent = message.user_agent
-        n.sessionstart_useros = message.user_os
-        n.sessionstart_userosversion = message.user_os_version
-        n.sessionstart_userbrowser = message.user_browser
-        n.sessionstart_userbrowserversion = message.user_browser_version
-        n.sessionstart_userdevice = message.user_device
-        n.sessionstart_userdevicetype = message.user_device_type
-        n.sessionstart_userdevicememorysize = message.user_device_memory_size
-        n.sessionstart_userdeviceheapsize = message.user_device_heap_size
-        n.sessionstart_usercountry = message.user_country
-        return n
-
-    if isinstance(message, CreateIFrameDocument):
-        n.create_iframedocument_frame_id = message.frame_id
-        n.create_iframedocument_id = message.id
-        return n
-
-    if isinstance(message, SetViewportSize):
-        n.setviewportsize_width = message.width
-        n.setviewportsize_height = message.height
-        return n
-
-    if isinstance(message, SetViewportScroll):
-        n.setviewportscroll_x = message.x
-        n.setviewportscroll_y = message.y
-        return n
-
-    if isinstance(message, SetNodeScroll):
-        n.setnodescroll_id = message.id
-        n.setnodescroll_x = message.x
-        n.setnodescroll_y = message.y
-        return n
-
-    if isinstance(message, ConsoleLog):
-        n.consolelog_level = message.level
-        n.consolelog_value = message.value
-        return n
-
-    if isinstance(message, PageLoadTiming):
-        n.pageloadtiming_requeststart = message.request_start
-        n.pageloadtiming_responsestart = message.response_start
-        n.pageloadtiming_responseend = message.response_end
-        n.pageloadtiming_domcontentloadedeventstart = message.dom_content_loaded_event_start
-        n.pageloadtiming_domcontentloadedeventend = message.dom_content_loaded_event_end
-        n.pageloadtiming_loadeventstart = message.load_event_start
-        n.pageloadtiming_loadeventend = message.load_event_end
-        n.pageloadtiming_firstpaint = message.first_paint
-        n.pageloadtiming_firstcontentfulpaint = message.first_contentful_paint
-        return n
-
-    if isinstance(message, PageRenderTiming):
-        n.pagerendertiming_speedindex = message.speed_index
-        n.pagerendertiming_visuallycomplete = message.visually_complete
-        n.pagerendertiming_timetointeractive = message.time_to_interactive
-        return n
-
-    # if isinstance(message, ResourceTiming):
-    #     n.resourcetiming_timestamp = message.timestamp
-    #     n.resourcetiming_duration = message.duration
-    #     n.resourcetiming_ttfb = message.ttfb
-    #     n.resourcetiming_headersize = message.header_size
-    #     n.resourcetiming_encodedbodysize = message.encoded_body_size
-    #     n.resourcetiming_decodedbodysize = message.decoded_body_size
-    #     n.resourcetiming_url = message.url
-    #     n.resourcetiming_initiator = message.initiator
-    #     return n
-
-
-
-    if isinstance(message, IntegrationEvent):
-        n.integrationevent_timestamp = message.timestamp
-        n.integrationevent_source = message.source
-        n.integrationevent_name = message.name
-        n.integrationevent_message = message.message
-        n.integrationevent_payload = message.payload
-        return n
-
-
-    if isinstance(message, UserID):
-        n.userid_id = message.id
-        return n
-
-    if isinstance(message, UserAnonymousID):
-        n.useranonymousid_id = message.id
-        return n
-
-    if isinstance(message, Metadata):
-        n.metadata_key = message.key
-        n.metadata_value = message.value
-        return n
-
-    if isinstance(message, BatchMeta):
-        n.batchmeta_page_no = message.page_no
-        n.batchmeta_first_index = message.first_index
-        n.batchmeta_timestamp = message.timestamp
-        return n
-
-    if isinstance(message, BatchMetadata):
-        n.batchmetadata_version = message.version
-        n.batchmetadata_page_no = message.page_no
-        n.batchmetadata_first_index = message.first_index
-        n.batchmetadata_timestamp = message.timestamp
-        n.batchmetadata_location = message.location
-        return n
-
-    if isinstance(message, PartitionedMessage):
-        n.partitionedmessage_part_no = message.part_no
-        n.partitionedmessage_part_total = message.part_total
-        return n
-
-    if isinstance(message, InputChange):
-        n.inputchange_id=message.id
-        n.inputchange_value=message.value
-        n.inputchange_value_masked=message.value_masked
-        n.inputchange_label=message.label
-        n.inputchange_hesitation_time=message.hesitation_time
-        n.inputchange_input_duration=message.input_duration
-        return n
-
-
-    if isinstance(message, SelectionChange):
-        n.selectionchange_selection_start=message.selection_start
-        n.selectionchange_selection_end=message.selection_end
-        n.selectionchange_selection=message.selection
-        return n
-
-    if isinstance(message, MouseThrashing):
-        n.mousethrashing_timestamp=message.timestamp
-        return n
-
-    if isinstance(message, UnbindNodes):
-        n.unbindnodes_total_removed_percent=message.total_removed_percent
-        return n
-
-
-    if isinstance(message, ResourceTiming):
-        n.resourcetiming_timestamp=message.timestamp
-        n.resourcetiming_duration=message.duration
-        n.resourcetiming_ttfb=message.ttfb
-        n.resourcetiming_header_size=message.header_size
-        n.resourcetiming_encoded_body_size=message.encoded_body_size
-        n.resourcetiming_decoded_body_size=message.decoded_body_size
-        n.resourcetiming_url=message.url
-        n.resourcetiming_initiator=message.initiator
-        n.resourcetiming_transferred_size=message.transferred_size
-        n.resourcetiming_cached=message.cached
-        return n
-
-
-    if isinstance(message, IssueEvent):
-        n.issueevent_message_id=message.message_id
-        n.issueevent_timestamp=message.timestamp
-        n.issueevent_type=message.type
-        n.issueevent_context_string=message.context_string
-        n.issueevent_context=message.context
-        n.issueevent_payload=message.payload
-        n.issueevent_url=message.url
-        return n
-
-    if isinstance(message, SessionEnd):
-        n.sessionend_timestamp=message.timestamp
-        n.sessionend_encryption_key=message.encryption_key
-        return n
-
-
-    if isinstance(message, SessionSearch):
-        n.sessionsearch_timestamp=message.timestamp
-        n.sessionsearch_partition=message.partition
-        return n
-
-
-    if isinstance(message, PerformanceTrack):
-        n.performancetrack_frames = message.frames
-        n.performancetrack_ticks = message.ticks
-        n.performancetrack_totaljsheapsize = message.total_js_heap_size
-        n.performancetrack_usedjsheapsize = message.used_js_heap_size
-        return n
-
-    if isinstance(message, PerformanceTrackAggr):
-        n.performancetrackaggr_timestampstart = message.timestamp_start
-        n.performancetrackaggr_timestampend = message.timestamp_end
-        n.performancetrackaggr_minfps = message.min_fps
-        n.performancetrackaggr_avgfps = message.avg_fps
-        n.performancetrackaggr_maxfps = message.max_fps
-        n.performancetrackaggr_mincpu = message.min_cpu
-        n.performancetrackaggr_avgcpu = message.avg_cpu
-        n.performancetrackaggr_maxcpu = message.max_cpu
-        n.performancetrackaggr_mintotaljsheapsize = message.min_total_js_heap_size
-        n.performancetrackaggr_avgtotaljsheapsize = message.avg_total_js_heap_size
-        n.performancetrackaggr_maxtotaljsheapsize = message.max_total_js_heap_size
-        n.performancetrackaggr_minusedjsheapsize = message.min_used_js_heap_size
-        n.performancetrackaggr_avgusedjsheapsize = message.avg_used_js_heap_size
-        n.performancetrackaggr_maxusedjsheapsize = message.max_used_js_heap_size
-        return n
-
-    if isinstance(message, ConnectionInformation):
-        n.connectioninformation_downlink = message.downlink
-        n.connectioninformation_type = message.type
-        return n
-
-    if isinstance(message, PageEvent):
-        n.pageevent_messageid = message.message_id
-        n.pageevent_timestamp = message.timestamp
-        n.pageevent_url = message.url
-        n.pageevent_referrer = message.referrer
-        n.pageevent_loaded = message.loaded
-        n.pageevent_requeststart = message.request_start
-        n.pageevent_responsestart = message.response_start
-        n.pageevent_responseend = message.response_end
-        n.pageevent_domcontentloadedeventstart = message.dom_content_loaded_event_start
-        n.pageevent_domcontentloadedeventend = message.dom_content_loaded_event_end
-        n.pageevent_loadeventstart = message.load_event_start
-        n.pageevent_loadeventend = message.load_event_end
-        n.pageevent_firstpaint = message.first_paint
-        n.pageevent_firstcontentfulpaint = message.first_contentful_paint
-        n.pageevent_speedindex = message.speed_index
-        return n
-
-    if isinstance(message, InputEvent):
-        n.inputevent_messageid = message.message_id
-        n.inputevent_timestamp = message.timestamp
-        n.inputevent_value = message.value
-        n.inputevent_valuemasked = message.value_masked
-        n.inputevent_label = message.label
-        return n
-
-    if isinstance(message, CustomEvent):
-        n.customevent_name = message.name
-        n.customevent_payload = message.payload
-        return n
-
-    if isinstance(message, LoadFontFace):
-        n.loadfontface_parent_id = message.parent_id
-        n.loadfontface_family = message.family
-        n.loadfontface_source = message.source
-        n.loadfontface_descriptors = message.descriptors
-        return n
-
-    if isinstance(message, SetNodeFocus):
-        n.setnodefocus_id = message.id
-        return n
-
-    if isinstance(message, AdoptedSSReplaceURLBased):
-        n.adoptedssreplaceurlbased_sheet_id = message.sheet_id
-        n.adoptedssreplaceurlbased_text = message.text
-        n.adoptedssreplaceurlbased_base_url = message.base_url
-        return n
-
-    if isinstance(message, AdoptedSSReplace):
-        n.adoptedssreplace_sheet_id = message.sheet_id
-        n.adoptedssreplace_text = message.text
-        return n
-
-    if isinstance(message, AdoptedSSInsertRuleURLBased):
-        n.adoptedssinsertruleurlbased_sheet_id = message.sheet_id
-        n.adoptedssinsertruleurlbased_rule = message.rule
-        n.adoptedssinsertruleurlbased_index = message.index
-        n.adoptedssinsertruleurlbased_base_url = message.base_url
-        return n
-
-    if isinstance(message, AdoptedSSInsertRule):
-        n.adoptedssinsertrule_sheet_id = message.sheet_id
-        n.adoptedssinsertrule_rule = message.rule
-        n.adoptedssinsertrule_index = message.index
-        return n
-
-    if isinstance(message, AdoptedSSDeleteRule):
-        n.adoptedssdeleterule_sheet_id = message.sheet_id
-        n.adoptedssdeleterule_index = message.index
-        return n
-
-    if isinstance(message, AdoptedSSAddOwner):
-        n.adoptedssaddowner_sheet_id = message.sheet_id
-        n.adoptedssaddowner_id = message.id
-        return n
-
-    if isinstance(message, AdoptedSSRemoveOwner):
-        n.adoptedssremoveowner_sheet_id = message.sheet_id
-        n.adoptedssremoveowner_id = message.id
-        return n
-
-    if isinstance(message, JSException):
-        n.jsexception_name = message.name
-        n.jsexception_message = message.message
-        n.jsexception_payload = message.payload
-        n.jsexception_metadata = message.metadata
-        return n
-
-    if isinstance(message, Zustand):
-        n.zustand_mutation = message.mutation
-        n.zustand_state = message.state
-        return n
-
-    # if isinstance(message, CreateDocument):
-    #     n.createdocument = True
-    #     return n
-    #
-    # if isinstance(message, CreateElementNode):
-    #     n.createelementnode_id = message.id
-    #     if isinstance(message.parent_id, tuple):
-    #         n.createelementnode_parentid = message.parent_id[0]
-    #     else:
-    #         n.createelementnode_parentid = message.parent_id
-    #     return n
-
-    # if isinstance(message, CSSInsertRule):
-    #     n.cssinsertrule_stylesheetid = message.id
-    #     n.cssinsertrule_rule = message.rule
-    #     n.cssinsertrule_index = message.index
-    #     return n
-
-    # if isinstance(message, CSSInsertRuleURLBased):
-    #     n.cssinsertrule_urlbased_id = message.id
-    #     n.cssinsertrule_urlbased_rule = message.rule
-    #     n.cssinsertrule_urlbased_index = message.index
-    #     n.cssinsertrule_urlbased_base_url = message.base_url
-    #
-    # if isinstance(message, CSSDeleteRule):
-    #     n.cssdeleterule_stylesheetid = message.id
-    #     n.cssdeleterule_index = message.index
-    #     return n
-
-    if isinstance(message, Fetch):
-        n.fetch_method = message.method
-        n.fetch_url = message.url
-        n.fetch_request = message.request
-        n.fetch_status = message.status
-        n.fetch_timestamp = message.timestamp
-        n.fetch_duration = message.duration
-        return n
-
-    if isinstance(message, SetNodeAttributeDict):
-        n.setnodeattributedict_id = message.id,
-        n.setnodeattributedict_name_key = message.name_key
-        n.setnodeattributedict_value_key = message.value_key
-        return n
-
-    if isinstance(message, Profiler):
-        n.profiler_name = message.name
-        n.profiler_duration = message.duration
-        n.profiler_args = message.args
-        n.profiler_result = message.result
-        return n
-
-    if isinstance(message, GraphQL):
-        n.graphql_operationkind = message.operation_kind
-        n.graphql_operationname = message.operation_name
-        n.graphql_variables = message.variables
-        n.graphql_response = message.response
-        return n
-
-    if isinstance(message, MouseClick):
-        n.mouseclick_id = message.id
-        n.mouseclick_hesitationtime = message.hesitation_time
-        n.mouseclick_label = message.label
-        n.mouseclick_selector = message.selector
-        return n
-
-    if isinstance(message, SetPageLocation):
-        n.setpagelocation_url = message.url
-        n.setpagelocation_referrer = message.referrer
-        n.setpagelocation_navigationstart = message.navigation_start
-        return n
-
-    if isinstance(message, MouseMove):
-        n.mousemove_x = message.x
-        n.mousemove_y = message.y
-        return n
-
-    if isinstance(message, LongTask):
-        n.longtasks_timestamp = message.timestamp
-        n.longtasks_duration = message.duration
-        n.longtask_context = message.context
-        n.longtask_containertype = message.container_type
-        n.longtasks_containersrc = message.container_src
-        n.longtasks_containerid = message.container_id
-        n.longtasks_containername = message.container_name
-        return n
-
-    #if isinstance(message, IssueEvent):
-    #    n.issueevent_message_id = message.message_id
-    #    n.issueevent_timestamp = message.timestamp
-    #    n.issueevent_type = message.type
-    #    n.issueevent_context_string = message.context_string
-    #    n.issueevent_context = message.context
-    #    n.issueevent_payload = message.payload
-    #    n.issueevent_url = message.url
-    #    return n
-
-    if isinstance(message, TechnicalInfo):
-        n.technicalinfo_type = message.type
-        n.technicalinfo_value = message.value
-        return n
-
-    if isinstance(message, CustomIssue):
-        n.customissue_name = message.name
-        n.customissue_payload = message.payload
-        return n
-
-    if isinstance(message, AssetCache):
-        n.asset_cache_url = message.url
-        return n
-
-    if isinstance(message, IOSSessionStart):
-        n.iossessionstart_timestamp = message.timestamp
-        n.iossessionstart_projectid = message.project_id
-        n.iossessionstart_trackerversion = message.tracker_version
-        n.iossessionstart_revid = message.rev_id
-        n.iossessionstart_useruuid = message.user_uuid
-        n.iossessionstart_useros = message.user_os
-        n.iossessionstart_userosversion = message.user_os_version
-        n.iossessionstart_userdevice = message.user_device
-        n.iossessionstart_userdevicetype = message.user_device_type
-        n.iossessionstart_usercountry = message.user_country
-        return n
-
-    if isinstance(message, IOSSessionEnd):
-        n.iossessionend_timestamp = message.timestamp
-        return n
-
-    if isinstance(message, IOSMetadata):
-        n.iosmetadata_timestamp = message.timestamp
-        n.iosmetadata_length = message.length
-        n.iosmetadata_key = message.key
-        n.iosmetadata_value = message.value
-        return n
-
-    if isinstance(message, IOSBatchMeta):
-        n.iosbatchmeta_lenght = message.length
-        n.iosbatchmeta_first_index = message.first_index
-        n.iosbatchmeta_timestamp = message.timestamp
-        return n
-
-    if isinstance(message, IOSUserID):
-        n.iosuserid_timestamp = message.timestamp
-        n.iosuserid_length = message.length
-        n.iosuserid_value = message.value
-        return n
-
-    if isinstance(message, IOSUserAnonymousID):
-        n.iosuseranonymousid_timestamp = message.timestamp
-        n.iosuseranonymousid_length = message.length
-        n.iosuseranonymousid_value = message.value
-        return n
-
-    if isinstance(message, IOSScreenEnter):
-        n.iosscreenenter_timestamp = message.timestamp
-        n.iosscreenenter_length = message.length
-        n.iosscreenenter_title = message.title
-        n.iosscreenenter_view_name = message.view_name
-        return n
-
-    if isinstance(message, IOSScreenLeave):
-        n.iosscreenleave_timestamp = message.timestamp
-        n.iosscreenleave_length = message.length
-        n.iosscreenleave_title = message.title
-        n.iosscreenleave_viewname = message.view_name
-        return n
-
-    if isinstance(message, IOSScreenChanges):
-        n.iosscreenchanges_timestamp = message.timestamp
-        n.iosscreenchanges_length = message.length
-        n.iosscreenchanges_x = message.x
-        n.iosscreenchanges_y = message.y
-        n.iosscreenchanges_width = message.width
-        n.iosscreenchanges_height = message.height
-        return n
-
-    if isinstance(message, IOSClickEvent):
-        n.iosclickevent_timestamp = message.timestamp
-        n.iosclickevent_length = message.length
-        n.iosclickevent_label = message.label
-        n.iosclickevent_x = message.x
-        n.iosclickevent_y = message.y
-        return n
-
-    if isinstance(message, IOSInputEvent):
-        n.iosinputevent_timestamp = message.timestamp
-        n.iosinputevent_length = message.length
-        n.iosinputevent_value_masked = message.value_masked
-        n.iosinputevent_label = message.label
-        return n
-
-    if isinstance(message, IOSLog):
-        n.ioslog_timestamp = message.timestamp
-        n.ioslog_length = message.length
-        n.ioslog_severity = message.severity
-        n.ioslog_content = message.content
-        return n
-
-    if isinstance(message, IOSNetworkCall):
-        n.iosnetworkcall_timestamp = message.timestamp
-        n.iosnetworkcall_length = message.length
-        n.iosnetworkcall_duration = message.duration
-        n.iosnetworkcall_headers = message.headers
-        n.iosnetworkcall_body = message.body
-        n.iosnetworkcall_url = message.url
-        n.iosnetworkcall_success = message.success
-        n.iosnetworkcall_method = message.method
-        n.iosnetworkcall_status = message.status
-        return n
-
-    if isinstance(message, IOSIssueEvent):
-        n.iosissueevent_timestamp = message.timestamp
-        n.iosissueevent_type = message.type
-        n.iosissueevent_context_string = message.context_string
-        n.iosissueevent_context = message.context
-        n.iosissueevent_payload = message.payload
-        return n
-
-    if isinstance(message, IOSCustomEvent):
-        n.ioscustomevent_timestamp = message.timestamp
-        n.ioscustomevent_length = message.length
-        n.ioscustomevent_name = message.name
-        n.ioscustomevent_payload = message.payload
-        return n
-
-    if isinstance(message, IOSInternalError):
-        n.iosinternalerror_timestamp = message.timestamp
-        n.iosinternalerror_length = message.length
-        n.iosinternalerror_content = message.content
-        return n
-
-    if isinstance(message, IOSCrash):
-        n.ioscrash_timestamp = message.timestamp
-        n.ioscrash_length = message.length
-        n.ioscrash_name = message.name
-        n.ioscrash_reason = message.reason
-        n.ioscrash_stacktrace = message.stacktrace
-        return n
-
-    if isinstance(message, IOSPerformanceEvent):
-        n.iosperformanceevent_timestamp = message.timestamp
-        n.iosperformanceevent_length = message.length
-        n.iosperformanceevent_name = message.name
-        n.iosperformanceevent_value = message.value
-        return n
-
-    if isinstance(message, IOSPerformanceAggregated):
-        n.iosperformanceaggregated_timestampstart = message.timestamp_start
-        n.iosperformanceaggregated_timestampend = message.timestamp_end
-        n.iosperformanceaggregated_minfps = message.min_fps
-        n.iosperformanceaggregated_avgfps = message.avg_fps
-        n.iosperformanceaggregated_maxfps = message.max_fps
-        n.iosperformanceaggregated_mincpu = message.min_cpu
-        n.iosperformanceaggregated_avgcpu = message.avg_cpu
-        n.iosperformanceaggregated_maxcpu = message.max_cpu
-        n.iosperformanceaggregated_minmemory = message.min_memory
-        n.iosperformanceaggregated_avgmemory = message.avg_memory
-        n.iosperformanceaggregated_maxmemory = message.max_memory
-        n.iosperformanceaggregated_minbattery = message.min_battery
-        n.iosperformanceaggregated_avgbattery = message.avg_battery
-        n.iosperformanceaggregated_maxbattery = message.max_battery
-        return n
-    return None
+        n = Row()
+
+    update = _SESSION_UPDATERS.get(message.__id__)
+    if update is None:
+        return None
+    update(n, message)
+    return n
+
+
+# Message types mapped by each handler above. They make the decoder's interest set,
+# every other message of a batch is skipped without being decoded.
+NORMAL_EVENT_MESSAGES = tuple(NORMAL_EVENT_FIELDS)
+
+SESSION_MESSAGES = tuple(SESSION_UPDATERS)
+
+DETAILED_EVENT_MESSAGES = tuple(DETAILED_EVENT_FIELDS)
+
+
+def interest_set(level: str) -> Set[int]:
+    """Ids of the messages needed to build the `level` ('normal' or 'detailed') events and the sessions"""
+    if level == 'detailed':
+        events = DETAILED_EVENT_MESSAGES
+    elif level == 'normal':
+        events = NORMAL_EVENT_MESSAGES
+    else:
+        raise ValueError(f"Unknown events level {level}")
+    return {message.__id__ for message in events + SESSION_MESSAGES}
@@ -3,11 +3,16 @@
 from abc import ABC
 
 class Message(ABC):
-    pass
+    # Messages are built by the thousand per batch, __slots__ keeps them free of a per-instance __dict__
+    __slots__ = ()
+
+    def to_dict(self) -> dict:
+        return {attr: getattr(self, attr) for attr in self.__slots__}
 
 
 class Timestamp(Message):
     __id__ = 0
+    __slots__ = ('timestamp',)
 
     def __init__(self, timestamp):
         self.timestamp = timestamp
@@ -15,6 +20,7 @@ class Timestamp(Message):
 
 class SessionStart(Message):
     __id__ = 1
+    __slots__ = ('timestamp', 'project_id', 'tracker_version', 'rev_id', 'user_uuid', 'user_agent', 'user_os', 'user_os_version', 'user_browser', 'user_browser_version', 'user_device', 'user_device_type', 'user_device_memory_size', 'user_device_heap_size', 'user_country', 'user_id',)
 
     def __init__(self, timestamp, project_id, tracker_version, rev_id, user_uuid, user_agent, user_os, user_os_version, user_browser, user_browser_version, user_device, user_device_type, user_device_memory_size, user_device_heap_size, user_country, user_id):
         self.timestamp = timestamp
@@ -37,6 +43,7 @@ class SessionStart(Message):
 
 class SessionEndDeprecated(Message):
     __id__ = 3
+    __slots__ = ('timestamp',)
 
     def __init__(self, timestamp):
         self.timestamp = timestamp
@@ -44,6 +51,7 @@ class SessionEndDeprecated(Message):
 
 class SetPageLocation(Message):
     __id__ = 4
+    __slots__ = ('url', 'referrer', 'navigation_start',)
 
     def __init__(self, url, referrer, navigation_start):
         self.url = url
@@ -53,6 +61,7 @@ class SetPageLocation(Message):
 
 class SetViewportSize(Message):
     __id__ = 5
+    __slots__ = ('width', 'height',)
 
     def __init__(self, width, height):
         self.width = width
@@ -61,6 +70,7 @@ class SetViewportSize(Message):
 
 class SetViewportScroll(Message):
     __id__ = 6
+    __slots__ = ('x', 'y',)
 
     def __init__(self, x, y):
         self.x = x
@@ -69,6 +79,7 @@ class SetViewportScroll(Message):
 
 class CreateDocument(Message):
     __id__ = 7
+    __slots__ = ()
 
     def __init__(self, ):
         pass
@@ -76,6 +87,7 @@ class CreateDocument(Message):
 
 class CreateElementNode(Message):
     __id__ = 8
+    __slots__ = ('id', 'parent_id', 'index', 'tag', 'svg',)
 
     def __init__(self, id, parent_id, index, tag, svg):
         self.id = id
@@ -87,6 +99,7 @@ class CreateElementNode(Message):
 
 class CreateTextNode(Message):
     __id__ = 9
+    __slots__ = ('id', 'parent_id', 'index',)
 
     def __init__(self, id, parent_id, index):
         self.id = id
@@ -96,6 +109,7 @@ class CreateTextNode(Message):
 
 class MoveNode(Message):
     __id__ = 10
+    __slots__ = ('id', 'parent_id', 'index',)
 
     def __init__(self, id, parent_id, index):
         self.id = id
@@ -105,6 +119,7 @@ class MoveNode(Message):
 
 class RemoveNode(Message):
     __id__ = 11
+    __slots__ = ('id',)
 
     def __init__(self, id):
         self.id = id
@@ -112,6 +127,7 @@ class RemoveNode(Message):
 
 class SetNodeAttribute(Message):
     __id__ = 12
+    __slots__ = ('id', 'name', 'value',)
 
     def __init__(self, id, name, value):
         self.id = id
@@ -121,6 +137,7 @@ class SetNodeAttribute(Message):
 
 class RemoveNodeAttribute(Message):
     __id__ = 13
+    __slots__ = ('id', 'name',)
 
     def __init__(self, id, name):
         self.id = id
@@ -129,6 +146,7 @@ class RemoveNodeAttribute(Message):
 
 class SetNodeData(Message):
     __id__ = 14
+    __slots__ = ('id', 'data',)
 
     def __init__(self, id, data):
         self.id = id
@@ -137,6 +155,7 @@ class SetNodeData(Message):
 
 class SetCSSData(Message):
     __id__ = 15
+    __slots__ = ('id', 'data',)
 
     def __init__(self, id, data):
         self.id = id
@@ -145,6 +164,7 @@ class SetCSSData(Message):
 
 class SetNodeScroll(Message):
     __id__ = 16
+    __slots__ = ('id', 'x', 'y',)
 
     def __init__(self, id, x, y):
         self.id = id
@@ -154,6 +174,7 @@ class SetNodeScroll(Message):
 
 class SetInputTarget(Message):
     __id__ = 17
+    __slots__ = ('id', 'label',)
 
     def __init__(self, id, label):
         self.id = id
@@ -162,6 +183,7 @@ class SetInputTarget(Message):
 
 class SetInputValue(Message):
     __id__ = 18
+    __slots__ = ('id', 'value', 'mask',)
 
     def __init__(self, id, value, mask):
         self.id = id
@@ -171,6 +193,7 @@ class SetInputValue(Message):
 
 class SetInputChecked(Message):
     __id__ = 19
+    __slots__ = ('id', 'checked',)
 
     def __init__(self, id, checked):
         self.id = id
@@ -179,6 +202,7 @@ class SetInputChecked(Message):
 
 class MouseMove(Message):
     __id__ = 20
+    __slots__ = ('x', 'y',)
 
     def __init__(self, x, y):
         self.x = x
@@ -187,6 +211,7 @@ class MouseMove(Message):
 
 class NetworkRequest(Message):
     __id__ = 21
+    __slots__ = ('type', 'method', 'url', 'request', 'response', 'status', 'timestamp', 'duration',)
 
     def __init__(self, type, method, url, request, response, status, timestamp, duration):
         self.type = type
@@ -201,6 +226,7 @@ class NetworkRequest(Message):
 
 class ConsoleLog(Message):
     __id__ = 22
+    __slots__ = ('level', 'value',)
 
     def __init__(self, level, value):
         self.level = level
@@ -209,6 +235,7 @@ class ConsoleLog(Message):
 
 class PageLoadTiming(Message):
     __id__ = 23
+    __slots__ = ('request_start', 'response_start', 'response_end', 'dom_content_loaded_event_start', 'dom_content_loaded_event_end', 'load_event_start', 'load_event_end', 'first_paint', 'first_contentful_paint',)
 
     def __init__(self, request_start, response_start, response_end, dom_content_loaded_event_start, dom_content_loaded_event_end, load_event_start, load_event_end, first_paint, first_contentful_paint):
         self.request_start = request_start
@@ -224,6 +251,7 @@ class PageLoadTiming(Message):
 
 class PageRenderTiming(Message):
     __id__ = 24
+    __slots__ = ('speed_index', 'visually_complete', 'time_to_interactive',)
 
     def __init__(self, speed_index, visually_complete, time_to_interactive):
         self.speed_index = speed_index
@@ -233,6 +261,7 @@ class PageRenderTiming(Message):
 
 class JSExceptionDeprecated(Message):
     __id__ = 25
+    __slots__ = ('name', 'message', 'payload',)
 
     def __init__(self, name, message, payload):
         self.name = name
@@ -242,6 +271,7 @@ class JSExceptionDeprecated(Message):
 
 class IntegrationEvent(Message):
     __id__ = 26
+    __slots__ = ('timestamp', 'source', 'name', 'message', 'payload',)
 
     def __init__(self, timestamp, source, name, message, payload):
         self.timestamp = timestamp
@@ -253,6 +283,7 @@ class IntegrationEvent(Message):
 
 class CustomEvent(Message):
     __id__ = 27
+    __slots__ = ('name', 'payload',)
 
     def __init__(self, name, payload):
         self.name = name
@@ -261,6 +292,7 @@ class CustomEvent(Message):
 
 class UserID(Message):
     __id__ = 28
+    __slots__ = ('id',)
 
     def __init__(self, id):
         self.id = id
@@ -268,6 +300,7 @@ class UserID(Message):
 
 class UserAnonymousID(Message):
     __id__ = 29
+    __slots__ = ('id',)
 
     def __init__(self, id):
         self.id = id
@@ -275,6 +308,7 @@ class UserAnonymousID(Message):
 
 class Metadata(Message):
     __id__ = 30
+    __slots__ = ('key', 'value',)
 
     def __init__(self, key, value):
         self.key = key
@@ -283,6 +317,7 @@ class Metadata(Message):
 
 class PageEvent(Message):
     __id__ = 31
+    __slots__ = ('message_id', 'timestamp', 'url', 'referrer', 'loaded', 'request_start', 'response_start', 'response_end', 'dom_content_loaded_event_start', 'dom_content_loaded_event_end', 'load_event_start', 'load_event_end', 'first_paint', 'first_contentful_paint', 'speed_index', 'visually_complete', 'time_to_interactive',)
 
     def __init__(self, message_id, timestamp, url, referrer, loaded, request_start, response_start, response_end, dom_content_loaded_event_start, dom_content_loaded_event_end, load_event_start, load_event_end, first_paint, first_contentful_paint, speed_index, visually_complete, time_to_interactive):
         self.message_id = message_id
@@ -306,6 +341,7 @@ class PageEvent(Message):
 
 class InputEvent(Message):
     __id__ = 32
+    __slots__ = ('message_id', 'timestamp', 'value', 'value_masked', 'label',)
 
     def __init__(self, message_id, timestamp, value, value_masked, label):
         self.message_id = message_id
@@ -317,6 +353,7 @@ class InputEvent(Message):
 
 class CSSInsertRule(Message):
     __id__ = 37
+    __slots__ = ('id', 'rule', 'index',)
 
     def __init__(self, id, rule, index):
         self.id = id
@@ -326,6 +363,7 @@ class CSSInsertRule(Message):
 
 class CSSDeleteRule(Message):
     __id__ = 38
+    __slots__ = ('id', 'index',)
 
     def __init__(self, id, index):
         self.id = id
@@ -334,6 +372,7 @@ class CSSDeleteRule(Message):
 
 class Fetch(Message):
     __id__ = 39
+    __slots__ = ('method', 'url', 'request', 'response', 'status', 'timestamp', 'duration',)
 
     def __init__(self, method, url, request, response, status, timestamp, duration):
         self.method = method
@@ -347,6 +386,7 @@ class Fetch(Message):
 
 class Profiler(Message):
     __id__ = 40
+    __slots__ = ('name', 'duration', 'args', 'result',)
 
     def __init__(self, name, duration, args, result):
         self.name = name
@@ -357,6 +397,7 @@ class Profiler(Message):
 
 class OTable(Message):
     __id__ = 41
+    __slots__ = ('key', 'value',)
 
     def __init__(self, key, value):
         self.key = key
@@ -365,6 +406,7 @@ class OTable(Message):
 
 class StateAction(Message):
     __id__ = 42
+    __slots__ = ('type',)
 
     def __init__(self, type):
         self.type = type
@@ -372,6 +414,7 @@ class StateAction(Message):
 
 class Redux(Message):
     __id__ = 44
+    __slots__ = ('action', 'state', 'duration',)
 
     def __init__(self, action, state, duration):
         self.action = action
@@ -381,6 +424,7 @@ class Redux(Message):
 
 class Vuex(Message):
     __id__ = 45
+    __slots__ = ('mutation', 'state',)
 
     def __init__(self, mutation, state):
         self.mutation = mutation
@@ -389,6 +433,7 @@ class Vuex(Message):
 
 class MobX(Message):
     __id__ = 46
+    __slots__ = ('type', 'payload',)
 
     def __init__(self, type, payload):
         self.type = type
@@ -397,6 +442,7 @@ class MobX(Message):
 
 class NgRx(Message):
     __id__ = 47
+    __slots__ = ('action', 'state', 'duration',)
 
     def __init__(self, action, state, duration):
         self.action = action
@@ -406,6 +452,7 @@ class NgRx(Message):
 
 class GraphQL(Message):
     __id__ = 48
+    __slots__ = ('operation_kind', 'operation_name', 'variables', 'response',)
 
     def __init__(self, operation_kind, operation_name, variables, response):
         self.operation_kind = operation_kind
@@ -416,6 +463,7 @@ class GraphQL(Message):
 
 class PerformanceTrack(Message):
     __id__ = 49
+    __slots__ = ('frames', 'ticks', 'total_js_heap_size', 'used_js_heap_size',)
 
     def __init__(self, frames, ticks, total_js_heap_size, used_js_heap_size):
         self.frames = frames
@@ -426,6 +474,7 @@ class PerformanceTrack(Message):
 
 class StringDict(Message):
     __id__ = 50
+    __slots__ = ('key', 'value',)
 
     def __init__(self, key, value):
         self.key = key
@@ -434,6 +483,7 @@ class StringDict(Message):
 
 class SetNodeAttributeDict(Message):
     __id__ = 51
+    __slots__ = ('id', 'name_key', 'value_key',)
 
     def __init__(self, id, name_key, value_key):
         self.id = id
@@ -443,6 +493,7 @@ class SetNodeAttributeDict(Message):
 
 class ResourceTimingDeprecated(Message):
     __id__ = 53
+    __slots__ = ('timestamp', 'duration', 'ttfb', 'header_size', 'encoded_body_size', 'decoded_body_size', 'url', 'initiator',)
 
     def __init__(self, timestamp, duration, ttfb, header_size, encoded_body_size, decoded_body_size, url, initiator):
         self.timestamp = timestamp
@@ -457,6 +508,7 @@ class ResourceTimingDeprecated(Message):
 
 class ConnectionInformation(Message):
     __id__ = 54
+    __slots__ = ('downlink', 'type',)
 
     def __init__(self, downlink, type):
         self.downlink = downlink
@@ -465,6 +517,7 @@ class ConnectionInformation(Message):
 
 class SetPageVisibility(Message):
     __id__ = 55
+    __slots__ = ('hidden',)
 
     def __init__(self, hidden):
         self.hidden = hidden
@@ -472,6 +525,7 @@ class SetPageVisibility(Message):
 
 class PerformanceTrackAggr(Message):
     __id__ = 56
+    __slots__ = ('timestamp_start', 'timestamp_end', 'min_fps', 'avg_fps', 'max_fps', 'min_cpu', 'avg_cpu', 'max_cpu', 'min_total_js_heap_size', 'avg_total_js_heap_size', 'max_total_js_heap_size', 'min_used_js_heap_size', 'avg_used_js_heap_size', 'max_used_js_heap_size',)
 
     def __init__(self, timestamp_start, timestamp_end, min_fps, avg_fps, max_fps, min_cpu, avg_cpu, max_cpu, min_total_js_heap_size, avg_total_js_heap_size, max_total_js_heap_size, min_used_js_heap_size, avg_used_js_heap_size, max_used_js_heap_size):
         self.timestamp_start = timestamp_start
@@ -492,6 +546,7 @@ class PerformanceTrackAggr(Message):
 
 class LoadFontFace(Message):
     __id__ = 57
+    __slots__ = ('parent_id', 'family', 'source', 'descriptors',)
 
     def __init__(self, parent_id, family, source, descriptors):
         self.parent_id = parent_id
@@ -502,6 +557,7 @@ class LoadFontFace(Message):
 
 class SetNodeFocus(Message):
     __id__ = 58
+    __slots__ = ('id',)
 
     def __init__(self, id):
         self.id = id
@@ -509,6 +565,7 @@ class SetNodeFocus(Message):
 
 class LongTask(Message):
     __id__ = 59
+    __slots__ = ('timestamp', 'duration', 'context', 'container_type', 'container_src', 'container_id', 'container_name',)
 
     def __init__(self, timestamp, duration, context, container_type, container_src, container_id, container_name):
         self.timestamp = timestamp
@@ -522,6 +579,7 @@ class LongTask(Message):
 
 class SetNodeAttributeURLBased(Message):
     __id__ = 60
+    __slots__ = ('id', 'name', 'value', 'base_url',)
 
     def __init__(self, id, name, value, base_url):
         self.id = id
@@ -532,6 +590,7 @@ class SetNodeAttributeURLBased(Message):
 
 class SetCSSDataURLBased(Message):
     __id__ = 61
+    __slots__ = ('id', 'data', 'base_url',)
 
     def __init__(self, id, data, base_url):
         self.id = id
@@ -541,6 +600,7 @@ class SetCSSDataURLBased(Message):
 
 class IssueEventDeprecated(Message):
     __id__ = 62
+    __slots__ = ('message_id', 'timestamp', 'type', 'context_string', 'context', 'payload',)
 
     def __init__(self, message_id, timestamp, type, context_string, context, payload):
         self.message_id = message_id
@@ -553,6 +613,7 @@ class IssueEventDeprecated(Message):
 
 class TechnicalInfo(Message):
     __id__ = 63
+    __slots__ = ('type', 'value',)
 
     def __init__(self, type, value):
         self.type = type
@@ -561,6 +622,7 @@ class TechnicalInfo(Message):
 
 class CustomIssue(Message):
     __id__ = 64
+    __slots__ = ('name', 'payload',)
 
     def __init__(self, name, payload):
         self.name = name
@@ -569,6 +631,7 @@ class CustomIssue(Message):
 
 class AssetCache(Message):
     __id__ = 66
+    __slots__ = ('url',)
 
     def __init__(self, url):
         self.url = url
@@ -576,6 +639,7 @@ class AssetCache(Message):
 
 class CSSInsertRuleURLBased(Message):
     __id__ = 67
+    __slots__ = ('id', 'rule', 'index', 'base_url',)
 
     def __init__(self, id, rule, index, base_url):
         self.id = id
@@ -586,6 +650,7 @@ class CSSInsertRuleURLBased(Message):
 
 class MouseClick(Message):
     __id__ = 69
+    __slots__ = ('id', 'hesitation_time', 'label', 'selector',)
 
     def __init__(self, id, hesitation_time, label, selector):
         self.id = id
@@ -596,6 +661,7 @@ class MouseClick(Message):
 
 class CreateIFrameDocument(Message):
     __id__ = 70
+    __slots__ = ('frame_id', 'id',)
 
     def __init__(self, frame_id, id):
         self.frame_id = frame_id
@@ -604,6 +670,7 @@ class CreateIFrameDocument(Message):
 
 class AdoptedSSReplaceURLBased(Message):
     __id__ = 71
+    __slots__ = ('sheet_id', 'text', 'base_url',)
 
     def __init__(self, sheet_id, text, base_url):
         self.sheet_id = sheet_id
@@ -613,6 +680,7 @@ class AdoptedSSReplaceURLBased(Message):
 
 class AdoptedSSReplace(Message):
     __id__ = 72
+    __slots__ = ('sheet_id', 'text',)
 
     def __init__(self, sheet_id, text):
         self.sheet_id = sheet_id
@@ -621,6 +689,7 @@ class AdoptedSSReplace(Message):
 
 class AdoptedSSInsertRuleURLBased(Message):
     __id__ = 73
+    __slots__ = ('sheet_id', 'rule', 'index', 'base_url',)
 
     def __init__(self, sheet_id, rule, index, base_url):
         self.sheet_id = sheet_id
@@ -631,6 +700,7 @@ class AdoptedSSInsertRuleURLBased(Message):
 
 class AdoptedSSInsertRule(Message):
     __id__ = 74
+    __slots__ = ('sheet_id', 'rule', 'index',)
 
     def __init__(self, sheet_id, rule, index):
         self.sheet_id = sheet_id
@@ -640,6 +710,7 @@ class AdoptedSSInsertRule(Message):
 
 class AdoptedSSDeleteRule(Message):
     __id__ = 75
+    __slots__ = ('sheet_id', 'index',)
 
     def __init__(self, sheet_id, index):
         self.sheet_id = sheet_id
@@ -648,6 +719,7 @@ class AdoptedSSDeleteRule(Message):
 
 class AdoptedSSAddOwner(Message):
     __id__ = 76
+    __slots__ = ('sheet_id', 'id',)
 
     def __init__(self, sheet_id, id):
         self.sheet_id = sheet_id
@@ -656,6 +728,7 @@ class AdoptedSSAddOwner(Message):
 
 class AdoptedSSRemoveOwner(Message):
     __id__ = 77
+    __slots__ = ('sheet_id', 'id',)
 
     def __init__(self, sheet_id, id):
         self.sheet_id = sheet_id
@@ -664,6 +737,7 @@ class AdoptedSSRemoveOwner(Message):
 
 class JSException(Message):
     __id__ = 78
+    __slots__ = ('name', 'message', 'payload', 'metadata',)
 
     def __init__(self, name, message, payload, metadata):
         self.name = name
@@ -674,6 +748,7 @@ class JSException(Message):
 
 class Zustand(Message):
     __id__ = 79
+    __slots__ = ('mutation', 'state',)
 
     def __init__(self, mutation, state):
         self.mutation = mutation
@@ -682,6 +757,7 @@ class Zustand(Message):
 
 class BatchMeta(Message):
     __id__ = 80
+    __slots__ = ('page_no', 'first_index', 'timestamp',)
 
     def __init__(self, page_no, first_index, timestamp):
         self.page_no = page_no
@@ -691,6 +767,7 @@ class BatchMeta(Message):
 
 class BatchMetadata(Message):
     __id__ = 81
+    __slots__ = ('version', 'page_no', 'first_index', 'timestamp', 'location',)
 
     def __init__(self, version, page_no, first_index, timestamp, location):
         self.version = version
@@ -702,6 +779,7 @@ class BatchMetadata(Message):
 
 class PartitionedMessage(Message):
     __id__ = 82
+    __slots__ = ('part_no', 'part_total',)
 
     def __init__(self, part_no, part_total):
         self.part_no = part_no
@@ -710,6 +788,7 @@ class PartitionedMessage(Message):
 
 class InputChange(Message):
     __id__ = 112
+    __slots__ = ('id', 'value', 'value_masked', 'label', 'hesitation_time', 'input_duration',)
 
     def __init__(self, id, value, value_masked, label, hesitation_time, input_duration):
         self.id = id
@@ -722,6 +801,7 @@ class InputChange(Message):
 
 class SelectionChange(Message):
     __id__ = 113
+    __slots__ = ('selection_start', 'selection_end', 'selection',)
 
     def __init__(self, selection_start, selection_end, selection):
         self.selection_start = selection_start
@@ -731,6 +811,7 @@ class SelectionChange(Message):
 
 class MouseThrashing(Message):
     __id__ = 114
+    __slots__ = ('timestamp',)
 
     def __init__(self, timestamp):
         self.timestamp = timestamp
@@ -738,6 +819,7 @@ class MouseThrashing(Message):
 
 class UnbindNodes(Message):
     __id__ = 115
+    __slots__ = ('total_removed_percent',)
 
     def __init__(self, total_removed_percent):
         self.total_removed_percent = total_removed_percent
@@ -745,6 +827,7 @@ class UnbindNodes(Message):
 
 class ResourceTiming(Message):
     __id__ = 116
+    __slots__ = ('timestamp', 'duration', 'ttfb', 'header_size', 'encoded_body_size', 'decoded_body_size', 'url', 'initiator', 'transferred_size', 'cached',)
 
     def __init__(self, timestamp, duration, ttfb, header_size, encoded_body_size, decoded_body_size, url, initiator, transferred_size, cached):
         self.timestamp = timestamp
@@ -761,6 +844,7 @@ class ResourceTiming(Message):
 
 class IssueEvent(Message):
     __id__ = 125
+    __slots__ = ('message_id', 'timestamp', 'type', 'context_string', 'context', 'payload', 'url',)
 
     def __init__(self, message_id, timestamp, type, context_string, context, payload, url):
         self.message_id = message_id
@@ -774,6 +858,7 @@ class IssueEvent(Message):
 
 class SessionEnd(Message):
     __id__ = 126
+    __slots__ = ('timestamp', 'encryption_key',)
 
     def __init__(self, timestamp, encryption_key):
         self.timestamp = timestamp
@@ -782,6 +867,7 @@ class SessionEnd(Message):
 
 class SessionSearch(Message):
     __id__ = 127
+    __slots__ = ('timestamp', 'partition',)
 
     def __init__(self, timestamp, partition):
         self.timestamp = timestamp
@@ -790,6 +876,7 @@ class SessionSearch(Message):
 
 class IOSBatchMeta(Message):
     __id__ = 107
+    __slots__ = ('timestamp', 'length', 'first_index',)
 
     def __init__(self, timestamp, length, first_index):
         self.timestamp = timestamp
@@ -799,6 +886,7 @@ class IOSBatchMeta(Message):
 
 class IOSSessionStart(Message):
     __id__ = 90
+    __slots__ = ('timestamp', 'project_id', 'tracker_version', 'rev_id', 'user_uuid', 'user_os', 'user_os_version', 'user_device', 'user_device_type', 'user_country',)
 
     def __init__(self, timestamp, project_id, tracker_version, rev_id, user_uuid, user_os, user_os_version, user_device, user_device_type, user_country):
         self.timestamp = timestamp
@@ -815,6 +903,7 @@ class IOSSessionStart(Message):
 
 class IOSSessionEnd(Message):
     __id__ = 91
+    __slots__ = ('timestamp',)
 
     def __init__(self, timestamp):
         self.timestamp = timestamp
@@ -822,6 +911,7 @@ class IOSSessionEnd(Message):
 
 class IOSMetadata(Message):
     __id__ = 92
+    __slots__ = ('timestamp', 'length', 'key', 'value',)
 
     def __init__(self, timestamp, length, key, value):
         self.timestamp = timestamp
@@ -832,6 +922,7 @@ class IOSMetadata(Message):
 
 class IOSCustomEvent(Message):
     __id__ = 93
+    __slots__ = ('timestamp', 'length', 'name', 'payload',)
 
     def __init__(self, timestamp, length, name, payload):
         self.timestamp = timestamp
@@ -842,6 +933,7 @@ class IOSCustomEvent(Message):
 
 class IOSUserID(Message):
     __id__ = 94
+    __slots__ = ('timestamp', 'length', 'value',)
 
     def __init__(self, timestamp, length, value):
         self.timestamp = timestamp
@@ -851,6 +943,7 @@ class IOSUserID(Message):
 
 class IOSUserAnonymousID(Message):
     __id__ = 95
+    __slots__ = ('timestamp', 'length', 'value',)
 
     def __init__(self, timestamp, length, value):
         self.timestamp = timestamp
@@ -860,6 +953,7 @@ class IOSUserAnonymousID(Message):
 
 class IOSScreenChanges(Message):
     __id__ = 96
+    __slots__ = ('timestamp', 'length', 'x', 'y', 'width', 'height',)
 
     def __init__(self, timestamp, length, x, y, width, height):
         self.timestamp = timestamp
@@ -872,6 +966,7 @@ class IOSScreenChanges(Message):
 
 class IOSCrash(Message):
     __id__ = 97
+    __slots__ = ('timestamp', 'length', 'name', 'reason', 'stacktrace',)
 
     def __init__(self, timestamp, length, name, reason, stacktrace):
         self.timestamp = timestamp
@@ -883,6 +978,7 @@ class IOSCrash(Message):
 
 class IOSScreenEnter(Message):
     __id__ = 98
+    __slots__ = ('timestamp', 'length', 'title', 'view_name',)
 
     def __init__(self, timestamp, length, title, view_name):
         self.timestamp = timestamp
@@ -893,6 +989,7 @@ class IOSScreenEnter(Message):
 
 class IOSScreenLeave(Message):
     __id__ = 99
+    __slots__ = ('timestamp', 'length', 'title', 'view_name',)
 
     def __init__(self, timestamp, length, title, view_name):
         self.timestamp = timestamp
@@ -903,6 +1000,7 @@ class IOSScreenLeave(Message):
 
 class IOSClickEvent(Message):
     __id__ = 100
+    __slots__ = ('timestamp', 'length', 'label', 'x', 'y',)
 
     def __init__(self, timestamp, length, label, x, y):
         self.timestamp = timestamp
@@ -914,6 +1012,7 @@ class IOSClickEvent(Message):
 
 class IOSInputEvent(Message):
     __id__ = 101
+    __slots__ = ('timestamp', 'length', 'value', 'value_masked', 'label',)
 
     def __init__(self, timestamp, length, value, value_masked, label):
         self.timestamp = timestamp
@@ -925,6 +1024,7 @@ class IOSInputEvent(Message):
 
 class IOSPerformanceEvent(Message):
     __id__ = 102
+    __slots__ = ('timestamp', 'length', 'name', 'value',)
 
     def __init__(self, timestamp, length, name, value):
         self.timestamp = timestamp
@@ -935,6 +1035,7 @@ class IOSPerformanceEvent(Message):
 
 class IOSLog(Message):
     __id__ = 103
+    __slots__ = ('timestamp', 'length', 'severity', 'content',)
 
     def __init__(self, timestamp, length, severity, content):
         self.timestamp = timestamp
@@ -945,6 +1046,7 @@ class IOSLog(Message):
 
 class IOSInternalError(Message):
     __id__ = 104
+    __slots__ = ('timestamp', 'length', 'content',)
 
     def __init__(self, timestamp, length, content):
         self.timestamp = timestamp
@@ -954,6 +1056,7 @@ class IOSInternalError(Message):
 
 class IOSNetworkCall(Message):
     __id__ = 105
+    __slots__ = ('timestamp', 'length', 'duration', 'headers', 'body', 'url', 'success', 'method', 'status',)
 
     def __init__(self, timestamp, length, duration, headers, body, url, success, method, status):
         self.timestamp = timestamp
@@ -969,6 +1072,7 @@ class IOSNetworkCall(Message):
 
 class IOSPerformanceAggregated(Message):
     __id__ = 110
+    __slots__ = ('timestamp_start', 'timestamp_end', 'min_fps', 'avg_fps', 'max_fps', 'min_cpu', 'avg_cpu', 'max_cpu', 'min_memory', 'avg_memory', 'max_memory', 'min_battery', 'avg_battery', 'max_battery',)
 
     def __init__(self, timestamp_start, timestamp_end, min_fps, avg_fps, max_fps, min_cpu, avg_cpu, max_cpu, min_memory, avg_memory, max_memory, min_battery, avg_battery, max_battery):
         self.timestamp_start = timestamp_start
@@ -989,6 +1093,7 @@ class IOSPerformanceAggregated(Message):
 
 class IOSIssueEvent(Message):
     __id__ = 111
+    __slots__ = ('timestamp', 'type', 'context_string', 'context', 'payload',)
 
     def __init__(self, timestamp, type, context_string, context, payload):
         self.timestamp = timestamp
@@ -0,0 +1,152 @@
+"""
+Staged consumer pipeline: the consume thread polls kafka and keeps the session state,
+a pool of processes decodes and maps the batches (CPU bound) and a writer thread
+loads the finished batches into the warehouse. Stages are linked by bounded queues,
+so a slow stage slows down polling instead of growing memory.
+"""
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from multiprocessing import get_context
+from queue import Queue, Empty
+from threading import Thread
+
+from msgcodec.msgcodec import MessageCodec
+from handler import handle_message, handle_normal_message
+
+_codec = None
+_handle_event = None
+_interesting_events = None
+_interesting_sessions = None
+
+
+def init_decoder(msg_selector, event_type, interesting_events, interesting_sessions):
+    """Initializer of the decode processes"""
+    global _codec, _handle_event, _interesting_events, _interesting_sessions
+    _codec = MessageCodec(msg_selector, lazy_strings=True)
+    _handle_event = handle_message if event_type == 'detailed' else handle_normal_message
+    _interesting_events = frozenset(interesting_events)
+    _interesting_sessions = frozenset(interesting_sessions)
+
+
+def decode_records(records):
+    """
+    Decode a chunk of kafka records [(session_id, value), ...] and map their events.
+    Returns [(session_id, event rows, messages for the session state), ...] in the same order.
+    """
+    results = list()
+    received_at = int(datetime.now().timestamp() * 1000)
+    for session_id, value in records:
+        events = list()
+        session_messages = list()
+        for message in _codec.decode_detailed(value):
+            if message.__id__ in _interesting_events:
+                n = _handle_event(message)
+                if n:
+                    n.sessionid = session_id
+                    n.received_at = received_at
+                    events.append(n)
+            if message.__id__ in _interesting_sessions:
+                session_messages.append(message)
+        results.append((session_id, events, session_messages))
+    return results
+
+
+class DecodePool:
+    """Process pool decoding chunks of records; results come back in submission order"""
+
+    def __init__(self, workers, msg_selector, event_type, interesting_events, interesting_sessions):
+        self.executor = ProcessPoolExecutor(max_workers=workers,
+                                            mp_context=get_context('spawn'),
+                                            initializer=init_decoder,
+                                            initargs=(msg_selector, event_type,
+                                                      interesting_events, interesting_sessions))
+        self.max_inflight = 2 * workers
+        self.inflight = deque()
+
+    def submit(self, records, offsets):
+        """Queue a chunk for decoding. offsets: {(topic, partition): next offset} covered by the chunk"""
+        self.inflight.append((self.executor.submit(decode_records, records), offsets))
+
+    def full(self):
+        return len(self.inflight) >= self.max_inflight
+
+    def results(self, wait=False):
+        """Yield (decoded records, offsets) of the finished chunks, oldest first.
+        With wait, blocks until the oldest chunk is done when too many chunks are in flight"""
+        while self.inflight:
+            future, offsets = self.inflight[0]
+            if not future.done() and not (wait and self.full()):
+                return
+            self.inflight.popleft()
+            yield future.result(), offsets
+
+    def drain(self):
+        while self.inflight:
+            future, offsets = self.inflight.popleft()
+            yield future.result(), offsets
+
+    def shutdown(self):
+        self.executor.shutdown(wait=True)
+
+
+class BatchWriter(Thread):
+    """
+    Writes (sessions batch, events batch, offsets) items with write_fn in the background.
+    The queue holds a single item and put() waits for the previous write, so one batch is
+    written while the next one is being filled (double buffering). Offsets of a batch, and
+    the sessions snapshot of their partitions taken with it, are handed back through
+    `committable` only once write_fn reported the batch as written.
+    """
+
+    def __init__(self, write_fn):
+        super().__init__(daemon=True)
+        self.write_fn = write_fn
+        self.batches = Queue(maxsize=1)
+        self.committable = Queue()
+        self.failed = None
+
+    def wait(self):
+        """Block until the batch being written is done, raises if a write failed"""
+        self.batches.join()
+        if self.failed is not None:
+            raise self.failed
+
+    def put(self, sessions_batch, batch, offsets, snapshot=None):
+        self.wait()
+        self.batches.put((sessions_batch, batch, offsets, snapshot))
+
+    def stop(self):
+        self.batches.join()
+        self.batches.put(None)
+        self.join()
+
+    def run(self):
+        while True:
+            item = self.batches.get()
+            try:
+                if item is None:
+                    return
+                sessions_batch, batch, offsets, snapshot = item
+                if self.write_fn(sessions_batch, batch):
+                    self.committable.put((offsets, snapshot))
+                else:
+                    self.failed = IOError('Batch could not be written, stopping commits')
+            except Exception as e:
+                self.failed = e
+            finally:
+                self.batches.task_done()
+
+    def pop_written(self):
+        """Merge the offsets {(topic, partition): offset} of every batch written since the last call with the
+        latest snapshot {(topic, partition): state} of their partitions"""
+        offsets = dict()
+        snapshots = dict()
+        while True:
+            try:
+                batch_offsets, snapshot = self.committable.get_nowait()
+            except Empty:
+                return offsets, snapshots
+            offsets.update(batch_offsets)
+            if snapshot is not None:
+                snapshots.update(snapshot)
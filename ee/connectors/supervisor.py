@@ -0,0 +1,131 @@
+"""
+Supervisor mode of the connector: runs CONNECTOR_WORKERS consumer_async workers in the same kafka
+consumer group, so the partitions are shared between the processes and every core is used.
+Workers that die are restarted, SIGTERM/SIGINT are forwarded for a graceful shutdown, and the
+supervisor serves the health of all the workers and their aggregated metrics.
+env:
+    CONNECTOR_WORKERS: number of worker processes (default: number of cpus)
+    health_port: supervisor /health and /metrics port, worker i serves its own on health_port + 1 + i (default 8888)
+    shutdown_timeout: seconds given to the workers to write their last batch before being killed (default 120)
+    worker_stable_after: seconds a restarted worker has to stay up for its restart backoff to be reset (default 300)
+"""
+import asyncio
+import os
+import signal
+from multiprocessing import get_context
+from queue import Empty
+from time import time
+
+from decouple import config
+
+from utils.health import serve_json
+
+
+def run_worker(worker_id, metrics_queue, health_port):
+    # Imported here so that the supervisor itself doesn't load the connector
+    import consumer_async
+    asyncio.run(consumer_async.main(worker_id, metrics_queue, health_port))
+
+
+class Supervisor:
+
+    def __init__(self):
+        self.workers_count = config('CONNECTOR_WORKERS', default=os.cpu_count() or 1, cast=int)
+        self.health_port = config('health_port', default=8888, cast=int)
+        self.shutdown_timeout = config('shutdown_timeout', default=120, cast=int)
+        self.context = get_context('spawn')
+        self.metrics_queue = self.context.Queue()
+        self.workers = dict()
+        self.worker_stable_after = config('worker_stable_after', default=300, cast=int)
+        self.restarts = dict()
+        self.started_at = dict()
+        self.restart_at = dict()
+        self.metrics = dict()
+        self.stopping = False
+
+    def start_worker(self, worker_id):
+        worker = self.context.Process(target=run_worker, name=f'connector-worker-{worker_id}',
+                                      args=(worker_id, self.metrics_queue, self.health_port + 1 + worker_id))
+        worker.start()
+        self.workers[worker_id] = worker
+        self.started_at[worker_id] = time()
+        print(f'[INFO] Started worker {worker_id} (pid {worker.pid})')
+
+    def stop(self, signum, frame):
+        self.stopping = True
+
+    def health(self):
+        workers = {worker_id: {'pid': worker.pid, 'alive': worker.is_alive(), 'exitcode': worker.exitcode,
+                               'restarts': self.restarts.get(worker_id, 0)}
+                   for worker_id, worker in self.workers.items()}
+        healthy = all(worker['alive'] for worker in workers.values())
+        return (200 if healthy else 503), {'workers': workers}
+
+    def aggregated_metrics(self):
+        metrics = list(self.metrics.values())
+        return 200, {'workers': len(self.workers),
+                     'records_per_second': sum(m.get('records_per_second', 0) for m in metrics),
+                     'kib_per_second': sum(m.get('kib_per_second', 0) for m in metrics),
+                     'total_lag': sum(m.get('total_lag', 0) for m in metrics),
+                     'partitions': {p: v for m in metrics for p, v in m.get('partitions', dict()).items()},
+                     'by_worker': self.metrics}
+
+    def collect_metrics(self, timeout):
+        try:
+            worker_id, metrics = self.metrics_queue.get(timeout=timeout)
+            self.metrics[worker_id] = metrics
+            while True:
+                worker_id, metrics = self.metrics_queue.get_nowait()
+                self.metrics[worker_id] = metrics
+        except Empty:
+            pass
+
+    def run(self):
+        signal.signal(signal.SIGTERM, self.stop)
+        signal.signal(signal.SIGINT, self.stop)
+        for worker_id in range(self.workers_count):
+            self.start_worker(worker_id)
+        if self.health_port:
+            serve_json(self.health_port, {'/health': self.health, '/metrics': self.aggregated_metrics})
+
+        while not self.stopping:
+            self.collect_metrics(timeout=1.0)
+            self.watch_workers()
+        self.shutdown()
+
+    def watch_workers(self):
+        """Schedule the restart of the dead workers with an exponential backoff, without blocking the loop, and
+        start them once due. The backoff is reset when a worker stayed up for worker_stable_after seconds."""
+        now = time()
+        for worker_id, worker in list(self.workers.items()):
+            if self.stopping:
+                return
+            if worker.is_alive():
+                if self.restarts.get(worker_id) and now - self.started_at[worker_id] >= self.worker_stable_after:
+                    self.restarts[worker_id] = 0
+            elif worker_id not in self.restart_at:
+                restarts = self.restarts.get(worker_id, 0) + 1
+                self.restarts[worker_id] = restarts
+                delay = min(2 ** restarts, 60)
+                self.restart_at[worker_id] = now + delay
+                print(f'[WARN] Worker {worker_id} exited with code {worker.exitcode}, restarting in {delay} seconds')
+            elif now >= self.restart_at[worker_id]:
+                del self.restart_at[worker_id]
+                self.start_worker(worker_id)
+
+    def shutdown(self):
+        print('[INFO] Stopping workers')
+        for worker in self.workers.values():
+            if worker.is_alive():
+                worker.terminate()
+        deadline = time() + self.shutdown_timeout
+        for worker_id, worker in self.workers.items():
+            worker.join(max(deadline - time(), 0))
+            if worker.is_alive():
+                print(f'[WARN] Worker {worker_id} did not stop in {self.shutdown_timeout} seconds, killing it')
+                worker.kill()
+                worker.join()
+
+
+if __name__ == '__main__':
+    Supervisor().run()
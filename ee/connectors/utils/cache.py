@@ -1,5 +1,6 @@
 from utils.pg_client import PostgresClient
 from queue import Queue
+from collections import OrderedDict
 from decouple import config
 from time import time
 
@@ -18,6 +19,60 @@ def _project_from_session(sessionId):
     return res['project_id']
 
 
+def _projects_from_sessions(sessionIds):
+    """Search projectId of all requested sessionIds in PG table sessions with a single query"""
+    with PostgresClient() as conn:
+        conn.execute(
+                conn.mogrify("SELECT session_id, project_id FROM sessions WHERE session_id = ANY(%(sessionIds)s)",
+                             {'sessionIds': list(sessionIds)})
+                )
+        res = conn.fetchall()
+    return {row['session_id']: row['project_id'] for row in res}
+
+
+class LRUCache:
+
+    def __init__(self, max_size, lifespan):
+        """Bounded cache dropping the least recently used entry when full. An entry not used
+        for lifespan seconds is expired, so entries are kept in both recency and expiry order"""
+        self.max_size = max_size
+        self.lifespan = lifespan
+        self.data = OrderedDict()
+
+    def __len__(self):
+        return len(self.data)
+
+    def __contains__(self, key):
+        return self.get(key) is not None
+
+    def get(self, key, default=None):
+        entry = self.data.get(key)
+        if entry is None:
+            return default
+        now = time()
+        if now - entry[0] > self.lifespan:
+            del self.data[key]
+            return default
+        self.data[key] = (now, entry[1])
+        self.data.move_to_end(key)
+        return entry[1]
+
+    def set(self, key, value):
+        self.data[key] = (time(), value)
+        self.data.move_to_end(key)
+        while len(self.data) > self.max_size:
+            self.data.popitem(last=False)
+
+    def expire(self):
+        """Delete the entries that reached lifespan, the oldest are at the front"""
+        limit = time() - self.lifespan
+        while self.data:
+            key, (last_used, _) = next(iter(self.data.items()))
+            if last_used >= limit:
+                break
+            del self.data[key]
+
+
 class CachedSessions:
 
     def __init__(self):
@@ -48,12 +103,15 @@ class CachedSessions:
         return old_status
 
     def clear_sessions(self):
-        """Delete all sessions that reached max_alive_time"""
+        """Delete all sessions that reached max_alive_time.
+        Sessions are only inserted by create() and status updates keep their position, so the dict is
+        sorted by insertion time: only the expired sessions at the front are visited"""
         to_clean_list = list()
-        current_time = time()
+        limit = time() - self.max_alive_time
         for sessionid, values in self.session_project.items():
-            if current_time - values[0] > self.max_alive_time:
-                to_clean_list.append(sessionid)
+            if values[0] >= limit:
+                break
+            to_clean_list.append(sessionid)
         for sessionid in to_clean_list:
             del self.session_project[sessionid]
         return to_clean_list
@@ -64,41 +122,61 @@ class ProjectFilter:
     def __init__(self, filter=list()):
         """Filters all sessions that comes from selected projects. This class reads from PG to find projectId and uses cache to avoid duplicated requests.
         env:
-            max_cache_size: max allowed cache lenght - starts cleanup when oversize
-            cache_lifespan: max lifetime of cached - if surpased it is deleted in cleanup phase"""
-        self.filter = filter
-        self.cache = dict()
+            max_cache_size: max number of cached sessions - least recently used are dropped first
+            cache_lifespan: max lifetime of a cached session without being used - expired in cleanup phase"""
+        self.filter = set(filter) if filter else set()
         self.cached_sessions = CachedSessions()
         self.to_clean = list()
         self.count_bad = 0
-        self.max_cache_size = config('max_cache_size', default=50, cast=int)
+        self.max_cache_size = config('max_cache_size', default=50000, cast=int)
         self.cache_lifespan = config('cache_lifespan', default=900, cast=int)
+        self.cache = LRUCache(self.max_cache_size, self.cache_lifespan)
+        # Sessions of the last prefetch that are not in PG yet, so is_valid doesn't query them again
+        self.unresolved = set()
 
     def is_valid(self, sessionId):
         """Verify if sessionId is from selected project"""
-        if len(self.filter)==0:
+        if not self.filter:
             return True
-        elif sessionId in self.cache.keys():
-            return self.cache[sessionId][1]
-        else:
-            found_project_id = _project_from_session(sessionId)
-            if found_project_id is None:
-                self.count_bad += 1
-                return False
-            else:
-                project_is_valid = found_project_id in self.filter
-                self.cache[sessionId] = [time(), project_is_valid]
-                return project_is_valid
+        project_is_valid = self.cache.get(sessionId)
+        if project_is_valid is not None:
+            return project_is_valid
+        if sessionId in self.unresolved:
+            self.count_bad += 1
+            return False
+        found_project_id = _project_from_session(sessionId)
+        if found_project_id is None:
+            self.count_bad += 1
+            return False
+        return self.set_project(sessionId, found_project_id)
+
+    def set_project(self, sessionId, projectId):
+        """Cache the project of a session (e.g. read from a SessionStart message). Returns if it is a selected project"""
+        project_is_valid = projectId in self.filter
+        self.cache.set(sessionId, project_is_valid)
+        return project_is_valid
+
+    def prefetch(self, sessionIds):
+        """Resolve all the sessionIds not in cache with a single query, so is_valid doesn't query them one by one"""
+        if not self.filter:
+            return
+        unknown = {sessionId for sessionId in sessionIds if sessionId not in self.cache}
+        self.unresolved = set()
+        if not unknown:
+            return
+        found = _projects_from_sessions(unknown)
+        for sessionId, projectId in found.items():
+            self.set_project(sessionId, projectId)
+        self.unresolved = unknown.difference(found)
+        for sessionId in self.unresolved:
+            print(f'[WARN] sessionid {sessionId} not found in sessions table')
 
     def cleanup(self):
         """Deletes cache when reached cache_lifespan value"""
-        current_time = time()
-        self.cache = {sessionid: values for sessionid, values in self.cache.items() if current_time - values[0] < self.cache_lifespan}
+        self.cache.expire()
 
     def handle_clean(self):
         """Verifies and execute cleanup if needed"""
-        if len(self.filter)==0:
+        if not self.filter:
             return
-        elif len(self.cache) > self.max_cache_size:
-            self.cleanup()
-
+        self.cleanup()
@@ -0,0 +1,75 @@
+from collections import defaultdict
+from time import time
+
+
+def consume_batch(consumer, num_messages, timeout, metrics=None):
+    """Read up to num_messages records waiting at most timeout seconds. Records with errors are dropped"""
+    records = list()
+    for msg in consumer.consume(num_messages=num_messages, timeout=timeout):
+        if msg.error():
+            print(f'[WARN] Consumer error {msg.error()}')
+            continue
+        records.append(msg)
+    if metrics is not None:
+        metrics.track(records)
+    return records
+
+
+class ConsumerMetrics:
+
+    def __init__(self, consumer):
+        """Throughput and lag of each assigned partition, accumulated between two calls to report()"""
+        self.consumer = consumer
+        self.records = defaultdict(int)
+        self.bytes = 0
+        self.calls = 0
+        self.start = time()
+
+    def track(self, records):
+        """Account the records returned by one consume call"""
+        self.calls += 1
+        for msg in records:
+            self.records[(msg.topic(), msg.partition())] += 1
+            self.bytes += len(msg.value() or b'')
+
+    def lag(self):
+        """Messages between the consumer position and the high watermark of each assigned partition"""
+        lag = dict()
+        try:
+            positions = self.consumer.position(self.consumer.assignment())
+        except Exception as e:
+            print(f'[WARN] Could not read consumer positions: {repr(e)}')
+            return lag
+        for tp in positions:
+            low, high = self.consumer.get_watermark_offsets(tp, cached=True) or (-1, -1)
+            if high < 0:
+                continue
+            position = tp.offset if tp.offset >= 0 else low
+            lag[(tp.topic, tp.partition)] = max(high - position, 0)
+        return lag
+
+    def report(self):
+        """Print the metrics since the previous report, reset them and return them as a dict"""
+        elapsed = max(time() - self.start, 1e-3)
+        total = sum(self.records.values())
+        print(f'[INFO] Consumed {total} records in {self.calls} consume calls '
+              f'(avg {total / max(self.calls, 1):.1f} records per call), '
+              f'{total / elapsed:.1f} records/s, {self.bytes / elapsed / 1024:.1f} KiB/s')
+        lag = self.lag()
+        partitions = dict()
+        for key in sorted(set(lag) | set(self.records)):
+            print(f'[INFO]   {key[0]}[{key[1]}] lag={lag.get(key, "?")} '
+                  f'throughput={self.records.get(key, 0) / elapsed:.1f} records/s')
+            partitions[f'{key[0]}[{key[1]}]'] = {'lag': lag.get(key),
+                                                 'records_per_second': self.records.get(key, 0) / elapsed}
+        summary = {'records': total,
+                   'consume_calls': self.calls,
+                   'records_per_second': total / elapsed,
+                   'kib_per_second': self.bytes / elapsed / 1024,
+                   'total_lag': sum(lag.values()),
+                   'partitions': partitions}
+        self.records = defaultdict(int)
+        self.bytes = 0
+        self.calls = 0
+        self.start = time()
+        return summary
@@ -0,0 +1,68 @@
+import json
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+from time import time
+
+from decouple import config
+
+
+def serve_json(port, routes):
+    """Serve GET routes {path: callable returning (status, payload)} as JSON from a daemon thread"""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            route = routes.get(self.path.split('?')[0])
+            if route is None:
+                status, payload = 404, {'error': 'not found'}
+            else:
+                status, payload = route()
+            body = json.dumps(payload, default=str).encode()
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(('0.0.0.0', port), Handler)
+    Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+class WorkerHealth:
+
+    def __init__(self, worker_id=0, port=0, metrics_queue=None):
+        """Liveness and last metrics of a connector worker, served on /health and /metrics when port is set.
+        The worker is healthy while its consume loop keeps beating.
+        env:
+            health_timeout: seconds without beat before the worker is reported unhealthy (default 300)"""
+        self.worker_id = worker_id
+        self.metrics_queue = metrics_queue
+        self.timeout = config('health_timeout', default=300, cast=int)
+        self.started_at = time()
+        self.last_beat = time()
+        self.last_commit = None
+        self.metrics = dict()
+        if port:
+            serve_json(port, {'/health': self.health, '/metrics': lambda: (200, self.metrics)})
+
+    def beat(self):
+        self.last_beat = time()
+
+    def committed(self):
+        self.last_commit = time()
+
+    def publish(self, metrics):
+        """Keep the last metrics of the worker and forward them to the supervisor"""
+        self.metrics = metrics
+        if self.metrics_queue is not None:
+            self.metrics_queue.put((self.worker_id, metrics))
+
+    def health(self):
+        since_beat = time() - self.last_beat
+        return (200 if since_beat <= self.timeout else 503), {'worker': self.worker_id,
+                                                               'uptime': time() - self.started_at,
+                                                               'seconds_since_beat': since_beat,
+                                                               'last_commit': self.last_commit}
@@ -0,0 +1,166 @@
+import os
+import pickle
+from collections import defaultdict
+from time import time
+
+from confluent_kafka import TopicPartition
+
+
+class SessionsSnapshot:
+
+    def __init__(self, path):
+        """On-disk state of the open sessions of each kafka partition, written with the offset of the partition
+        right before that offset is committed. Whichever connector is assigned the partition next, after a restart
+        or a rebalance, resumes from the committed offset with those sessions instead of replaying the topic.
+        env:
+            sessions_snapshot: directory of the snapshot files, shared by all the connectors of the consumer group
+                               (snapshots are disabled if not set)"""
+        self.path = path
+        os.makedirs(path, exist_ok=True)
+
+    def file(self, topic, partition):
+        return os.path.join(self.path, f'{topic}-{partition}.snapshot')
+
+    def write(self, topic, partition, data):
+        """Replace the snapshot of a partition atomically: the previous one stays valid until the new one is fully
+        on disk"""
+        path = self.file(topic, partition)
+        tmp_path = f'{path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
+    def save(self, states):
+        """Write the dumped states {(topic, partition): bytes}, then sync the directory once for all of them"""
+        t1 = time()
+        for (topic, partition), data in states.items():
+            self.write(topic, partition, data)
+        dir_fd = os.open(os.path.abspath(self.path), os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+        print(f'[INFO] Snapshot of {len(states)} partitions saved in {time() - t1:.2f} seconds')
+
+    def load(self, topic, partition):
+        """Return the saved state {'offset', 'sessions', 'cached_sessions'} of a partition or None"""
+        path = self.file(topic, partition)
+        try:
+            with open(path, 'rb') as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f'[WARN] Could not load sessions snapshot {path}: {repr(e)}')
+            return None
+
+
+class PartitionsState:
+
+    def __init__(self, sessions, cached_sessions=None, snapshot=None):
+        """Open sessions grouped by the kafka partition they are read from (records are keyed by session id, so a
+        session never spans two partitions) with the offsets {(topic, partition): next offset} applied to them.
+        The state of a partition is saved with the offset committed for it, restored when the partition is
+        assigned and dropped when it is revoked."""
+        self.sessions = sessions
+        self.cached_sessions = cached_sessions
+        self.snapshot = snapshot
+        self.partition_of = dict()
+        self.offsets = dict()
+        self.assigned = set()
+
+    def track(self, session_id, topic, partition):
+        self.partition_of[session_id] = (topic, partition)
+
+    def __cached(self):
+        return self.cached_sessions.session_project if self.cached_sessions is not None else dict()
+
+    def __sessions_by_partition(self):
+        """{(topic, partition): [session_id]} of the sessions still open or cached, the others are forgotten"""
+        cached = self.__cached()
+        by_partition = defaultdict(list)
+        partition_of = dict()
+        for session_id, key in self.partition_of.items():
+            if self.sessions.get(session_id) is not None or session_id in cached:
+                partition_of[session_id] = key
+                by_partition[key].append(session_id)
+        self.partition_of = partition_of
+        return by_partition
+
+    def dump(self):
+        """Offsets applied so far to the assigned partitions, with the serialized state of each of these
+        partitions {(topic, partition): bytes} (None when snapshots are disabled). Both are handed to commit()
+        once the batches built up to these offsets are written."""
+        offsets = {key: offset for key, offset in self.offsets.items() if key in self.assigned}
+        # Pruned at every commit, snapshots or not: drop() needs the partitions of the open sessions, the closed
+        # ones must not pile up
+        by_partition = self.__sessions_by_partition()
+        if self.snapshot is None:
+            return offsets, None
+        cached = self.__cached()
+        states = dict()
+        for key, offset in offsets.items():
+            session_ids = by_partition.get(key, ())
+            states[key] = pickle.dumps({'offset': offset,
+                                        'sessions': {s: self.sessions[s] for s in session_ids
+                                                     if self.sessions.get(s) is not None},
+                                        'cached_sessions': {s: cached[s] for s in session_ids if s in cached}},
+                                       protocol=pickle.HIGHEST_PROTOCOL)
+        return offsets, states
+
+    def commit(self, consumer, offsets, states=None):
+        """Save the states, then commit exactly the offsets they were dumped at. After a crash in between, the
+        snapshot of a partition is ahead of its committed offset and on_assign() still resumes from it"""
+        if states:
+            self.snapshot.save(states)
+        if offsets:
+            consumer.commit(offsets=[TopicPartition(topic, partition, offset)
+                                     for (topic, partition), offset in offsets.items()],
+                            asynchronous=False)
+
+    def on_assign(self, consumer, partitions):
+        """Restore the snapshot of each assigned partition and resume from its offset. A snapshot behind the
+        committed offset of its partition is stale and ignored: a partition never goes back before its commit."""
+        resume = dict()
+        if self.snapshot is not None:
+            cached = self.__cached()
+            for tp in consumer.committed(partitions, timeout=30):
+                key = (tp.topic, tp.partition)
+                state = self.snapshot.load(tp.topic, tp.partition)
+                if state is None:
+                    continue
+                if tp.offset >= 0 and state['offset'] < tp.offset:
+                    print(f'[WARN] Snapshot of {key} at offset {state["offset"]} is behind the committed offset '
+                          f'{tp.offset}, ignored')
+                    continue
+                self.sessions.update(state['sessions'])
+                cached.update(state['cached_sessions'])
+                for session_id in {*state['sessions'], *state['cached_sessions']}:
+                    self.partition_of[session_id] = key
+                self.offsets[key] = state['offset']
+                resume[key] = state['offset']
+                print(f"[INFO] Restored {len(state['sessions'])} sessions of {key} from snapshot")
+            if resume and self.cached_sessions is not None:
+                # Cached sessions expire from the front, restored ones are put back in insertion time order
+                self.cached_sessions.session_project = dict(sorted(cached.items(), key=lambda item: item[1][0]))
+        for tp in partitions:
+            key = (tp.topic, tp.partition)
+            self.assigned.add(key)
+            if key in resume:
+                tp.offset = resume[key]
+        consumer.assign(partitions)
+
+    def drop(self, partitions):
+        """Forget the sessions and offsets of revoked partitions, their next owner resumes them from the snapshot"""
+        keys = {(tp.topic, tp.partition) for tp in partitions}
+        self.assigned -= keys
+        cached = self.__cached()
+        for session_id, key in list(self.partition_of.items()):
+            if key in keys:
+                self.sessions.pop(session_id, None)
+                cached.pop(session_id, None)
+                del self.partition_of[session_id]
+        for key in keys:
+            self.offsets.pop(key, None)
@@ -1,10 +1,18 @@
 from decouple import config
-from confluent_kafka import Consumer
+from confluent_kafka import Consumer, TopicPartition
+from collections import defaultdict, OrderedDict
 from datetime import datetime
 import os as _os
-import queue
-import requests
+import asyncio
+import gzip
+import hashlib
+import io
+import aiohttp
 import json
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 from time import time, sleep
@@ -14,64 +22,136 @@ from time import time, sleep
 decryption = False
 MessageCodec = None
 max_retry=3
-Fetch, FetchEvent, PageEvent, GraphQ = None, None, None, None
+Fetch, NetworkRequest, PageEvent, GraphQL = None, None, None, None
 if decryption:
     from msgcodec.msgcodec import MessageCodec
-    from msgcodec.messages import Fetch, FetchEvent, PageEvent, GraphQL
+    from msgcodec.messages import Fetch, NetworkRequest, PageEvent, GraphQL
     print("Enabled decryption mode")
 
-def _quickwit_ingest(index, data_list, retry=0):
-    try:
-        res = requests.post(f'http://localhost:7280/api/v1/{index}/ingest', data=__jsonify_data(data_list, index))
-    except requests.exceptions.ConnectionError as e:
-        retry += 1
-        assert retry <= max_retry, f'[ENDPOINT CONNECTION FAIL] Failed to connect to endpoint http://localhost:7280/api/v1/{index}/ingest\n{e}\n'
-        sleep(5*retry)
-        print(f"[ENDPOINT ERROR] Failed to connect to endpoint http://localhost:7280/api/v1/{index}/ingest, retrying in {5*retry} seconds..\n")
-        return _quickwit_ingest(index, data_list, retry=retry)
-    return res
-
-def __jsonify_data(data_list, msg_type):
-    res = list()
-    i = 0
-    for data in data_list:
-        if msg_type == 'fetchevent':
-            try:
-                _tmp = data['request']
-                if _tmp != '':
-                    data['request'] = json.loads(_tmp)
-                else:
-                    data['request'] = {}
-                _tmp = data['response']
-                if _tmp != '':
-                    data['response'] = json.loads(_tmp)
-                    if data['response']['body'][:1] == '{' or data['response']['body'][:2] == '[{':
-                        data['response']['body'] = json.loads(data['response']['body'])
-                else:
-                    data['response'] = {}
-            except Exception as e:
-                print(f'Error {e}\tWhile decoding fetchevent\nEvent: {data}\n')
-        elif msg_type == 'graphql':
+class QuickwitClient:
+
+    def __init__(self):
+        """Async ingest client: one pooled HTTP session, gzip NDJSON bodies and bounded retries with backoff.
+        env:
+            QUICKWIT_URL: quickwit REST endpoint (default http://localhost:7280)
+            ingest_gzip: compress the ingest bodies (default true)
+            ingest_timeout: seconds before an ingest request is abandoned and retried (default 60)"""
+        self.url = config('QUICKWIT_URL', default='http://localhost:7280')
+        self.compress = config('ingest_gzip', default=True, cast=bool)
+        self.timeout = config('ingest_timeout', default=60, cast=int)
+        self.session = None
+
+    def _get_session(self):
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=10, keepalive_timeout=60),
+                                                 timeout=aiohttp.ClientTimeout(total=self.timeout))
+        return self.session
+
+    async def ingest(self, index, body):
+        """Send a NDJSONWriter body to the index, retrying max_retry times on connection errors, 429 and 5xx"""
+        headers = {'Content-Type': 'application/x-ndjson'}
+        if self.compress:
+            headers['Content-Encoding'] = 'gzip'
+        endpoint = f'{self.url}/api/v1/{index}/ingest'
+        retry = 0
+        while True:
             try:
-                _tmp = data['variables']
-                if _tmp != '':
-                    data['variables'] = json.loads(_tmp)
-                else:
-                    data['variables'] = {}
-                _tmp = data['response']
-                if _tmp != '':
-                    data['response'] = json.loads(_tmp)
-                else:
-                    data['response'] = {}
-            except Exception as e:
-                print(f'Error {e}\tWhile decoding graphql\nEvent: {data}\n')
-        i += 1
-        res.append(json.dumps(data))
-    return '\n'.join(res)
+                async with self._get_session().post(endpoint, data=body, headers=headers) as res:
+                    if res.status < 400:
+                        return res.status
+                    error = f'HTTP {res.status} {await res.text()}'
+                    if res.status != 429 and res.status < 500:
+                        print(f'[ENDPOINT ERROR] Ingest into {index} rejected: {error}')
+                        return res.status
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                error = repr(e)
+            retry += 1
+            if retry > max_retry:
+                raise ConnectionError(f'[ENDPOINT CONNECTION FAIL] Failed to ingest into {endpoint}\n{error}\n')
+            print(f"[ENDPOINT ERROR] Failed to ingest into {endpoint} ({error}), retrying in {2**retry} seconds..\n")
+            await asyncio.sleep(2**retry)
+
+    async def ingest_many(self, bodies):
+        """Ingest {index: body} concurrently"""
+        await asyncio.gather(*(self.ingest(index, body) for index, body in bodies.items()))
+
+    async def close(self):
+        if self.session is not None:
+            await self.session.close()
+
+
+if orjson is not None:
+    def json_loads(data):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson is strict (e.g. NaN), the stdlib parser accepts what the tracker may send
+            return json.loads(data)
+
+    def json_dumps(obj) -> bytes:
+        try:
+            return orjson.dumps(obj, default=str)
+        except orjson.JSONEncodeError:
+            # e.g. integers over 64 bits, which the stdlib parser of json_loads may have produced
+            return json.dumps(obj, default=str).encode('utf-8')
+else:
+    json_loads = json.loads
+
+    def json_dumps(obj) -> bytes:
+        return json.dumps(obj, default=str).encode('utf-8')
+
+
+class NDJSONWriter:
+
+    def __init__(self, compress):
+        """Serializes the records one by one straight into the (gzip compressed) ingest body"""
+        self.buffer = io.BytesIO()
+        self.stream = gzip.GzipFile(fileobj=self.buffer, mode='wb', compresslevel=3) if compress else self.buffer
+        self.records = 0
+        self.size = 0
+
+    def write(self, record):
+        data = json_dumps(record)
+        self.stream.write(data)
+        self.stream.write(b'\n')
+        self.records += 1
+        self.size += len(data) + 1
+
+    def getvalue(self) -> bytes:
+        if self.stream is not self.buffer:
+            self.stream.close()
+        return self.buffer.getvalue()
+
+
+def _jsonify_data(data, msg_type):
+    """Parse the JSON strings of a fetchevent or graphql record so they are indexed as objects"""
+    if msg_type == 'fetchevent':
+        try:
+            _tmp = data['request']
+            data['request'] = json_loads(_tmp) if _tmp != '' else {}
+            _tmp = data['response']
+            if _tmp != '':
+                data['response'] = json_loads(_tmp)
+                body = data['response']['body']
+                if body[:1] == '{' or body[:2] == '[{':
+                    data['response']['body'] = json_loads(body)
+            else:
+                data['response'] = {}
+        except Exception as e:
+            print(f'Error {e}\tWhile decoding fetchevent\nEvent: {data}\n')
+    elif msg_type == 'graphql':
+        try:
+            _tmp = data['variables']
+            data['variables'] = json_loads(_tmp) if _tmp != '' else {}
+            _tmp = data['response']
+            data['response'] = json_loads(_tmp) if _tmp != '' else {}
+        except Exception as e:
+            print(f'Error {e}\tWhile decoding graphql\nEvent: {data}\n')
+    return data
 
 def message_type(message):
     if decryption:
-        if isinstance(message, FetchEvent) or isinstance(Fetch):
+        if isinstance(message, NetworkRequest) or isinstance(message, Fetch):
             return 'fetchevent'
         elif isinstance(message, PageEvent):
             return 'pageevent'
@@ -90,6 +170,110 @@ def message_type(message):
             return 'default'
 
 
+class ConsumerMetrics:
+
+    def __init__(self, consumer):
+        """Throughput and lag of each assigned partition, accumulated between two calls to report()"""
+        self.consumer = consumer
+        self.records = defaultdict(int)
+        self.calls = 0
+        self.start = time()
+
+    def track(self, records):
+        self.calls += 1
+        for msg in records:
+            self.records[(msg.topic(), msg.partition())] += 1
+
+    def lag(self):
+        """Messages between the consumer position and the high watermark of each assigned partition"""
+        lag = dict()
+        for tp in self.consumer.position(self.consumer.assignment()):
+            low, high = self.consumer.get_watermark_offsets(tp, cached=True) or (-1, -1)
+            if high >= 0:
+                lag[(tp.topic, tp.partition)] = max(high - (tp.offset if tp.offset >= 0 else low), 0)
+        return lag
+
+    def report(self):
+        elapsed = max(time() - self.start, 1e-3)
+        total = sum(self.records.values())
+        print(f'[INFO] Consumed {total} records in {self.calls} consume calls, {total / elapsed:.1f} records/s')
+        lag = self.lag()
+        for key in sorted(set(lag) | set(self.records)):
+            print(f'[INFO]   {key[0]}[{key[1]}] lag={lag.get(key, "?")} '
+                  f'throughput={self.records.get(key, 0) / elapsed:.1f} records/s')
+        self.records = defaultdict(int)
+        self.calls = 0
+        self.start = time()
+
+
+class DedupWindow:
+
+    def __init__(self):
+        """Digests of the kafka values seen in the last window seconds, to drop redelivered values before parsing them.
+        env:
+            dedup_window: seconds a value is remembered (default 600)
+            dedup_max_size: max number of remembered values, the oldest are forgotten first (default 500000)"""
+        self.window = config('dedup_window', default=600, cast=int)
+        self.max_size = config('dedup_max_size', default=500000, cast=int)
+        self.seen_at = OrderedDict()
+        self.duplicates = 0
+
+    def seen(self, raw):
+        """Return True if raw was already seen in the window, remember it otherwise"""
+        digest = hashlib.blake2b(raw, digest_size=16).digest()
+        now = time()
+        limit = now - self.window
+        # Values are kept in insertion order, so the expired ones are at the front
+        while self.seen_at:
+            oldest = next(iter(self.seen_at.values()))
+            if oldest >= limit:
+                break
+            self.seen_at.popitem(last=False)
+        if digest in self.seen_at:
+            self.duplicates += 1
+            return True
+        self.seen_at[digest] = now
+        if len(self.seen_at) > self.max_size:
+            self.seen_at.popitem(last=False)
+        return False
+
+
+class IndexBuffer:
+
+    def __init__(self, index, max_records, max_bytes, max_latency, compress):
+        """Records waiting to be ingested into one index, flushed on record count, uncompressed size or age.
+        Keeps the first buffered offset of each partition, the records before it are already ingested."""
+        self.index = index
+        self.max_records = max_records
+        self.max_bytes = max_bytes
+        self.max_latency = max_latency
+        self.compress = compress
+        self.reset()
+
+    def reset(self):
+        self.writer = NDJSONWriter(self.compress)
+        self.first_offsets = dict()
+        self.first_at = None
+
+    def add(self, record, partition, offset):
+        if self.first_at is None:
+            self.first_at = time()
+        self.first_offsets.setdefault(partition, offset)
+        self.writer.write(record)
+
+    def due(self, now):
+        if self.first_at is None:
+            return False
+        return self.writer.records >= self.max_records or self.writer.size >= self.max_bytes \
+            or now - self.first_at >= self.max_latency
+
+    def take(self):
+        """Return the ingest body and empty the buffer"""
+        body = self.writer.getvalue()
+        self.reset()
+        return body
+
+
 class KafkaFilter():
 
     def __init__(self):
@@ -99,6 +283,14 @@ class KafkaFilter():
         fetchevent_maxsize = config('fetch_maxsize', default=100, cast=int)
         graphql_maxsize = config('graphql_maxsize', default=100, cast=int)
         pageevent_maxsize = config('pageevent_maxsize', default=100, cast=int)
+        # Each index is flushed on its own once it holds *_maxsize records, flush_max_bytes of NDJSON
+        # or records older than flush_max_latency seconds
+        flush_max_bytes = config('flush_max_bytes', default=8 * 1024 * 1024, cast=int)
+        self.flush_max_latency = config('flush_max_latency', default=30, cast=int)
+        # consume_batch_size records are read at once, waiting at most consume_max_wait seconds
+        self.consume_batch_size = config('consume_batch_size', default=500, cast=int)
+        self.consume_max_wait = config('consume_max_wait', default=1.0, cast=float)
+        self.metrics_interval = config('metrics_interval', default=60, cast=int)
 
         if decryption:
             self.codec = MessageCodec()
@@ -118,71 +310,116 @@ class KafkaFilter():
                 #value_deserializer=lambda m: json.loads(m.decode('utf-8')),
                 "enable.auto.commit": False
             })
-        self.consumer.subscribe([topic])
-        self.queues = {'fetchevent': queue.Queue(fetchevent_maxsize),
-                'graphql': queue.Queue(graphql_maxsize),
-                'pageevent': queue.Queue(pageevent_maxsize)
-                }
+        # The ingest client lives in its own event loop, driven from the flushes
+        self.loop = asyncio.new_event_loop()
+        self.quickwit = QuickwitClient()
+        self.metrics = ConsumerMetrics(self.consumer)
+        # Next offset of each partition once its records are queued, only those are committed on flush
+        self.processed = dict()
+        self.dedup = DedupWindow()
+        self.buffers = {index: IndexBuffer(index, max_records, flush_max_bytes, self.flush_max_latency,
+                                           self.quickwit.compress)
+                        for index, max_records in (('fetchevent', fetchevent_maxsize),
+                                                   ('graphql', graphql_maxsize),
+                                                   ('pageevent', pageevent_maxsize))}
+        self.committed = dict()
+        self.last_commit = time()
+        # Partitions owned by this consumer, only their offsets are committed
+        self.assigned = set()
+        self.consumer.subscribe([topic], on_assign=self.on_assign, on_revoke=self.on_revoke)
+
+    def on_assign(self, consumer, partitions):
+        self.assigned.update((tp.topic, tp.partition) for tp in partitions)
+        consumer.assign(partitions)
 
-    def add_to_queue(self, message):
+    def on_revoke(self, consumer, partitions):
+        """The buffers mix the records of all the partitions: everything buffered is ingested and committed while
+        the revoked partitions are still ours, then their offsets are forgotten so they are never committed again
+        over the progress of their new owner"""
+        self.flush_to_quickwit(force=True)
+        self.commit()
+        revoked = {(tp.topic, tp.partition) for tp in partitions}
+        self.assigned -= revoked
+        for partition in revoked:
+            self.processed.pop(partition, None)
+            self.committed.pop(partition, None)
+            for buffer in self.buffers.values():
+                buffer.first_offsets.pop(partition, None)
+
+    def add_to_queue(self, message, partition, offset):
         associated_queue = message_type(message)
         if associated_queue == 'default':
             return
-        if self.queues[associated_queue].full():
-            self.flush_to_quickwit()
-        self.queues[associated_queue].put(message)
-
-    def flush_to_quickwit(self):
-        for queue_name, _queue in self.queues.items():
-            _list = list()
-            unix_timestamp = int(datetime.now().timestamp())
-            while not _queue.empty():
-                msg = _queue.get()
-                if decryption:
-                    value = msg.__dict__
-                else:
-                    value = dict(msg)
-                value['insertion_timestamp'] = unix_timestamp
-                if queue_name == 'fetchevent' and 'message_id' not in value.keys():
-                    value['message_id'] = 0
-                _list.append(value)
-            if len(_list) > 0:
-                _quickwit_ingest(queue_name, _list)
-        self.consumer.commit()
+        if decryption:
+            value = message.to_dict()
+        else:
+            value = dict(message)
+        value['insertion_timestamp'] = int(datetime.now().timestamp())
+        if associated_queue == 'fetchevent' and 'message_id' not in value.keys():
+            value['message_id'] = 0
+        self.buffers[associated_queue].add(_jsonify_data(value, associated_queue), partition, offset)
+
+    def flush_to_quickwit(self, force=False):
+        """Ingest the indexes whose buffer is due (all of them if force) concurrently, then commit"""
+        now = time()
+        bodies = {index: buffer.take() for index, buffer in self.buffers.items()
+                  if buffer.first_at is not None and (force or buffer.due(now))}
+        if bodies:
+            self.loop.run_until_complete(self.quickwit.ingest_many(bodies))
+        if bodies or now - self.last_commit >= self.flush_max_latency:
+            self.commit()
+
+    def commit_barrier(self):
+        """Offsets up to which every index has ingested its records: a partition is only committed up to
+        the first of its records still buffered in any index. Partitions no longer assigned are left out"""
+        offsets = {partition: offset for partition, offset in self.processed.items() if partition in self.assigned}
+        for buffer in self.buffers.values():
+            for partition, offset in buffer.first_offsets.items():
+                if partition in offsets and offset < offsets[partition]:
+                    offsets[partition] = offset
+        return offsets
+
+    def commit(self):
+        offsets = {partition: offset for partition, offset in self.commit_barrier().items()
+                   if self.committed.get(partition) != offset}
+        if offsets:
+            self.consumer.commit(offsets=[TopicPartition(topic, partition, offset)
+                                          for (topic, partition), offset in offsets.items()],
+                                 asynchronous=False)
+            self.committed.update(offsets)
+        self.last_commit = time()
 
     def run(self):
-        _tmp_previous = None
-        repeated = False
+        last_report = time()
         while True:
-            msg = self.consumer.poll(1.0)
-            if msg is None:
-                continue
-            if msg.error():
-                print(f'[Consumer error] {msg.error()}')
-                continue
-            value = json.loads(msg.value().decode('utf-8'))
-            if decryption:
-                messages = self.codec.decode_detailed(value)
-            else:
-                messages = [value]
-
-            if _tmp_previous is None:
-                _tmp_previous = messages
-                if type(messages)==list:
-                    for message in messages:
-                        self.add_to_queue(message)
-                else:
-                    self.add_to_queue(messages)
-            elif _tmp_previous != messages:
-                if type(messages)==list:
-                    for message in messages:
-                        self.add_to_queue(message)
-                else:
-                    self.add_to_queue(messages)
-                _tmp_previous = messages
-                repeated = False
-            elif not repeated:
-                repeated = True
+            msgs = self.consumer.consume(num_messages=self.consume_batch_size, timeout=self.consume_max_wait)
+            self.metrics.track(msgs)
+            if time() - last_report > self.metrics_interval:
+                self.metrics.report()
+                print(f'[INFO] Duplicated values dropped: {self.dedup.duplicates}')
+                self.dedup.duplicates = 0
+                last_report = time()
+            for msg in msgs:
+                if msg.error():
+                    print(f'[Consumer error] {msg.error()}')
+                    continue
+                raw = msg.value()
+                partition = (msg.topic(), msg.partition())
+                if not self.dedup.seen(raw):
+                    value = json_loads(raw)
+                    if decryption:
+                        messages = self.codec.decode_detailed(value)
+                    else:
+                        messages = [value]
+                    if type(messages)==list:
+                        for message in messages:
+                            self.add_to_queue(message, partition, msg.offset())
+                    else:
+                        self.add_to_queue(messages, partition, msg.offset())
+                self.processed[partition] = msg.offset() + 1
+            # Checked after every consume call, which returns at least every consume_max_wait seconds,
+            # so idle indexes are flushed within flush_max_latency
+            self.flush_to_quickwit()
 
 
 if __name__ == '__main__':
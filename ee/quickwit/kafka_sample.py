@@ -4,8 +4,8 @@ from kafka import KafkaConsumer, KafkaProducer
 from datetime import datetime
 from collections import defaultdict
 
-from msgcodec.codec import MessageCodec
-from msgcodec.messages import Fetch, FetchEvent, PageEvent, GraphQL
+from msgcodec.msgcodec import MessageCodec
+from msgcodec.messages import Fetch, NetworkRequest, PageEvent, GraphQL
 import json
 
 import getopt, sys
@@ -80,7 +80,7 @@ def consumer_producer_end():
             print('-')
         for message in messages:
             send = False
-            if isinstance(message, Fetch) or isinstance(message, FetchEvent):
+            if isinstance(message, Fetch) or isinstance(message, NetworkRequest):
                 producer.send('quickwit-kafka', value=transform_fetch(message))
                 print(f'added message {n} type Fetch')
                 sleep(5)
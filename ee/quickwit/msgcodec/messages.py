@@ -1,15 +1,18 @@
-"""
-Representations of Kafka messages
-"""
-from abc import ABC
+# Auto-generated, do not edit
 
+from abc import ABC
 
 class Message(ABC):
-    pass
+    # Messages are built by the thousand per batch, __slots__ keeps them free of a per-instance __dict__
+    __slots__ = ()
+
+    def to_dict(self) -> dict:
+        return {attr: getattr(self, attr) for attr in self.__slots__}
 
 
 class Timestamp(Message):
     __id__ = 0
+    __slots__ = ('timestamp',)
 
     def __init__(self, timestamp):
         self.timestamp = timestamp
@@ -17,11 +20,9 @@ class Timestamp(Message):
 
 class SessionStart(Message):
     __id__ = 1
+    __slots__ = ('timestamp', 'project_id', 'tracker_version', 'rev_id', 'user_uuid', 'user_agent', 'user_os', 'user_os_version', 'user_browser', 'user_browser_version', 'user_device', 'user_device_type', 'user_device_memory_size', 'user_device_heap_size', 'user_country', 'user_id',)
 
-    def __init__(self, timestamp, project_id, tracker_version, rev_id, user_uuid,
-                 user_agent, user_os, user_os_version, user_browser, user_browser_version,
-                 user_device, user_device_type, user_device_memory_size, user_device_heap_size,
-                 user_country):
+    def __init__(self, timestamp, project_id, tracker_version, rev_id, user_uuid, user_agent, user_os, user_os_version, user_browser, user_browser_version, user_device, user_device_type, user_device_memory_size, user_device_heap_size, user_country, user_id):
         self.timestamp = timestamp
         self.project_id = project_id
         self.tracker_version = tracker_version
@@ -37,18 +38,12 @@ class SessionStart(Message):
         self.user_device_memory_size = user_device_memory_size
         self.user_device_heap_size = user_device_heap_size
         self.user_country = user_country
+        self.user_id = user_id
 
 
-class SessionDisconnect(Message):
-    __id__ = 2
-
-    def __init__(self, timestamp):
-        self.timestamp = timestamp
-
-
-class SessionEnd(Message):
+class SessionEndDeprecated(Message):
     __id__ = 3
-    __name__ = 'SessionEnd'
+    __slots__ = ('timestamp',)
 
     def __init__(self, timestamp):
         self.timestamp = timestamp
@@ -56,6 +51,7 @@ class SessionEnd(Message):
 
 class SetPageLocation(Message):
     __id__ = 4
+    __slots__ = ('url', 'referrer', 'navigation_start',)
 
     def __init__(self, url, referrer, navigation_start):
         self.url = url
@@ -65,6 +61,7 @@ class SetPageLocation(Message):
 
 class SetViewportSize(Message):
     __id__ = 5
+    __slots__ = ('width', 'height',)
 
     def __init__(self, width, height):
         self.width = width
@@ -73,6 +70,7 @@ class SetViewportSize(Message):
 
 class SetViewportScroll(Message):
     __id__ = 6
+    __slots__ = ('x', 'y',)
 
     def __init__(self, x, y):
         self.x = x
@@ -81,14 +79,19 @@ class SetViewportScroll(Message):
 
 class CreateDocument(Message):
     __id__ = 7
+    __slots__ = ()
+
+    def __init__(self, ):
+        pass
 
 
 class CreateElementNode(Message):
     __id__ = 8
+    __slots__ = ('id', 'parent_id', 'index', 'tag', 'svg',)
 
     def __init__(self, id, parent_id, index, tag, svg):
         self.id = id
-        self.parent_id = parent_id,
+        self.parent_id = parent_id
         self.index = index
         self.tag = tag
         self.svg = svg
@@ -96,6 +99,7 @@ class CreateElementNode(Message):
 
 class CreateTextNode(Message):
     __id__ = 9
+    __slots__ = ('id', 'parent_id', 'index',)
 
     def __init__(self, id, parent_id, index):
         self.id = id
@@ -105,6 +109,7 @@ class CreateTextNode(Message):
 
 class MoveNode(Message):
     __id__ = 10
+    __slots__ = ('id', 'parent_id', 'index',)
 
     def __init__(self, id, parent_id, index):
         self.id = id
@@ -114,6 +119,7 @@ class MoveNode(Message):
 
 class RemoveNode(Message):
     __id__ = 11
+    __slots__ = ('id',)
 
     def __init__(self, id):
         self.id = id
@@ -121,8 +127,9 @@ class RemoveNode(Message):
 
 class SetNodeAttribute(Message):
     __id__ = 12
+    __slots__ = ('id', 'name', 'value',)
 
-    def __init__(self, id, name: str, value: str):
+    def __init__(self, id, name, value):
         self.id = id
         self.name = name
         self.value = value
@@ -130,32 +137,36 @@ class SetNodeAttribute(Message):
 
 class RemoveNodeAttribute(Message):
     __id__ = 13
+    __slots__ = ('id', 'name',)
 
-    def __init__(self, id, name: str):
+    def __init__(self, id, name):
         self.id = id
         self.name = name
 
 
 class SetNodeData(Message):
     __id__ = 14
+    __slots__ = ('id', 'data',)
 
-    def __init__(self, id, data: str):
+    def __init__(self, id, data):
         self.id = id
         self.data = data
 
 
 class SetCSSData(Message):
     __id__ = 15
+    __slots__ = ('id', 'data',)
 
-    def __init__(self, id, data: str):
+    def __init__(self, id, data):
         self.id = id
         self.data = data
 
 
 class SetNodeScroll(Message):
     __id__ = 16
+    __slots__ = ('id', 'x', 'y',)
 
-    def __init__(self, id, x: int, y: int):
+    def __init__(self, id, x, y):
         self.id = id
         self.x = x
         self.y = y
@@ -163,16 +174,18 @@ class SetNodeScroll(Message):
 
 class SetInputTarget(Message):
     __id__ = 17
+    __slots__ = ('id', 'label',)
 
-    def __init__(self, id, label: str):
+    def __init__(self, id, label):
         self.id = id
         self.label = label
 
 
 class SetInputValue(Message):
     __id__ = 18
+    __slots__ = ('id', 'value', 'mask',)
 
-    def __init__(self, id, value: str, mask: int):
+    def __init__(self, id, value, mask):
         self.id = id
         self.value = value
         self.mask = mask
@@ -180,43 +193,51 @@ class SetInputValue(Message):
 
 class SetInputChecked(Message):
     __id__ = 19
+    __slots__ = ('id', 'checked',)
 
-    def __init__(self, id, checked: bool):
+    def __init__(self, id, checked):
         self.id = id
         self.checked = checked
 
 
 class MouseMove(Message):
     __id__ = 20
+    __slots__ = ('x', 'y',)
 
     def __init__(self, x, y):
         self.x = x
         self.y = y
 
 
-class MouseClickDepricated(Message):
+class NetworkRequest(Message):
     __id__ = 21
+    __slots__ = ('type', 'method', 'url', 'request', 'response', 'status', 'timestamp', 'duration',)
 
-    def __init__(self, id, hesitation_time, label: str):
-        self.id = id
-        self.hesitation_time = hesitation_time
-        self.label = label
+    def __init__(self, type, method, url, request, response, status, timestamp, duration):
+        self.type = type
+        self.method = method
+        self.url = url
+        self.request = request
+        self.response = response
+        self.status = status
+        self.timestamp = timestamp
+        self.duration = duration
 
 
 class ConsoleLog(Message):
     __id__ = 22
+    __slots__ = ('level', 'value',)
 
-    def __init__(self, level: str, value: str):
+    def __init__(self, level, value):
         self.level = level
         self.value = value
 
 
 class PageLoadTiming(Message):
     __id__ = 23
+    __slots__ = ('request_start', 'response_start', 'response_end', 'dom_content_loaded_event_start', 'dom_content_loaded_event_end', 'load_event_start', 'load_event_end', 'first_paint', 'first_contentful_paint',)
 
-    def __init__(self, request_start, response_start, response_end, dom_content_loaded_event_start,
-                 dom_content_loaded_event_end, load_event_start, load_event_end,
-                 first_paint, first_contentful_paint):
+    def __init__(self, request_start, response_start, response_end, dom_content_loaded_event_start, dom_content_loaded_event_end, load_event_start, load_event_end, first_paint, first_contentful_paint):
         self.request_start = request_start
         self.response_start = response_start
         self.response_end = response_end
@@ -230,26 +251,29 @@ class PageLoadTiming(Message):
 
 class PageRenderTiming(Message):
     __id__ = 24
+    __slots__ = ('speed_index', 'visually_complete', 'time_to_interactive',)
 
     def __init__(self, speed_index, visually_complete, time_to_interactive):
         self.speed_index = speed_index
         self.visually_complete = visually_complete
         self.time_to_interactive = time_to_interactive
 
-class JSException(Message):
+
+class JSExceptionDeprecated(Message):
     __id__ = 25
+    __slots__ = ('name', 'message', 'payload',)
 
-    def __init__(self, name: str, message: str, payload: str):
+    def __init__(self, name, message, payload):
         self.name = name
         self.message = message
         self.payload = payload
 
 
-class RawErrorEvent(Message):
+class IntegrationEvent(Message):
     __id__ = 26
+    __slots__ = ('timestamp', 'source', 'name', 'message', 'payload',)
 
-    def __init__(self, timestamp, source: str, name: str, message: str,
-                 payload: str):
+    def __init__(self, timestamp, source, name, message, payload):
         self.timestamp = timestamp
         self.source = source
         self.name = name
@@ -257,55 +281,45 @@ class RawErrorEvent(Message):
         self.payload = payload
 
 
-class RawCustomEvent(Message):
+class CustomEvent(Message):
     __id__ = 27
+    __slots__ = ('name', 'payload',)
 
-    def __init__(self, name: str, payload: str):
+    def __init__(self, name, payload):
         self.name = name
         self.payload = payload
 
 
 class UserID(Message):
     __id__ = 28
+    __slots__ = ('id',)
 
-    def __init__(self, id: str):
+    def __init__(self, id):
         self.id = id
 
 
 class UserAnonymousID(Message):
     __id__ = 29
+    __slots__ = ('id',)
 
-    def __init__(self, id: str):
+    def __init__(self, id):
         self.id = id
 
 
 class Metadata(Message):
     __id__ = 30
+    __slots__ = ('key', 'value',)
 
-    def __init__(self, key: str, value: str):
+    def __init__(self, key, value):
         self.key = key
         self.value = value
 
 
-class PerformanceTrack(Message):
-    __id__ = 49
-
-    def __init__(self, frames: int, ticks: int, total_js_heap_size,
-                 used_js_heap_size):
-        self.frames = frames
-        self.ticks = ticks
-        self.total_js_heap_size = total_js_heap_size
-        self.used_js_heap_size = used_js_heap_size
-
-
 class PageEvent(Message):
     __id__ = 31
+    __slots__ = ('message_id', 'timestamp', 'url', 'referrer', 'loaded', 'request_start', 'response_start', 'response_end', 'dom_content_loaded_event_start', 'dom_content_loaded_event_end', 'load_event_start', 'load_event_end', 'first_paint', 'first_contentful_paint', 'speed_index', 'visually_complete', 'time_to_interactive',)
 
-    def __init__(self, message_id, timestamp, url: str, referrer: str,
-                 loaded: bool, request_start, response_start, response_end,
-                 dom_content_loaded_event_start, dom_content_loaded_event_end,
-                 load_event_start, load_event_end, first_paint, first_contentful_paint,
-                 speed_index, visually_complete, time_to_interactive):
+    def __init__(self, message_id, timestamp, url, referrer, loaded, request_start, response_start, response_end, dom_content_loaded_event_start, dom_content_loaded_event_end, load_event_start, load_event_end, first_paint, first_contentful_paint, speed_index, visually_complete, time_to_interactive):
         self.message_id = message_id
         self.timestamp = timestamp
         self.url = url
@@ -327,8 +341,9 @@ class PageEvent(Message):
 
 class InputEvent(Message):
     __id__ = 32
+    __slots__ = ('message_id', 'timestamp', 'value', 'value_masked', 'label',)
 
-    def __init__(self, message_id, timestamp, value: str, value_masked: bool, label: str):
+    def __init__(self, message_id, timestamp, value, value_masked, label):
         self.message_id = message_id
         self.timestamp = timestamp
         self.value = value
@@ -336,62 +351,11 @@ class InputEvent(Message):
         self.label = label
 
 
-class ClickEvent(Message):
-    __id__ = 33
-
-    def __init__(self, message_id, timestamp, hesitation_time, label: str):
-        self.message_id = message_id
-        self.timestamp = timestamp
-        self.hesitation_time = hesitation_time
-        self.label = label
-
-
-class ErrorEvent(Message):
-    __id__ = 34
-
-    def __init__(self, message_id, timestamp, source: str, name: str, message: str,
-                 payload: str):
-        self.message_id = message_id
-        self.timestamp = timestamp
-        self.source = source
-        self.name = name
-        self.message = message
-        self.payload = payload
-
-
-class ResourceEvent(Message):
-    __id__ = 35
-
-    def __init__(self, message_id, timestamp, duration, ttfb, header_size, encoded_body_size,
-                 decoded_body_size, url: str, type: str, success: bool, method: str, status):
-        self.message_id = message_id
-        self.timestamp = timestamp
-        self.duration = duration
-        self.ttfb = ttfb
-        self.header_size = header_size
-        self.encoded_body_size = encoded_body_size
-        self.decoded_body_size = decoded_body_size
-        self.url = url
-        self.type = type
-        self.success = success
-        self.method = method
-        self.status = status
-
-
-class CustomEvent(Message):
-    __id__ = 36
-
-    def __init__(self, message_id, timestamp, name: str, payload: str):
-        self.message_id = message_id
-        self.timestamp = timestamp
-        self.name = name
-        self.payload = payload
-
-
 class CSSInsertRule(Message):
     __id__ = 37
+    __slots__ = ('id', 'rule', 'index',)
 
-    def __init__(self, id, rule: str, index):
+    def __init__(self, id, rule, index):
         self.id = id
         self.rule = rule
         self.index = index
@@ -399,6 +363,7 @@ class CSSInsertRule(Message):
 
 class CSSDeleteRule(Message):
     __id__ = 38
+    __slots__ = ('id', 'index',)
 
     def __init__(self, id, index):
         self.id = id
@@ -407,9 +372,9 @@ class CSSDeleteRule(Message):
 
 class Fetch(Message):
     __id__ = 39
+    __slots__ = ('method', 'url', 'request', 'response', 'status', 'timestamp', 'duration',)
 
-    def __init__(self, method: str, url: str, request: str, response: str, status,
-                 timestamp, duration):
+    def __init__(self, method, url, request, response, status, timestamp, duration):
         self.method = method
         self.url = url
         self.request = request
@@ -421,8 +386,9 @@ class Fetch(Message):
 
 class Profiler(Message):
     __id__ = 40
+    __slots__ = ('name', 'duration', 'args', 'result',)
 
-    def __init__(self, name: str, duration, args: str, result: str):
+    def __init__(self, name, duration, args, result):
         self.name = name
         self.duration = duration
         self.args = args
@@ -431,32 +397,26 @@ class Profiler(Message):
 
 class OTable(Message):
     __id__ = 41
+    __slots__ = ('key', 'value',)
 
-    def __init__(self, key: str, value: str):
+    def __init__(self, key, value):
         self.key = key
         self.value = value
 
 
 class StateAction(Message):
     __id__ = 42
+    __slots__ = ('type',)
 
-    def __init__(self, type: str):
-        self.type = type
-
-
-class StateActionEvent(Message):
-    __id__ = 43
-
-    def __init__(self, message_id, timestamp, type: str):
-        self.message_id = message_id
-        self.timestamp = timestamp
+    def __init__(self, type):
         self.type = type
 
 
 class Redux(Message):
     __id__ = 44
+    __slots__ = ('action', 'state', 'duration',)
 
-    def __init__(self, action: str, state: str, duration):
+    def __init__(self, action, state, duration):
         self.action = action
         self.state = state
         self.duration = duration
@@ -464,24 +424,27 @@ class Redux(Message):
 
 class Vuex(Message):
     __id__ = 45
+    __slots__ = ('mutation', 'state',)
 
-    def __init__(self, mutation: str, state: str):
+    def __init__(self, mutation, state):
         self.mutation = mutation
         self.state = state
 
 
 class MobX(Message):
     __id__ = 46
+    __slots__ = ('type', 'payload',)
 
-    def __init__(self, type: str, payload: str):
+    def __init__(self, type, payload):
         self.type = type
         self.payload = payload
 
 
 class NgRx(Message):
     __id__ = 47
+    __slots__ = ('action', 'state', 'duration',)
 
-    def __init__(self, action: str, state: str, duration):
+    def __init__(self, action, state, duration):
         self.action = action
         self.state = state
         self.duration = duration
@@ -489,9 +452,9 @@ class NgRx(Message):
 
 class GraphQL(Message):
     __id__ = 48
+    __slots__ = ('operation_kind', 'operation_name', 'variables', 'response',)
 
-    def __init__(self, operation_kind: str, operation_name: str,
-                 variables: str, response: str):
+    def __init__(self, operation_kind, operation_name, variables, response):
         self.operation_kind = operation_kind
         self.operation_name = operation_name
         self.variables = variables
@@ -500,51 +463,39 @@ class GraphQL(Message):
 
 class PerformanceTrack(Message):
     __id__ = 49
+    __slots__ = ('frames', 'ticks', 'total_js_heap_size', 'used_js_heap_size',)
 
-    def __init__(self, frames: int, ticks: int,
-                 total_js_heap_size, used_js_heap_size):
+    def __init__(self, frames, ticks, total_js_heap_size, used_js_heap_size):
         self.frames = frames
         self.ticks = ticks
         self.total_js_heap_size = total_js_heap_size
         self.used_js_heap_size = used_js_heap_size
 
 
-class GraphQLEvent(Message):
+class StringDict(Message):
     __id__ = 50
+    __slots__ = ('key', 'value',)
 
-    def __init__(self, message_id, timestamp, name: str):
-        self.message_id = message_id
-        self.timestamp = timestamp
-        self.name = name
+    def __init__(self, key, value):
+        self.key = key
+        self.value = value
 
 
-class FetchEvent(Message):
+class SetNodeAttributeDict(Message):
     __id__ = 51
+    __slots__ = ('id', 'name_key', 'value_key',)
 
-    def __init__(self, message_id, timestamp, method: str, url, request, response: str,
-                  status, duration):
-        self.message_id = message_id
-        self.timestamp = timestamp
-        self.method = method
-        self.url = url
-        self.request = request
-        self.response = response
-        self.status = status
-        self.duration = duration
-
-
-class DomDrop(Message):
-    __id__ = 52
-
-    def __init__(self, timestamp):
-        self.timestamp = timestamp
+    def __init__(self, id, name_key, value_key):
+        self.id = id
+        self.name_key = name_key
+        self.value_key = value_key
 
 
-class ResourceTiming(Message):
+class ResourceTimingDeprecated(Message):
     __id__ = 53
+    __slots__ = ('timestamp', 'duration', 'ttfb', 'header_size', 'encoded_body_size', 'decoded_body_size', 'url', 'initiator',)
 
-    def __init__(self, timestamp, duration, ttfb, header_size, encoded_body_size,
-                 decoded_body_size, url, initiator):
+    def __init__(self, timestamp, duration, ttfb, header_size, encoded_body_size, decoded_body_size, url, initiator):
         self.timestamp = timestamp
         self.duration = duration
         self.ttfb = ttfb
@@ -557,28 +508,26 @@ class ResourceTiming(Message):
 
 class ConnectionInformation(Message):
     __id__ = 54
+    __slots__ = ('downlink', 'type',)
 
-    def __init__(self, downlink, type: str):
+    def __init__(self, downlink, type):
         self.downlink = downlink
         self.type = type
 
 
 class SetPageVisibility(Message):
     __id__ = 55
+    __slots__ = ('hidden',)
 
-    def __init__(self, hidden: bool):
+    def __init__(self, hidden):
         self.hidden = hidden
 
 
 class PerformanceTrackAggr(Message):
     __id__ = 56
+    __slots__ = ('timestamp_start', 'timestamp_end', 'min_fps', 'avg_fps', 'max_fps', 'min_cpu', 'avg_cpu', 'max_cpu', 'min_total_js_heap_size', 'avg_total_js_heap_size', 'max_total_js_heap_size', 'min_used_js_heap_size', 'avg_used_js_heap_size', 'max_used_js_heap_size',)
 
-    def __init__(self, timestamp_start, timestamp_end, min_fps, avg_fps,
-                 max_fps, min_cpu, avg_cpu, max_cpu,
-                 min_total_js_heap_size, avg_total_js_heap_size,
-                 max_total_js_heap_size, min_used_js_heap_size,
-                 avg_used_js_heap_size, max_used_js_heap_size
-                 ):
+    def __init__(self, timestamp_start, timestamp_end, min_fps, avg_fps, max_fps, min_cpu, avg_cpu, max_cpu, min_total_js_heap_size, avg_total_js_heap_size, max_total_js_heap_size, min_used_js_heap_size, avg_used_js_heap_size, max_used_js_heap_size):
         self.timestamp_start = timestamp_start
         self.timestamp_end = timestamp_end
         self.min_fps = min_fps
@@ -595,11 +544,30 @@ class PerformanceTrackAggr(Message):
         self.max_used_js_heap_size = max_used_js_heap_size
 
 
+class LoadFontFace(Message):
+    __id__ = 57
+    __slots__ = ('parent_id', 'family', 'source', 'descriptors',)
+
+    def __init__(self, parent_id, family, source, descriptors):
+        self.parent_id = parent_id
+        self.family = family
+        self.source = source
+        self.descriptors = descriptors
+
+
+class SetNodeFocus(Message):
+    __id__ = 58
+    __slots__ = ('id',)
+
+    def __init__(self, id):
+        self.id = id
+
+
 class LongTask(Message):
     __id__ = 59
+    __slots__ = ('timestamp', 'duration', 'context', 'container_type', 'container_src', 'container_id', 'container_name',)
 
-    def __init__(self, timestamp, duration, context, container_type, container_src: str,
-                 container_id: str, container_name: str):
+    def __init__(self, timestamp, duration, context, container_type, container_src, container_id, container_name):
         self.timestamp = timestamp
         self.duration = duration
         self.context = context
@@ -609,30 +577,32 @@ class LongTask(Message):
         self.container_name = container_name
 
 
-class SetNodeURLBasedAttribute(Message):
+class SetNodeAttributeURLBased(Message):
     __id__ = 60
+    __slots__ = ('id', 'name', 'value', 'base_url',)
 
-    def __init__(self, id, name: str, value: str, base_url: str):
+    def __init__(self, id, name, value, base_url):
         self.id = id
         self.name = name
         self.value = value
         self.base_url = base_url
 
 
-class SetStyleData(Message):
+class SetCSSDataURLBased(Message):
     __id__ = 61
+    __slots__ = ('id', 'data', 'base_url',)
 
-    def __init__(self, id, data: str, base_url: str):
+    def __init__(self, id, data, base_url):
         self.id = id
         self.data = data
         self.base_url = base_url
 
 
-class IssueEvent(Message):
+class IssueEventDeprecated(Message):
     __id__ = 62
+    __slots__ = ('message_id', 'timestamp', 'type', 'context_string', 'context', 'payload',)
 
-    def __init__(self, message_id, timestamp, type: str, context_string: str,
-                 context: str, payload: str):
+    def __init__(self, message_id, timestamp, type, context_string, context, payload):
         self.message_id = message_id
         self.timestamp = timestamp
         self.type = type
@@ -643,26 +613,25 @@ class IssueEvent(Message):
 
 class TechnicalInfo(Message):
     __id__ = 63
+    __slots__ = ('type', 'value',)
 
-    def __init__(self, type: str, value: str):
+    def __init__(self, type, value):
         self.type = type
         self.value = value
 
 
 class CustomIssue(Message):
     __id__ = 64
+    __slots__ = ('name', 'payload',)
 
-    def __init__(self, name: str, payload: str):
+    def __init__(self, name, payload):
         self.name = name
         self.payload = payload
 
 
-class PageClose(Message):
-    __id__ = 65
-
-
 class AssetCache(Message):
     __id__ = 66
+    __slots__ = ('url',)
 
     def __init__(self, url):
         self.url = url
@@ -670,6 +639,7 @@ class AssetCache(Message):
 
 class CSSInsertRuleURLBased(Message):
     __id__ = 67
+    __slots__ = ('id', 'rule', 'index', 'base_url',)
 
     def __init__(self, id, rule, index, base_url):
         self.id = id
@@ -680,8 +650,9 @@ class CSSInsertRuleURLBased(Message):
 
 class MouseClick(Message):
     __id__ = 69
+    __slots__ = ('id', 'hesitation_time', 'label', 'selector',)
 
-    def __init__(self, id, hesitation_time, label: str, selector):
+    def __init__(self, id, hesitation_time, label, selector):
         self.id = id
         self.hesitation_time = hesitation_time
         self.label = label
@@ -690,26 +661,234 @@ class MouseClick(Message):
 
 class CreateIFrameDocument(Message):
     __id__ = 70
+    __slots__ = ('frame_id', 'id',)
 
     def __init__(self, frame_id, id):
         self.frame_id = frame_id
         self.id = id
 
 
+class AdoptedSSReplaceURLBased(Message):
+    __id__ = 71
+    __slots__ = ('sheet_id', 'text', 'base_url',)
+
+    def __init__(self, sheet_id, text, base_url):
+        self.sheet_id = sheet_id
+        self.text = text
+        self.base_url = base_url
+
+
+class AdoptedSSReplace(Message):
+    __id__ = 72
+    __slots__ = ('sheet_id', 'text',)
+
+    def __init__(self, sheet_id, text):
+        self.sheet_id = sheet_id
+        self.text = text
+
+
+class AdoptedSSInsertRuleURLBased(Message):
+    __id__ = 73
+    __slots__ = ('sheet_id', 'rule', 'index', 'base_url',)
+
+    def __init__(self, sheet_id, rule, index, base_url):
+        self.sheet_id = sheet_id
+        self.rule = rule
+        self.index = index
+        self.base_url = base_url
+
+
+class AdoptedSSInsertRule(Message):
+    __id__ = 74
+    __slots__ = ('sheet_id', 'rule', 'index',)
+
+    def __init__(self, sheet_id, rule, index):
+        self.sheet_id = sheet_id
+        self.rule = rule
+        self.index = index
+
+
+class AdoptedSSDeleteRule(Message):
+    __id__ = 75
+    __slots__ = ('sheet_id', 'index',)
+
+    def __init__(self, sheet_id, index):
+        self.sheet_id = sheet_id
+        self.index = index
+
+
+class AdoptedSSAddOwner(Message):
+    __id__ = 76
+    __slots__ = ('sheet_id', 'id',)
+
+    def __init__(self, sheet_id, id):
+        self.sheet_id = sheet_id
+        self.id = id
+
+
+class AdoptedSSRemoveOwner(Message):
+    __id__ = 77
+    __slots__ = ('sheet_id', 'id',)
+
+    def __init__(self, sheet_id, id):
+        self.sheet_id = sheet_id
+        self.id = id
+
+
+class JSException(Message):
+    __id__ = 78
+    __slots__ = ('name', 'message', 'payload', 'metadata',)
+
+    def __init__(self, name, message, payload, metadata):
+        self.name = name
+        self.message = message
+        self.payload = payload
+        self.metadata = metadata
+
+
+class Zustand(Message):
+    __id__ = 79
+    __slots__ = ('mutation', 'state',)
+
+    def __init__(self, mutation, state):
+        self.mutation = mutation
+        self.state = state
+
+
 class BatchMeta(Message):
     __id__ = 80
+    __slots__ = ('page_no', 'first_index', 'timestamp',)
 
     def __init__(self, page_no, first_index, timestamp):
         self.page_no = page_no
         self.first_index = first_index
         self.timestamp = timestamp
 
+
+class BatchMetadata(Message):
+    __id__ = 81
+    __slots__ = ('version', 'page_no', 'first_index', 'timestamp', 'location',)
+
+    def __init__(self, version, page_no, first_index, timestamp, location):
+        self.version = version
+        self.page_no = page_no
+        self.first_index = first_index
+        self.timestamp = timestamp
+        self.location = location
+
+
+class PartitionedMessage(Message):
+    __id__ = 82
+    __slots__ = ('part_no', 'part_total',)
+
+    def __init__(self, part_no, part_total):
+        self.part_no = part_no
+        self.part_total = part_total
+
+
+class InputChange(Message):
+    __id__ = 112
+    __slots__ = ('id', 'value', 'value_masked', 'label', 'hesitation_time', 'input_duration',)
+
+    def __init__(self, id, value, value_masked, label, hesitation_time, input_duration):
+        self.id = id
+        self.value = value
+        self.value_masked = value_masked
+        self.label = label
+        self.hesitation_time = hesitation_time
+        self.input_duration = input_duration
+
+
+class SelectionChange(Message):
+    __id__ = 113
+    __slots__ = ('selection_start', 'selection_end', 'selection',)
+
+    def __init__(self, selection_start, selection_end, selection):
+        self.selection_start = selection_start
+        self.selection_end = selection_end
+        self.selection = selection
+
+
+class MouseThrashing(Message):
+    __id__ = 114
+    __slots__ = ('timestamp',)
+
+    def __init__(self, timestamp):
+        self.timestamp = timestamp
+
+
+class UnbindNodes(Message):
+    __id__ = 115
+    __slots__ = ('total_removed_percent',)
+
+    def __init__(self, total_removed_percent):
+        self.total_removed_percent = total_removed_percent
+
+
+class ResourceTiming(Message):
+    __id__ = 116
+    __slots__ = ('timestamp', 'duration', 'ttfb', 'header_size', 'encoded_body_size', 'decoded_body_size', 'url', 'initiator', 'transferred_size', 'cached',)
+
+    def __init__(self, timestamp, duration, ttfb, header_size, encoded_body_size, decoded_body_size, url, initiator, transferred_size, cached):
+        self.timestamp = timestamp
+        self.duration = duration
+        self.ttfb = ttfb
+        self.header_size = header_size
+        self.encoded_body_size = encoded_body_size
+        self.decoded_body_size = decoded_body_size
+        self.url = url
+        self.initiator = initiator
+        self.transferred_size = transferred_size
+        self.cached = cached
+
+
+class IssueEvent(Message):
+    __id__ = 125
+    __slots__ = ('message_id', 'timestamp', 'type', 'context_string', 'context', 'payload', 'url',)
+
+    def __init__(self, message_id, timestamp, type, context_string, context, payload, url):
+        self.message_id = message_id
+        self.timestamp = timestamp
+        self.type = type
+        self.context_string = context_string
+        self.context = context
+        self.payload = payload
+        self.url = url
+
+
+class SessionEnd(Message):
+    __id__ = 126
+    __slots__ = ('timestamp', 'encryption_key',)
+
+    def __init__(self, timestamp, encryption_key):
+        self.timestamp = timestamp
+        self.encryption_key = encryption_key
+
+
+class SessionSearch(Message):
+    __id__ = 127
+    __slots__ = ('timestamp', 'partition',)
+
+    def __init__(self, timestamp, partition):
+        self.timestamp = timestamp
+        self.partition = partition
+
+
+class IOSBatchMeta(Message):
+    __id__ = 107
+    __slots__ = ('timestamp', 'length', 'first_index',)
+
+    def __init__(self, timestamp, length, first_index):
+        self.timestamp = timestamp
+        self.length = length
+        self.first_index = first_index
+
+
 class IOSSessionStart(Message):
     __id__ = 90
+    __slots__ = ('timestamp', 'project_id', 'tracker_version', 'rev_id', 'user_uuid', 'user_os', 'user_os_version', 'user_device', 'user_device_type', 'user_country',)
 
-    def __init__(self, timestamp, project_id, tracker_version: str,
-                 rev_id: str, user_uuid: str, user_os: str, user_os_version: str,
-                 user_device: str, user_device_type: str, user_country: str):
+    def __init__(self, timestamp, project_id, tracker_version, rev_id, user_uuid, user_os, user_os_version, user_device, user_device_type, user_country):
         self.timestamp = timestamp
         self.project_id = project_id
         self.tracker_version = tracker_version
@@ -724,6 +903,7 @@ class IOSSessionStart(Message):
 
 class IOSSessionEnd(Message):
     __id__ = 91
+    __slots__ = ('timestamp',)
 
     def __init__(self, timestamp):
         self.timestamp = timestamp
@@ -731,8 +911,9 @@ class IOSSessionEnd(Message):
 
 class IOSMetadata(Message):
     __id__ = 92
+    __slots__ = ('timestamp', 'length', 'key', 'value',)
 
-    def __init__(self, timestamp, length, key: str, value: str):
+    def __init__(self, timestamp, length, key, value):
         self.timestamp = timestamp
         self.length = length
         self.key = key
@@ -741,8 +922,9 @@ class IOSMetadata(Message):
 
 class IOSCustomEvent(Message):
     __id__ = 93
+    __slots__ = ('timestamp', 'length', 'name', 'payload',)
 
-    def __init__(self, timestamp, length, name: str, payload: str):
+    def __init__(self, timestamp, length, name, payload):
         self.timestamp = timestamp
         self.length = length
         self.name = name
@@ -751,8 +933,9 @@ class IOSCustomEvent(Message):
 
 class IOSUserID(Message):
     __id__ = 94
+    __slots__ = ('timestamp', 'length', 'value',)
 
-    def __init__(self, timestamp, length, value: str):
+    def __init__(self, timestamp, length, value):
         self.timestamp = timestamp
         self.length = length
         self.value = value
@@ -760,8 +943,9 @@ class IOSUserID(Message):
 
 class IOSUserAnonymousID(Message):
     __id__ = 95
+    __slots__ = ('timestamp', 'length', 'value',)
 
-    def __init__(self, timestamp, length, value: str):
+    def __init__(self, timestamp, length, value):
         self.timestamp = timestamp
         self.length = length
         self.value = value
@@ -769,6 +953,7 @@ class IOSUserAnonymousID(Message):
 
 class IOSScreenChanges(Message):
     __id__ = 96
+    __slots__ = ('timestamp', 'length', 'x', 'y', 'width', 'height',)
 
     def __init__(self, timestamp, length, x, y, width, height):
         self.timestamp = timestamp
@@ -781,8 +966,9 @@ class IOSScreenChanges(Message):
 
 class IOSCrash(Message):
     __id__ = 97
+    __slots__ = ('timestamp', 'length', 'name', 'reason', 'stacktrace',)
 
-    def __init__(self, timestamp, length, name: str, reason: str, stacktrace):
+    def __init__(self, timestamp, length, name, reason, stacktrace):
         self.timestamp = timestamp
         self.length = length
         self.name = name
@@ -792,6 +978,7 @@ class IOSCrash(Message):
 
 class IOSScreenEnter(Message):
     __id__ = 98
+    __slots__ = ('timestamp', 'length', 'title', 'view_name',)
 
     def __init__(self, timestamp, length, title, view_name):
         self.timestamp = timestamp
@@ -802,8 +989,9 @@ class IOSScreenEnter(Message):
 
 class IOSScreenLeave(Message):
     __id__ = 99
+    __slots__ = ('timestamp', 'length', 'title', 'view_name',)
 
-    def __init__(self, timestamp, length, title: str, view_name: str):
+    def __init__(self, timestamp, length, title, view_name):
         self.timestamp = timestamp
         self.length = length
         self.title = title
@@ -812,6 +1000,7 @@ class IOSScreenLeave(Message):
 
 class IOSClickEvent(Message):
     __id__ = 100
+    __slots__ = ('timestamp', 'length', 'label', 'x', 'y',)
 
     def __init__(self, timestamp, length, label, x, y):
         self.timestamp = timestamp
@@ -823,18 +1012,21 @@ class IOSClickEvent(Message):
 
 class IOSInputEvent(Message):
     __id__ = 101
+    __slots__ = ('timestamp', 'length', 'value', 'value_masked', 'label',)
 
-    def __init__(self, timestamp, length, value: str, value_masked: bool, label: str):
+    def __init__(self, timestamp, length, value, value_masked, label):
         self.timestamp = timestamp
         self.length = length
+        self.value = value
         self.value_masked = value_masked
         self.label = label
 
 
 class IOSPerformanceEvent(Message):
     __id__ = 102
+    __slots__ = ('timestamp', 'length', 'name', 'value',)
 
-    def __init__(self, timestamp, length, name: str, value):
+    def __init__(self, timestamp, length, name, value):
         self.timestamp = timestamp
         self.length = length
         self.name = name
@@ -843,8 +1035,9 @@ class IOSPerformanceEvent(Message):
 
 class IOSLog(Message):
     __id__ = 103
+    __slots__ = ('timestamp', 'length', 'severity', 'content',)
 
-    def __init__(self, timestamp, length, severity: str, content: str):
+    def __init__(self, timestamp, length, severity, content):
         self.timestamp = timestamp
         self.length = length
         self.severity = severity
@@ -853,8 +1046,9 @@ class IOSLog(Message):
 
 class IOSInternalError(Message):
     __id__ = 104
+    __slots__ = ('timestamp', 'length', 'content',)
 
-    def __init__(self, timestamp, length, content: str):
+    def __init__(self, timestamp, length, content):
         self.timestamp = timestamp
         self.length = length
         self.content = content
@@ -862,8 +1056,9 @@ class IOSInternalError(Message):
 
 class IOSNetworkCall(Message):
     __id__ = 105
+    __slots__ = ('timestamp', 'length', 'duration', 'headers', 'body', 'url', 'success', 'method', 'status',)
 
-    def __init__(self, timestamp, length, duration, headers, body, url, success: bool, method: str, status):
+    def __init__(self, timestamp, length, duration, headers, body, url, success, method, status):
         self.timestamp = timestamp
         self.length = length
         self.duration = duration
@@ -875,23 +1070,11 @@ class IOSNetworkCall(Message):
         self.status = status
 
 
-class IOSBatchMeta(Message):
-    __id__ = 107
-
-    def __init__(self, timestamp, length, first_index):
-        self.timestamp = timestamp
-        self.length = length
-        self.first_index = first_index
-
-
 class IOSPerformanceAggregated(Message):
     __id__ = 110
+    __slots__ = ('timestamp_start', 'timestamp_end', 'min_fps', 'avg_fps', 'max_fps', 'min_cpu', 'avg_cpu', 'max_cpu', 'min_memory', 'avg_memory', 'max_memory', 'min_battery', 'avg_battery', 'max_battery',)
 
-    def __init__(self, timestamp_start, timestamp_end, min_fps, avg_fps,
-                 max_fps, min_cpu, avg_cpu, max_cpu,
-                 min_memory, avg_memory, max_memory,
-                 min_battery, avg_battery, max_battery
-                 ):
+    def __init__(self, timestamp_start, timestamp_end, min_fps, avg_fps, max_fps, min_cpu, avg_cpu, max_cpu, min_memory, avg_memory, max_memory, min_battery, avg_battery, max_battery):
         self.timestamp_start = timestamp_start
         self.timestamp_end = timestamp_end
         self.min_fps = min_fps
@@ -910,10 +1093,13 @@ class IOSPerformanceAggregated(Message):
 
 class IOSIssueEvent(Message):
     __id__ = 111
+    __slots__ = ('timestamp', 'type', 'context_string', 'context', 'payload',)
 
-    def __init__(self, timestamp, type: str, context_string: str, context: str, payload: str):
+    def __init__(self, timestamp, type, context_string, context, payload):
         self.timestamp = timestamp
         self.type = type
         self.context_string = context_string
         self.context = context
         self.payload = payload
+
+
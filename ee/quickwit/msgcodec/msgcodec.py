@@ -0,0 +1,1042 @@
+# Auto-generated, do not edit
+
+from msgcodec.codec import Codec
+from msgcodec.messages import *
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+decode_boolean = Codec.decode_boolean
+decode_uint = Codec.decode_uint
+decode_int = Codec.decode_int
+decode_size = Codec.decode_size
+skip_fields = Codec.skip_fields
+
+
+def make_readers(decode_string: Callable) -> Dict[int, Callable[[memoryview, int], Tuple[Message, int]]]:
+    """
+    Build the decoder table: message id -> reader callable, so that decoding a
+    message costs a single dict lookup regardless of its id. decode_string is
+    the primitive used for string fields (eager str or LazyString).
+    """
+
+    def read_timestamp(buf: memoryview, pos: int) -> Tuple[Timestamp, int]:
+        timestamp, pos = decode_uint(buf, pos)
+        return Timestamp(timestamp), pos
+
+    def read_session_start(buf: memoryview, pos: int) -> Tuple[SessionStart, int]:
+        timestamp, pos = decode_uint(buf, pos)
+        project_id, pos = decode_uint(buf, pos)
+        tracker_version, pos = decode_string(buf, pos)
+        rev_id, pos = decode_string(buf, pos)
+        user_uuid, pos = decode_string(buf, pos)
+        user_agent, pos = decode_string(buf, pos)
+        user_os, pos = decode_string(buf, pos)
+        user_os_version, pos = decode_string(buf, pos)
+        user_browser, pos = decode_string(buf, pos)
+        user_browser_version, pos = decode_string(buf, pos)
+        user_device, pos = decode_string(buf, pos)
+        user_device_type, pos = decode_string(buf, pos)
+        user_device_memory_size, pos = decode_uint(buf, pos)
+        user_device_heap_size, pos = decode_uint(buf, pos)
+        user_country, pos = decode_string(buf, pos)
+        user_id, pos = decode_string(buf, pos)
+        return SessionStart(timestamp, project_id, tracker_version, rev_id, user_uuid, user_agent, user_os, user_os_version, user_browser, user_browser_version, user_device, user_device_type, user_device_memory_size, user_device_heap_size, user_country, user_id), pos
+
+    def read_session_end_deprecated(buf: memoryview, pos: int) -> Tuple[SessionEndDeprecated, int]:
+        timestamp, pos = decode_uint(buf, pos)
+        return SessionEndDeprecated(timestamp), pos
+
+    def read_set_page_location(buf: memoryview, pos: int) -> Tuple[SetPageLocation, int]:
+        url, pos = decode_string(buf, pos)
+        referrer, pos = decode_string(buf, pos)
+        navigation_start, pos = decode_uint(buf, pos)
+        return SetPageLocation(url, referrer, navigation_start), pos
+
+    def read_set_viewport_size(buf: memoryview, pos: int) -> Tuple[SetViewportSize, int]:
+        width, pos = decode_uint(buf, pos)
+        height, pos = decode_uint(buf, pos)
+        return SetViewportSize(width, height), pos
+
+    def read_set_viewport_scroll(buf: memoryview, pos: int) -> Tuple[SetViewportScroll, int]:
+        x, pos = decode_int(buf, pos)
+        y, pos = decode_int(buf, pos)
+        return SetViewportScroll(x, y), pos
+
+    def read_create_document(buf: memoryview, pos: int) -> Tuple[CreateDocument, int]:
+        return CreateDocument(), pos
+
+    def read_create_element_node(buf: memoryview, pos: int) -> Tuple[CreateElementNode, int]:
+        id, pos = decode_uint(buf, pos)
+        parent_id, pos = decode_uint(buf, pos)
+        index, pos = decode_uint(buf, pos)
+        tag, pos = decode_string(buf, pos)
+        svg, pos = decode_boolean(buf, pos)
+        return CreateElementNode(id, parent_id, index, tag, svg), pos
+
+    def read_create_text_node(buf: memoryview, pos: int) -> Tuple[CreateTextNode, int]:
+        id, pos = decode_uint(buf, pos)
+        parent_id, pos = decode_uint(buf, pos)
+        index, pos = decode_uint(buf, pos)
+        return CreateTextNode(id, parent_id, index), pos
+
+    def read_move_node(buf: memoryview, pos: int) -> Tuple[MoveNode, int]:
+        id, pos = decode_uint(buf, pos)
+        parent_id, pos = decode_uint(buf, pos)
+        index, pos = decode_uint(buf, pos)
+        return MoveNode(id, parent_id, index), pos
+
+    def read_remove_node(buf: memoryview, pos: int) -> Tuple[RemoveNode, int]:
+        id, pos = decode_uint(buf, pos)
+        return RemoveNode(id), pos
+
+    def read_set_node_attribute(buf: memoryview, pos: int) -> Tuple[SetNodeAttribute, int]:
+        id, pos = decode_uint(buf, pos)
+        name, pos = decode_string(buf, pos)
+        value, pos = decode_string(buf, pos)
+        return SetNodeAttribute(id, name, value), pos
+
+    def read_remove_node_attribute(buf: memoryview, pos: int) -> Tuple[RemoveNodeAttribute, int]:
+        id, pos = decode_uint(buf, pos)
+        name, pos = decode_string(buf, pos)
+        return RemoveNodeAttribute(id, name), pos
+
+    def read_set_node_data(buf: memoryview, pos: int) -> Tuple[SetNodeData, int]:
+        id, pos = decode_uint(buf, pos)
+        data, pos = decode_string(buf, pos)
+        return SetNodeData(id, data), pos
+
+    def read_set_css_data(buf: memoryview, pos: int) -> Tuple[SetCSSData, int]:
+        id, pos = decode_uint(buf, pos)
+        data, pos = decode_string(buf, pos)
+        return SetCSSData(id, data), pos
+
+    def read_set_node_scroll(buf: memoryview, pos: int) -> Tuple[SetNodeScroll, int]:
+        id, pos = decode_uint(buf, pos)
+        x, pos = decode_int(buf, pos)
+        y, pos = decode_int(buf, pos)
+        return SetNodeScroll(id, x, y), pos
+
+    def read_set_input_target(buf: memoryview, pos: int) -> Tuple[SetInputTarget, int]:
+        id, pos = decode_uint(buf, pos)
+        label, pos = decode_string(buf, pos)
+        return SetInputTarget(id, label), pos
+
+    def read_set_input_value(buf: memoryview, pos: int) -> Tuple[SetInputValue, int]:
+        id, pos = decode_uint(buf, pos)
+        value, pos = decode_string(buf, pos)
+        mask, pos = decode_int(buf, pos)
+        return SetInputValue(id, value, mask), pos
+
+    def read_set_input_checked(buf: memoryview, pos: int) -> Tuple[SetInputChecked, int]:
+        id, pos = decode_uint(buf, pos)
+        checked, pos = decode_boolean(buf, pos)
+        return SetInputChecked(id, checked), pos
+
+    def read_mouse_move(buf: memoryview, pos: int) -> Tuple[MouseMove, int]:
+        x, pos = decode_uint(buf, pos)
+        y, pos = decode_uint(buf, pos)
+        return MouseMove(x, y), pos
+
+    def read_network_request(buf: memoryview, pos: int) -> Tuple[NetworkRequest, int]:
+        type, pos = decode_string(buf, pos)
+        method, pos = decode_string(buf, pos)
+        url, pos = decode_string(buf, pos)
+        request, pos = decode_string(buf, pos)
+        response, pos = decode_string(buf, pos)
+        status, pos = decode_uint(buf, pos)
+        timestamp, pos = decode_uint(buf, pos)
+        duration, pos = decode_uint(buf, pos)
+        return NetworkRequest(type, method, url, request, response, status, timestamp, duration), pos
+
+    def read_console_log(buf: memoryview, pos: int) -> Tuple[ConsoleLog, int]:
+        level, pos = decode_string(buf, pos)
+        value, pos = decode_string(buf, pos)
+        return ConsoleLog(level, value), pos
+
+    def read_page_load_timing(buf: memoryview, pos: int) -> Tuple[PageLoadTiming, int]:
+        request_start, pos = decode_uint(buf, pos)
+        response_start, pos = decode_uint(buf, pos)
+        response_end, pos = decode_uint(buf, pos)
+        dom_content_loaded_event_start, pos = decode_uint(buf, pos)
+        dom_content_loaded_event_end, pos = decode_uint(buf, pos)
+        load_event_start, pos = decode_uint(buf, pos)
+        load_event_end, pos = decode_uint(buf, pos)
+        first_paint, pos = decode_uint(buf, pos)
+        first_contentful_paint, pos = decode_uint(buf, pos)
+        return PageLoadTiming(request_start, response_start, response_end, dom_content_loaded_event_start, dom_content_loaded_event_end, load_event_start, load_event_end, first_paint, first_contentful_paint), pos
+
+    def read_page_render_timing(buf: memoryview, pos: int) -> Tuple[PageRenderTiming, int]:
+        speed_index, pos = decode_uint(buf, pos)
+        visually_complete, pos = decode_uint(buf, pos)
+        time_to_interactive, pos = decode_uint(buf, pos)
+        return PageRenderTiming(speed_index, visually_complete, time_to_interactive), pos
+
+    def read_js_exception_deprecated(buf: memoryview, pos: int) -> Tuple[JSExceptionDeprecated, int]:
+        name, pos = decode_string(buf, pos)
+        message, pos = decode_string(buf, pos)
+        payload, pos = decode_string(buf, pos)
+        return JSExceptionDeprecated(name, message, payload), pos
+
+    def read_integration_event(buf: memoryview, pos: int) -> Tuple[IntegrationEvent, int]:
+        timestamp, pos = decode_uint(buf, pos)
+        source, pos = decode_string(buf, pos)
+        name, pos = decode_string(buf, pos)
+        message, pos = decode_string(buf, pos)
+        payload, pos = decode_string(buf, pos)
+        return IntegrationEvent(timestamp, source, name, message, payload), pos
+
+    def read_custom_event(buf: memoryview, pos: int) -> Tuple[CustomEvent, int]:
+        name, pos = decode_string(buf, pos)
+        payload, pos = decode_string(buf, pos)
+        return CustomEvent(name, payload), pos
+
+    def read_user_id(buf: memoryview, pos: int) -> Tuple[UserID, int]:
+        id, pos = decode_string(buf, pos)
+        return UserID(id), pos
+
+    def read_user_anonymous_id(buf: memoryview, pos: int) -> Tuple[UserAnonymousID, int]:
+        id, pos = decode_string(buf, pos)
+        return UserAnonymousID(id), pos
+
+    def read_metadata(buf: memoryview, pos: int) -> Tuple[Metadata, int]:
+        key, pos = decode_string(buf, pos)
+        value, pos = decode_string(buf, pos)
+        return Metadata(key, value), pos
+
+    def read_page_event(buf: memoryview, pos: int) -> Tuple[PageEvent, int]:
+        message_id, pos = decode_uint(buf, pos)
+        timestamp, pos = decode_uint(buf, pos)
+        url, pos = decode_string(buf, pos)
+        referrer, pos = decode_string(buf, pos)
+        loaded, pos = decode_boolean(buf, pos)
+        request_start, pos = decode_uint(buf, pos)
+        response_start, pos = decode_uint(buf, pos)
+        response_end, pos = decode_uint(buf, pos)
+        dom_content_loaded_event_start, pos = decode_uint(buf, pos)
+        dom_content_loaded_event_end, pos = decode_uint(buf, pos)
+        load_event_start, pos = decode_uint(buf, pos)
+        load_event_end, pos = decode_uint(buf, pos)
+        first_paint, pos = decode_uint(buf, pos)
+        first_contentful_paint, pos = decode_uint(buf, pos)
+        speed_index, pos = decode_uint(buf, pos)
+        visually_complete, pos = decode_uint(buf, pos)
+        time_to_interactive, pos = decode_uint(buf, pos)
+        return PageEvent(message_id, timestamp, url, referrer, loaded, request_start, response_start, response_end, dom_content_loaded_event_start, dom_content_loaded_event_end, load_event_start, load_event_end, first_paint, first_contentful_paint, speed_index, visually_complete, time_to_interactive), pos
+
+    def read_input_event(buf: memoryview, pos: int) -> Tuple[InputEvent, int]:
+        message_id, pos = decode_uint(buf, pos)
+        timestamp, pos = decode_uint(buf, pos)
+        value, pos = decode_string(buf, pos)
+        value_masked, pos = decode_boolean(buf, pos)
+        label, pos = decode_string(buf, pos)
+        return InputEvent(message_id, timestamp, value, value_masked, label), pos
+
+    def read_css_insert_rule(buf: memoryview, pos: int) -> Tuple[CSSInsertRule, int]:
+        id, pos = decode_uint(buf, pos)
+        rule, pos = decode_string(buf, pos)
+        index, pos = decode_uint(buf, pos)
+        return CSSInsertRule(id, rule, index), pos
+
+    def read_css_delete_rule(buf: memoryview, pos: int) -> Tuple[CSSDeleteRule, int]:
+        id, pos = decode_uint(buf, pos)
+        index, pos = decode_uint(buf, pos)
+        return CSSDeleteRule(id, index), pos
+
+    def read_fetch(buf: memoryview, pos: int) -> Tuple[Fetch, int]:
+        method, pos = decode_string(buf, pos)
+        url, pos = decode_string(buf, pos)
+        request, pos = decode_string(buf, pos)
+        response, pos = decode_string(buf, pos)
+        status, pos = decode_uint(buf, pos)
+        timestamp, pos = decode_uint(buf, pos)
+        duration, pos = decode_uint(buf, pos)
+        return Fetch(method, url, request, response, status, timestamp, duration), pos
+
+    def read_profiler(buf: memoryview, pos: int) -> Tuple[Profiler, int]:
+        name, pos = decode_string(buf, pos)
+        duration, pos = decode_uint(buf, pos)
+        args, pos = decode_string(buf, pos)
+        result, pos = decode_string(buf, pos)
+        return Profiler(name, duration, args, result), pos
+
+    def read_o_table(buf: memoryview, pos: int) -> Tuple[OTable, int]:
+        key, pos = decode_string(buf, pos)
+        value, pos = decode_string(buf, pos)
+        return OTable(key, value), pos
+
+    def read_state_action(buf: memoryview, pos: int) -> Tuple[StateAction, int]:
+        type, pos = decode_string(buf, pos)
+        return StateAction(type), pos
+
+    def read_redux(buf: memoryview, pos: int) -> Tuple[Redux, int]:
+        action, pos = decode_string(buf, pos)
+        state, pos = decode_string(buf, pos)
+        duration, pos = decode_uint(buf, pos)
+        return Redux(action, state, duration), pos
+
+    def read_vuex(buf: memoryview, pos: int) -> Tuple[Vuex, int]:
+        mutation, pos = decode_string(buf, pos)
+        state, pos = decode_string(buf, pos)
+        return Vuex(mutation, state), pos
+
+    def read_mob_x(buf: memoryview, pos: int) -> Tuple[MobX, int]:
+        type, pos = decode_string(buf, pos)
+        payload, pos = decode_string(buf, pos)
+        return MobX(type, payload), pos
+
+    def read_ng_rx(buf: memoryview, pos: int) -> Tuple[NgRx, int]:
+        action, pos = decode_string(buf, pos)
+        state, pos = decode_string(buf, pos)
+        duration, pos = decode_uint(buf, pos)
+        return NgRx(action, state, duration), pos
+
+    def read_graph_ql(buf: memoryview, pos: int) -> Tuple[GraphQL, int]:
+        operation_kind, pos = decode_string(buf, pos)
+        operation_name, pos = decode_string(buf, pos)
+        variables, pos = decode_string(buf, pos)
+        response, pos = decode_string(buf, pos)
+        return GraphQL(operation_kind, operation_name, variables, response), pos
+
+    def read_performance_track(buf: memoryview, pos: int) -> Tuple[PerformanceTrack, int]:
+        frames, pos = decode_int(buf, pos)
+        ticks, pos = decode_int(buf, pos)
+        total_js_heap_size, pos = decode_uint(buf, pos)
+        used_js_heap_size, pos = decode_uint(buf, pos)
+        return PerformanceTrack(frames, ticks, total_js_heap_size, used_js_heap_size), pos
+
+    def read_string_dict(buf: memoryview, pos: int) -> Tuple[StringDict, int]:
+        key, pos = decode_uint(buf, pos)
+        value, pos = decode_string(buf, pos)
+        return StringDict(key, value), pos
+
+    def read_set_node_attribute_dict(buf: memoryview, pos: int) -> Tuple[SetNodeAttributeDict, int]:
+        id, pos = decode_uint(buf, pos)
+        name_key, pos = decode_uint(buf, pos)
+        value_key, pos = decode_uint(buf, pos)
+        return SetNodeAttributeDict(id, name_key, value_key), pos
+
+    def read_resource_timing_deprecated(buf: memoryview, pos: int) -> Tuple[ResourceTimingDeprecated, int]:
+        timestamp, pos = decode_uint(buf, pos)
+        duration, pos = decode_uint(buf, pos)
+        ttfb, pos = decode_uint(buf, pos)
+        header_size, pos = decode_uint(buf, pos)
+        encoded_body_size, pos = decode_uint(buf, pos)
+        decoded_body_size, pos = decode_uint(buf, pos)
+        url, pos = decode_string(buf, pos)
+        initiator, pos = decode_string(buf, pos)
+        return ResourceTimingDeprecated(timestamp, duration, ttfb, header_size, encoded_body_size, decoded_body_size, url, initiator), pos
+
+    def read_connection_information(buf: memoryview, pos: int) -> Tuple[ConnectionInformation, int]:
+        downlink, pos = decode_uint(buf, pos)
+        type, pos = decode_string(buf, pos)
+        return ConnectionInformation(downlink, type), pos
+
+    def read_set_page_visibility(buf: memoryview, pos: int) -> Tuple[SetPageVisibility, int]:
+        hidden, pos = decode_boolean(buf, pos)
+        return SetPageVisibility(hidden), pos
+
+    def read_performance_track_aggr(buf: memoryview, pos: int) -> Tuple[PerformanceTrackAggr, int]:
+        timestamp_start, pos = decode_uint(buf, pos)
+        timestamp_end, pos = decode_uint(buf, pos)
+        min_fps, pos = decode_uint(buf, pos)
+        avg_fps, pos = decode_uint(buf, pos)
+        max_fps, pos = decode_uint(buf, pos)
+        min_cpu, pos = decode_uint(buf, pos)
+        avg_cpu, pos = decode_uint(buf, pos)
+        max_cpu, pos = decode_uint(buf, pos)
+        min_total_js_heap_size, pos = decode_uint(buf, pos)
+        avg_total_js_heap_size, pos = decode_uint(buf, pos)
+        max_total_js_heap_size, pos = decode_uint(buf, pos)
+        min_used_js_heap_size, pos = decode_uint(buf, pos)
+        avg_used_js_heap_size, pos = decode_uint(buf, pos)
+        max_used_js_heap_size, pos = decode_uint(buf, pos)
+        return PerformanceTrackAggr(timestamp_start, timestamp_end, min_fps, avg_fps, max_fps, min_cpu, avg_cpu, max_cpu, min_total_js_heap_size, avg_total_js_heap_size, max_total_js_heap_size, min_used_js_heap_size, avg_used_js_heap_size, max_used_js_heap_size), pos
+
+    def read_load_font_face(buf: memoryview, pos: int) -> Tuple[LoadFontFace, int]:
+        parent_id, pos = decode_uint(buf, pos)
+        family, pos = decode_string(buf, pos)
+        source, pos = decode_string(buf, pos)
+        descriptors, pos = decode_string(buf, pos)
+        return LoadFontFace(parent_id, family, source, descriptors), pos
+
+    def read_set_node_focus(buf: memoryview, pos: int) -> Tuple[SetNodeFocus, int]:
+        id, pos = decode_int(buf, pos)
+        return SetNodeFocus(id), pos
+
+    def read_long_task(buf: memoryview, pos: int) -> Tuple[LongTask, int]:
+        timestamp, pos = decode_uint(buf, pos)
+        duration, pos = decode_uint(buf, pos)
+        context, pos = decode_uint(buf, pos)
+        container_type, pos = decode_uint(buf, pos)
+        container_src, pos = decode_string(buf, pos)
+        container_id, pos = decode_string(buf, pos)
+        container_name, pos = decode_string(buf, pos)
+        return LongTask(timestamp, duration, context, container_type, container_src, container_id, container_name), pos
+
+    def read_set_node_attribute_url_based(buf: memoryview, pos: int) -> Tuple[SetNodeAttributeURLBased, int]:
+        id, pos = decode_uint(buf, pos)
+        name, pos = decode_string(buf, pos)
+        value, pos = decode_string(buf, pos)
+        base_url, pos = decode_string(buf, pos)
+        return SetNodeAttributeURLBased(id, name, value, base_url), pos
+
+    def read_set_css_data_url_based(buf: memoryview, pos: int) -> Tuple[SetCSSDataURLBased, int]:
+        id, pos = decode_uint(buf, pos)
+        data, pos = decode_string(buf, pos)
+        base_url, pos = decode_string(buf, pos)
+        return SetCSSDataURLBased(id, data, base_url), pos
+
+    def read_issue_event_deprecated(buf: memoryview, pos: int) -> Tuple[IssueEventDeprecated, int]:
+        message_id, pos = decode_uint(buf, pos)
+        timestamp, pos = decode_uint(buf, pos)
+        type, pos = decode_string(buf, pos)
+        context_string, pos = decode_string(buf, pos)
+        context, pos = decode_string(buf, pos)
+        payload, pos = decode_string(buf, pos)
+        return IssueEventDeprecated(message_id, timestamp, type, context_string, context, payload), pos
+
+    def read_technical_info(buf: memoryview, pos: int) -> Tuple[TechnicalInfo, int]:
+        type, pos = decode_string(buf, pos)
+        value, pos = decode_string(buf, pos)
+        return TechnicalInfo(type, value), pos
+
+    def read_custom_issue(buf: memoryview, pos: int) -> Tuple[CustomIssue, int]:
+        name, pos = decode_string(buf, pos)
+        payload, pos = decode_string(buf, pos)
+        return CustomIssue(name, payload), pos
+
+    def read_asset_cache(buf: memoryview, pos: int) -> Tuple[AssetCache, int]:
+        url, pos = decode_string(buf, pos)
+        return AssetCache(url), pos
+
+    def read_css_insert_rule_url_based(buf: memoryview, pos: int) -> Tuple[CSSInsertRuleURLBased, int]:
+        id, pos = decode_uint(buf, pos)
+        rule, pos = decode_string(buf, pos)
+        index, pos = decode_uint(buf, pos)
+        base_url, pos = decode_string(buf, pos)
+        return CSSInsertRuleURLBased(id, rule, index, base_url), pos
+
+    def read_mouse_click(buf: memoryview, pos: int) -> Tuple[MouseClick, int]:
+        id, pos = decode_uint(buf, pos)
+        hesitation_time, pos = decode_uint(buf, pos)
+        label, pos = decode_string(buf, pos)
+        selector, pos = decode_string(buf, pos)
+        return MouseClick(id, hesitation_time, label, selector), pos
+
+    def read_create_i_frame_document(buf: memoryview, pos: int) -> Tuple[CreateIFrameDocument, int]:
+        frame_id, pos = decode_uint(buf, pos)
+        id, pos = decode_uint(buf, pos)
+        return CreateIFrameDocument(frame_id, id), pos
+
+    def read_adopted_ss_replace_url_based(buf: memoryview, pos: int) -> Tuple[AdoptedSSReplaceURLBased, int]:
+        sheet_id, pos = decode_uint(buf, pos)
+        text, pos = decode_string(buf, pos)
+        base_url, pos = decode_string(buf, pos)
+        return AdoptedSSReplaceURLBased(sheet_id, text, base_url), pos
+
+    def read_adopted_ss_replace(buf: memoryview, pos: int) -> Tuple[AdoptedSSReplace, int]:
+        sheet_id, pos = decode_uint(buf, pos)
+        text, pos = decode_string(buf, pos)
+        return AdoptedSSReplace(sheet_id, text), pos
+
+    def read_adopted_ss_insert_rule_url_based(buf: memoryview, pos: int) -> Tuple[AdoptedSSInsertRuleURLBased, int]:
+        sheet_id, pos = decode_uint(buf, pos)
+        rule, pos = decode_string(buf, pos)
+        index, pos = decode_uint(buf, pos)
+        base_url, pos = decode_string(buf, pos)
+        return AdoptedSSInsertRuleURLBased(sheet_id, rule, index, base_url), pos
+
+    def read_adopted_ss_insert_rule(buf: memoryview, pos: int) -> Tuple[AdoptedSSInsertRule, int]:
+        sheet_id, pos = decode_uint(buf, pos)
+        rule, pos = decode_string(buf, pos)
+        index, pos = decode_uint(buf, pos)
+        return AdoptedSSInsertRule(sheet_id, rule, index), pos
+
+    def read_adopted_ss_delete_rule(buf: memoryview, pos: int) -> Tuple[AdoptedSSDeleteRule, int]:
+        sheet_id, pos = decode_uint(buf, pos)
+        index, pos = decode_uint(buf, pos)
+        return AdoptedSSDeleteRule(sheet_id, index), pos
+
+    def read_adopted_ss_add_owner(buf: memoryview, pos: int) -> Tuple[AdoptedSSAddOwner, int]:
+        sheet_id, pos = decode_uint(buf, pos)
+        id, pos = decode_uint(buf, pos)
+        return AdoptedSSAddOwner(sheet_id, id), pos
+
+    def read_adopted_ss_remove_owner(buf: memoryview, pos: int) -> Tuple[AdoptedSSRemoveOwner, int]:
+        sheet_id, pos = decode_uint(buf, pos)
+        id, pos = decode_uint(buf, pos)
+        return AdoptedSSRemoveOwner(sheet_id, id), pos
+
+    def read_js_exception(buf: memoryview, pos: int) -> Tuple[JSException, int]:
+        name, pos = decode_string(buf, pos)
+        message, pos = decode_string(buf, pos)
+        payload, pos = decode_string(buf, pos)
+        metadata, pos = decode_string(buf, pos)
+        return JSException(name, message, payload, metadata), pos
+
+    def read_zustand(buf: memoryview, pos: int) -> Tuple[Zustand, int]:
+        mutation, pos = decode_string(buf, pos)
+        state, pos = decode_string(buf, pos)
+        return Zustand(mutation, state), pos
+
+    def read_batch_meta(buf: memoryview, pos: int) -> Tuple[BatchMeta, int]:
+        page_no, pos = decode_uint(buf, pos)
+        first_index, pos = decode_uint(buf, pos)
+        timestamp, pos = decode_int(buf, pos)
+        return BatchMeta(page_no, first_index, timestamp), pos
+
+    def read_batch_metadata(buf: memoryview, pos: int) -> Tuple[BatchMetadata, int]:
+        version, pos = decode_uint(buf, pos)
+        page_no, pos = decode_uint(buf, pos)
+        first_index, pos = decode_uint(buf, pos)
+        timestamp, pos = decode_int(buf, pos)
+        location, pos = decode_string(buf, pos)
+        return BatchMetadata(version, page_no, first_index, timestamp, location), pos
+
+    def read_partitioned_message(buf: memoryview, pos: int) -> Tuple[PartitionedMessage, int]:
+        part_no, pos = decode_uint(buf, pos)
+        part_total, pos = decode_uint(buf, pos)
+        return PartitionedMessage(part_no, part_total), pos
+
+    def read_input_change(buf: memoryview, pos: int) -> Tuple[InputChange, int]:
+        id, pos = decode_uint(buf, pos)
+        value, pos = decode_string(buf, pos)
+        value_masked, pos = decode_boolean(buf, pos)
+        label, pos = decode_string(buf, pos)
+        hesitation_time, pos = decode_int(buf, pos)
+        input_duration, pos = decode_int(buf, pos)
+        return InputChange(id, value, value_masked, label, hesitation_time, input_duration), pos
+
+    def read_selection_change(buf: memoryview, pos: int) -> Tuple[SelectionChange, int]:
+        selection_start, pos = decode_uint(buf, pos)
+        selection_end, pos = decode_uint(buf, pos)
+        selection, pos = decode_string(buf, pos)
+        return SelectionChange(selection_start, selection_end, selection), pos
+
+    def read_mouse_thrashing(buf: memoryview, pos: int) -> Tuple[MouseThrashing, int]:
+        timestamp, pos = decode_uint(buf, pos)
+        return MouseThrashing(timestamp), pos
+
+    def read_unbind_nodes(buf: memoryview, pos: int) -> Tuple[UnbindNodes, int]:
+        total_removed_percent, pos = decode_uint(buf, pos)
+        return UnbindNodes(total_removed_percent), pos
+
+    def read_resource_timing(buf: memoryview, pos: int) -> Tuple[ResourceTiming, int]:
+        timestamp, pos = decode_uint(buf, pos)
+        duration, pos = decode_uint(buf, pos)
+        ttfb, pos = decode_uint(buf, pos)
+        header_size, pos = decode_uint(buf, pos)
+        encoded_body_size, pos = decode_uint(buf, pos)
+        decoded_body_size, pos = decode_uint(buf, pos)
+        url, pos = decode_string(buf, pos)
+        initiator, pos = decode_string(buf, pos)
+        transferred_size, pos = decode_uint(buf, pos)
+        cached, pos = decode_boolean(buf, pos)
+        return ResourceTiming(timestamp, duration, ttfb, header_size, encoded_body_size, decoded_body_size, url, initiator, transferred_size, cached), pos
+
+    def read_issue_event(buf: memoryview, pos: int) -> Tuple[IssueEvent, int]:
+        message_id, pos = decode_uint(buf, pos)
+        timestamp, pos = decode_uint(buf, pos)
+        type, pos = decode_string(buf, pos)
+        context_string, pos = decode_string(buf, pos)
+        context, pos = decode_string(buf, pos)
+        payload, pos = decode_string(buf, pos)
+        url, pos = decode_string(buf, pos)
+        return IssueEvent(message_id, timestamp, type, context_string, context, payload, url), pos
+
+    def read_session_end(buf: memoryview, pos: int) -> Tuple[SessionEnd, int]:
+        timestamp, pos = decode_uint(buf, pos)
+        encryption_key, pos = decode_string(buf, pos)
+        return SessionEnd(timestamp, encryption_key), pos
+
+    def read_session_search(buf: memoryview, pos: int) -> Tuple[SessionSearch, int]:
+        timestamp, pos = decode_uint(buf, pos)
+        partition, pos = decode_uint(buf, pos)
+        return SessionSearch(timestamp, partition), pos
+
+    def read_ios_batch_meta(buf: memoryview, pos: int) -> Tuple[IOSBatchMeta, int]:
+        timestamp, pos = decode_uint(buf, pos)
+        length, pos = decode_uint(buf, pos)
+        first_index, pos = decode_uint(buf, pos)
+        return IOSBatchMeta(timestamp, length, first_index), pos
+
+    def read_ios_session_start(buf: memoryview, pos: int) -> Tuple[IOSSessionStart, int]:
+        timestamp, pos = decode_uint(buf, pos)
+        project_id, pos = decode_uint(buf, pos)
+        tracker_version, pos = decode_string(buf, pos)
+        rev_id, pos = decode_string(buf, pos)
+        user_uuid, pos = decode_string(buf, pos)
+        user_os, pos = decode_string(buf, pos)
+        user_os_version, pos = decode_string(buf, pos)
+        user_device, pos = decode_string(buf, pos)
+        user_device_type, pos = decode_string(buf, pos)
+        user_country, pos = decode_string(buf, pos)
+        return IOSSessionStart(timestamp, project_id, tracker_version, rev_id, user_uuid, user_os, user_os_version, user_device, user_device_type, user_country), pos
+
+    def read_ios_session_end(buf: memoryview, pos: int) -> Tuple[IOSSessionEnd, int]:
+        timestamp, pos = decode_uint(buf, pos)
+        return IOSSessionEnd(timestamp), pos
+
+    def read_ios_metadata(buf: memoryview, pos: int) -> Tuple[IOSMetadata, int]:
+        timestamp, pos = decode_uint(buf, pos)
+        length, pos = decode_uint(buf, pos)
+        key, pos = decode_string(buf, pos)
+        value, pos = decode_string(buf, pos)
+        return IOSMetadata(timestamp, length, key, value), pos
+
+    def read_ios_custom_event(buf: memoryview, pos: int) -> Tuple[IOSCustomEvent, int]:
+        timestamp, pos = decode_uint(buf, pos)
+        length, pos = decode_uint(buf, pos)
+        name, pos = decode_string(buf, pos)
+        payload, pos = decode_string(buf, pos)
+        return IOSCustomEvent(timestamp, length, name, payload), pos
+
+    def read_ios_user_id(buf: memoryview, pos: int) -> Tuple[IOSUserID, int]:
+        timestamp, pos = decode_uint(buf, pos)
+        length, pos = decode_uint(buf, pos)
+        value, pos = decode_string(buf, pos)
+        return IOSUserID(timestamp, length, value), pos
+
+    def read_ios_user_anonymous_id(buf: memoryview, pos: int) -> Tuple[IOSUserAnonymousID, int]:
+        timestamp, pos = decode_uint(buf, pos)
+        length, pos = decode_uint(buf, pos)
+        value, pos = decode_string(buf, pos)
+        return IOSUserAnonymousID(timestamp, length, value), pos
+
+    def read_ios_screen_changes(buf: memoryview, pos: int) -> Tuple[IOSScreenChanges, int]:
+        timestamp, pos = decode_uint(buf, pos)
+        length, pos = decode_uint(buf, pos)
+        x, pos = decode_uint(buf, pos)
+        y, pos = decode_uint(buf, pos)
+        width, pos = decode_uint(buf, pos)
+        height, pos = decode_uint(buf, pos)
+        return IOSScreenChanges(timestamp, length, x, y, width, height), pos
+
+    def read_ios_crash(buf: memoryview, pos: int) -> Tuple[IOSCrash, int]:
+        timestamp, pos = decode_uint(buf, pos)
+        length, pos = decode_uint(buf, pos)
+        name, pos = decode_string(buf, pos)
+        reason, pos = decode_string(buf, pos)
+        stacktrace, pos = decode_string(buf, pos)
+        return IOSCrash(timestamp, length, name, reason, stacktrace), pos
+
+    def read_ios_screen_enter(buf: memoryview, pos: int) -> Tuple[IOSScreenEnter, int]:
+        timestamp, pos = decode_uint(buf, pos)
+        length, pos = decode_uint(buf, pos)
+        title, pos = decode_string(buf, pos)
+        view_name, pos = decode_string(buf, pos)
+        return IOSScreenEnter(timestamp, length, title, view_name), pos
+
+    def read_ios_screen_leave(buf: memoryview, pos: int) -> Tuple[IOSScreenLeave, int]:
+        timestamp, pos = decode_uint(buf, pos)
+        length, pos = decode_uint(buf, pos)
+        title, pos = decode_string(buf, pos)
+        view_name, pos = decode_string(buf, pos)
+        return IOSScreenLeave(timestamp, length, title, view_name), pos
+
+    def read_ios_click_event(buf: memoryview, pos: int) -> Tuple[IOSClickEvent, int]:
+        timestamp, pos = decode_uint(buf, pos)
+        length, pos = decode_uint(buf, pos)
+        label, pos = decode_string(buf, pos)
+        x, pos = decode_uint(buf, pos)
+        y, pos = decode_uint(buf, pos)
+        return IOSClickEvent(timestamp, length, label, x, y), pos
+
+    def read_ios_input_event(buf: memoryview, pos: int) -> Tuple[IOSInputEvent, int]:
+        timestamp, pos = decode_uint(buf, pos)
+        length, pos = decode_uint(buf, pos)
+        value, pos = decode_string(buf, pos)
+        value_masked, pos = decode_boolean(buf, pos)
+        label, pos = decode_string(buf, pos)
+        return IOSInputEvent(timestamp, length, value, value_masked, label), pos
+
+    def read_ios_performance_event(buf: memoryview, pos: int) -> Tuple[IOSPerformanceEvent, int]:
+        timestamp, pos = decode_uint(buf, pos)
+        length, pos = decode_uint(buf, pos)
+        name, pos = decode_string(buf, pos)
+        value, pos = decode_uint(buf, pos)
+        return IOSPerformanceEvent(timestamp, length, name, value), pos
+
+    def read_ios_log(buf: memoryview, pos: int) -> Tuple[IOSLog, int]:
+        timestamp, pos = decode_uint(buf, pos)
+        length, pos = decode_uint(buf, pos)
+        severity, pos = decode_string(buf, pos)
+        content, pos = decode_string(buf, pos)
+        return IOSLog(timestamp, length, severity, content), pos
+
+    def read_ios_internal_error(buf: memoryview, pos: int) -> Tuple[IOSInternalError, int]:
+        timestamp, pos = decode_uint(buf, pos)
+        length, pos = decode_uint(buf, pos)
+        content, pos = decode_string(buf, pos)
+        return IOSInternalError(timestamp, length, content), pos
+
+    def read_ios_network_call(buf: memoryview, pos: int) -> Tuple[IOSNetworkCall, int]:
+        timestamp, pos = decode_uint(buf, pos)
+        length, pos = decode_uint(buf, pos)
+        duration, pos = decode_uint(buf, pos)
+        headers, pos = decode_string(buf, pos)
+        body, pos = decode_string(buf, pos)
+        url, pos = decode_string(buf, pos)
+        success, pos = decode_boolean(buf, pos)
+        method, pos = decode_string(buf, pos)
+        status, pos = decode_uint(buf, pos)
+        return IOSNetworkCall(timestamp, length, duration, headers, body, url, success, method, status), pos
+
+    def read_ios_performance_aggregated(buf: memoryview, pos: int) -> Tuple[IOSPerformanceAggregated, int]:
+        timestamp_start, pos = decode_uint(buf, pos)
+        timestamp_end, pos = decode_uint(buf, pos)
+        min_fps, pos = decode_uint(buf, pos)
+        avg_fps, pos = decode_uint(buf, pos)
+        max_fps, pos = decode_uint(buf, pos)
+        min_cpu, pos = decode_uint(buf, pos)
+        avg_cpu, pos = decode_uint(buf, pos)
+        max_cpu, pos = decode_uint(buf, pos)
+        min_memory, pos = decode_uint(buf, pos)
+        avg_memory, pos = decode_uint(buf, pos)
+        max_memory, pos = decode_uint(buf, pos)
+        min_battery, pos = decode_uint(buf, pos)
+        avg_battery, pos = decode_uint(buf, pos)
+        max_battery, pos = decode_uint(buf, pos)
+        return IOSPerformanceAggregated(timestamp_start, timestamp_end, min_fps, avg_fps, max_fps, min_cpu, avg_cpu, max_cpu, min_memory, avg_memory, max_memory, min_battery, avg_battery, max_battery), pos
+
+    def read_ios_issue_event(buf: memoryview, pos: int) -> Tuple[IOSIssueEvent, int]:
+        timestamp, pos = decode_uint(buf, pos)
+        type, pos = decode_string(buf, pos)
+        context_string, pos = decode_string(buf, pos)
+        context, pos = decode_string(buf, pos)
+        payload, pos = decode_string(buf, pos)
+        return IOSIssueEvent(timestamp, type, context_string, context, payload), pos
+
+    return {
+        0: read_timestamp,
+        1: read_session_start,
+        3: read_session_end_deprecated,
+        4: read_set_page_location,
+        5: read_set_viewport_size,
+        6: read_set_viewport_scroll,
+        7: read_create_document,
+        8: read_create_element_node,
+        9: read_create_text_node,
+        10: read_move_node,
+        11: read_remove_node,
+        12: read_set_node_attribute,
+        13: read_remove_node_attribute,
+        14: read_set_node_data,
+        15: read_set_css_data,
+        16: read_set_node_scroll,
+        17: read_set_input_target,
+        18: read_set_input_value,
+        19: read_set_input_checked,
+        20: read_mouse_move,
+        21: read_network_request,
+        22: read_console_log,
+        23: read_page_load_timing,
+        24: read_page_render_timing,
+        25: read_js_exception_deprecated,
+        26: read_integration_event,
+        27: read_custom_event,
+        28: read_user_id,
+        29: read_user_anonymous_id,
+        30: read_metadata,
+        31: read_page_event,
+        32: read_input_event,
+        37: read_css_insert_rule,
+        38: read_css_delete_rule,
+        39: read_fetch,
+        40: read_profiler,
+        41: read_o_table,
+        42: read_state_action,
+        44: read_redux,
+        45: read_vuex,
+        46: read_mob_x,
+        47: read_ng_rx,
+        48: read_graph_ql,
+        49: read_performance_track,
+        50: read_string_dict,
+        51: read_set_node_attribute_dict,
+        53: read_resource_timing_deprecated,
+        54: read_connection_information,
+        55: read_set_page_visibility,
+        56: read_performance_track_aggr,
+        57: read_load_font_face,
+        58: read_set_node_focus,
+        59: read_long_task,
+        60: read_set_node_attribute_url_based,
+        61: read_set_css_data_url_based,
+        62: read_issue_event_deprecated,
+        63: read_technical_info,
+        64: read_custom_issue,
+        66: read_asset_cache,
+        67: read_css_insert_rule_url_based,
+        69: read_mouse_click,
+        70: read_create_i_frame_document,
+        71: read_adopted_ss_replace_url_based,
+        72: read_adopted_ss_replace,
+        73: read_adopted_ss_insert_rule_url_based,
+        74: read_adopted_ss_insert_rule,
+        75: read_adopted_ss_delete_rule,
+        76: read_adopted_ss_add_owner,
+        77: read_adopted_ss_remove_owner,
+        78: read_js_exception,
+        79: read_zustand,
+        80: read_batch_meta,
+        81: read_batch_metadata,
+        82: read_partitioned_message,
+        112: read_input_change,
+        113: read_selection_change,
+        114: read_mouse_thrashing,
+        115: read_unbind_nodes,
+        116: read_resource_timing,
+        125: read_issue_event,
+        126: read_session_end,
+        127: read_session_search,
+        107: read_ios_batch_meta,
+        90: read_ios_session_start,
+        91: read_ios_session_end,
+        92: read_ios_metadata,
+        93: read_ios_custom_event,
+        94: read_ios_user_id,
+        95: read_ios_user_anonymous_id,
+        96: read_ios_screen_changes,
+        97: read_ios_crash,
+        98: read_ios_screen_enter,
+        99: read_ios_screen_leave,
+        100: read_ios_click_event,
+        101: read_ios_input_event,
+        102: read_ios_performance_event,
+        103: read_ios_log,
+        104: read_ios_internal_error,
+        105: read_ios_network_call,
+        110: read_ios_performance_aggregated,
+        111: read_ios_issue_event,
+    }
+
+
+MESSAGE_READERS = make_readers(Codec.decode_string)
+LAZY_MESSAGE_READERS = make_readers(Codec.decode_lazy_string)
+
+# Field kinds of each message payload (u: uint, i: int, b: boolean, s: string),
+# used to step over unwanted messages in batches without size prefix
+MESSAGE_LAYOUTS: Dict[int, str] = {
+    0: 'u',
+    1: 'uussssssssssuuss',
+    3: 'u',
+    4: 'ssu',
+    5: 'uu',
+    6: 'ii',
+    7: '',
+    8: 'uuusb',
+    9: 'uuu',
+    10: 'uuu',
+    11: 'u',
+    12: 'uss',
+    13: 'us',
+    14: 'us',
+    15: 'us',
+    16: 'uii',
+    17: 'us',
+    18: 'usi',
+    19: 'ub',
+    20: 'uu',
+    21: 'sssssuuu',
+    22: 'ss',
+    23: 'uuuuuuuuu',
+    24: 'uuu',
+    25: 'sss',
+    26: 'ussss',
+    27: 'ss',
+    28: 's',
+    29: 's',
+    30: 'ss',
+    31: 'uussbuuuuuuuuuuuu',
+    32: 'uusbs',
+    37: 'usu',
+    38: 'uu',
+    39: 'ssssuuu',
+    40: 'suss',
+    41: 'ss',
+    42: 's',
+    44: 'ssu',
+    45: 'ss',
+    46: 'ss',
+    47: 'ssu',
+    48: 'ssss',
+    49: 'iiuu',
+    50: 'us',
+    51: 'uuu',
+    53: 'uuuuuuss',
+    54: 'us',
+    55: 'b',
+    56: 'uuuuuuuuuuuuuu',
+    57: 'usss',
+    58: 'i',
+    59: 'uuuusss',
+    60: 'usss',
+    61: 'uss',
+    62: 'uussss',
+    63: 'ss',
+    64: 'ss',
+    66: 's',
+    67: 'usus',
+    69: 'uuss',
+    70: 'uu',
+    71: 'uss',
+    72: 'us',
+    73: 'usus',
+    74: 'usu',
+    75: 'uu',
+    76: 'uu',
+    77: 'uu',
+    78: 'ssss',
+    79: 'ss',
+    80: 'uui',
+    81: 'uuuis',
+    82: 'uu',
+    112: 'usbsii',
+    113: 'uus',
+    114: 'u',
+    115: 'u',
+    116: 'uuuuuussub',
+    125: 'uusssss',
+    126: 'us',
+    127: 'uu',
+    107: 'uuu',
+    90: 'uussssssss',
+    91: 'u',
+    92: 'uuss',
+    93: 'uuss',
+    94: 'uus',
+    95: 'uus',
+    96: 'uuuuuu',
+    97: 'uusss',
+    98: 'uuss',
+    99: 'uuss',
+    100: 'uusuu',
+    101: 'uusbs',
+    102: 'uusu',
+    103: 'uuss',
+    104: 'uus',
+    105: 'uuusssbsu',
+    110: 'uuuuuuuuuuuuuu',
+    111: 'ussss',
+}
+
+
+class MessageCodec(Codec):
+
+    def __init__(self, msg_selector: Optional[Iterable[int]] = None, lazy_strings: bool = False):
+        """
+        msg_selector: interest set, the message ids to decode. Other messages of a batch
+            are skipped without being decoded. Empty or None decodes everything
+        lazy_strings: decode string fields as LazyString (utf-8 decoded on first use)
+        """
+        self.msg_selector = frozenset(msg_selector) if msg_selector else None
+        self.readers = LAZY_MESSAGE_READERS if lazy_strings else MESSAGE_READERS
+        self.decoded = 0
+        self.skipped = 0
+
+    def pop_counters(self) -> Tuple[int, int]:
+        """
+        Return the number of (decoded, skipped) messages since the last call and reset them
+        """
+        counters = self.decoded, self.skipped
+        self.decoded = 0
+        self.skipped = 0
+        return counters
+
+    def encode(self, m: Message) -> bytes:
+        ...
+
+    def decode(self, b: bytes) -> Message:
+        buf = memoryview(b)
+        message_id, pos = decode_uint(buf, 0)
+        return self.read_head_message(buf, pos, message_id)[0]
+
+    @staticmethod
+    def check_message_id(b: bytes) -> int:
+        """
+        Read and return the first byte where the message id is encoded
+        """
+        return decode_uint(b, 0)[0]
+
+    @staticmethod
+    def decode_key(b) -> int:
+        """
+        Decode the message key (encoded with little endian)
+        """
+        try:
+            decoded = int.from_bytes(b, "little", signed=False)
+        except Exception as e:
+            raise UnicodeDecodeError(f"Error while decoding message key (SessionID) from {b}\n{e}")
+        return decoded
+
+    def decode_detailed(self, b: bytes) -> List[Message]:
+        """
+        Decode a whole batch (one kafka value) in a single pass over the buffer
+        """
+        buf = memoryview(b)
+        end = len(buf)
+        messages_list = list()
+        try:
+            message_id, pos = decode_uint(buf, 0)
+            batch_meta, pos = self.read_head_message(buf, pos, message_id)
+        except IndexError:
+            print('[WARN] Broken batch')
+            return list()
+        messages_list.append(batch_meta)
+        if isinstance(batch_meta, BatchMeta):
+            # Old BatchMeta
+            mode = 0
+        elif isinstance(batch_meta, BatchMetadata):
+            # New BatchMeta
+            if batch_meta.version == 0:
+                mode = 0
+            else:
+                mode = 1
+        else:
+            return messages_list
+
+        readers = self.readers
+        layouts = MESSAGE_LAYOUTS
+        msg_selector = self.msg_selector
+        decoded = skipped = 0
+        while pos < end:
+            try:
+                message_id, pos = decode_uint(buf, pos)
+                if mode == 1:
+                    # We read the three bytes representing the length of message. It can be used to skip unwanted messages
+                    size, pos = decode_size(buf, pos)
+                    msg_end = pos + size
+                    if msg_selector is not None and message_id not in msg_selector:
+                        pos = msg_end
+                        skipped += 1
+                        continue
+                elif msg_selector is not None and message_id not in msg_selector:
+                    # Old format with no bytes for message length, step over the fields instead
+                    layout = layouts.get(message_id)
+                    if layout is not None:
+                        pos = skip_fields(buf, pos, layout)
+                        skipped += 1
+                    continue
+                read_message = readers.get(message_id)
+                if read_message is None:
+                    if mode == 1:
+                        # Unknown message, its length keeps the rest of the batch aligned
+                        pos = msg_end
+                        skipped += 1
+                    continue
+                msg_decoded, pos = read_message(buf, pos)
+                if mode == 1:
+                    pos = msg_end
+            except IndexError:
+                break
+            decoded += 1
+            messages_list.append(msg_decoded)
+        self.decoded += decoded
+        self.skipped += skipped
+        return messages_list
+
+    def read_head_message(self, buf: memoryview, pos: int, message_id: int) -> Tuple[Message, int]:
+        read_message = self.readers.get(message_id)
+        if read_message is not None:
+            return read_message(buf, pos)
+        return None, pos
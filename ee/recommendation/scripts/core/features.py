@@ -1,5 +1,25 @@
 from utils.ch_client import ClickHouseClient
 from utils.pg_client import PostgresClient
+import psycopg2.extras
+
+# If public.funnel is empty
+FUNNELS_QUERY = f"""SELECT project_id, user_id, filter FROM (SELECT project_id, user_id, metric_id FROM public.metrics WHERE metric_type='funnel'
+    ) as T1 LEFT JOIN (SELECT filter, metric_id FROM public.metric_series) as T2 ON T1.metric_id = T2.metric_id"""
+# Else
+# FUNNELS_QUERY = "SELECT project_id, user_id, filter FROM public.funnels"
+METRICS_QUERY = """SELECT metric_type, metric_of, metric_value, metric_format FROM public.metrics"""
+FILTERS_QUERY = """SELECT T1.metric_id as metric_id, project_id, name, metric_type, metric_of, filter FROM (
+    SELECT metric_id, project_id, name, metric_type, metric_of FROM metrics) as T1 INNER JOIN
+    (SELECT metric_id, filter FROM metric_series WHERE filter != '{}') as T2 ON T1.metric_id = T2.metric_id"""
+
+
+def _clickhouse_features_query(limit=None):
+    limit = f'LIMIT {limit}' if limit is not None else ''
+    return f"""SELECT session_id, project_id, user_id, events_count, errors_count, duration, country, issue_score, device_type, rage, jsexception, badrequest FROM (
+    SELECT session_id, project_id, user_id, events_count, errors_count, duration, toInt8(user_country) as country, issue_score, toInt8(user_device_type) as device_type FROM experimental.sessions WHERE user_id IS NOT NULL) as T1
+INNER JOIN (SELECT session_id, project_id, sum(issue_type = 'click_rage') as rage, sum(issue_type = 'js_exception') as jsexception, sum(issue_type = 'bad_request') as badrequest FROM experimental.events WHERE event_type = 'ISSUE' AND session_id > 0 GROUP BY session_id, project_id {limit}) as T2
+ON T1.session_id = T2.session_id AND T1.project_id = T2.project_id;"""
+
 
 def get_features_clickhouse(**kwargs):
     """Gets features from ClickHouse database"""
@@ -7,12 +27,8 @@ def get_features_clickhouse(**kwargs):
         limit = kwargs['limit']
     else:
         limit = 500
-    query = f"""SELECT session_id, project_id, user_id, events_count, errors_count, duration, country, issue_score, device_type, rage, jsexception, badrequest FROM (
-    SELECT session_id, project_id, user_id, events_count, errors_count, duration, toInt8(user_country) as country, issue_score, toInt8(user_device_type) as device_type FROM experimental.sessions WHERE user_id IS NOT NULL) as T1
-INNER JOIN (SELECT session_id, project_id, sum(issue_type = 'click_rage') as rage, sum(issue_type = 'js_exception') as jsexception, sum(issue_type = 'bad_request') as badrequest FROM experimental.events WHERE event_type = 'ISSUE' AND session_id > 0 GROUP BY session_id, project_id LIMIT {limit}) as T2
-ON T1.session_id = T2.session_id AND T1.project_id = T2.project_id;"""
     with ClickHouseClient() as conn:
-        res = conn.execute(query)
+        res = conn.execute(_clickhouse_features_query(limit))
     return res
 
 
@@ -26,34 +42,71 @@ def get_features_postgres(**kwargs):
     return clean_filters_split(funnels, isfunnel=True), metrics, clean_filters_split(filters)
 
 
+def stream_clickhouse(query, batch_size):
+    """Yields the rows of query as lists of at most batch_size dicts, ClickHouse sends them block by block"""
+    with ClickHouseClient() as conn:
+        rows = conn.client().execute_iter(query, with_column_types=True, settings={'max_block_size': batch_size})
+        keys = tuple(x for x, y in next(rows))
+        batch = list()
+        for row in rows:
+            batch.append(dict(zip(keys, row)))
+            if len(batch) >= batch_size:
+                yield batch
+                batch = list()
+        if batch:
+            yield batch
+
+
+def stream_postgres(query, batch_size, name):
+    """Yields the rows of query as lists of at most batch_size dicts, read from a server-side cursor"""
+    pg = PostgresClient(unlimited_query=True)
+    try:
+        with pg.connection.cursor(name=name, cursor_factory=psycopg2.extras.RealDictCursor) as cur:
+            cur.itersize = batch_size
+            cur.execute(query)
+            while True:
+                batch = cur.fetchmany(batch_size)
+                if not batch:
+                    break
+                yield batch
+    finally:
+        pg.connection.rollback()
+        pg.connection.close()
+
+
+def iter_features_clickhouse(batch_size):
+    """Yields (name, batch of rows) of the ClickHouse features"""
+    for batch in stream_clickhouse(_clickhouse_features_query(), batch_size):
+        yield 'sessions', batch
+
+
+def iter_features_postgres(batch_size):
+    """Yields (name, batch of rows) of the Postgres features, the filters are split batch by batch"""
+    for batch in stream_postgres(FUNNELS_QUERY, batch_size, 'funnels'):
+        yield 'funnels', clean_filters_split(batch, isfunnel=True)
+    for batch in stream_postgres(METRICS_QUERY, batch_size, 'metrics'):
+        yield 'metrics', batch
+    for batch in stream_postgres(FILTERS_QUERY, batch_size, 'filters'):
+        yield 'filters', clean_filters_split(batch)
+
 
 def query_funnels(conn, **kwargs):
     """Gets Funnels (PG database)"""
-    # If public.funnel is empty
-    funnels_query = f"""SELECT project_id, user_id, filter FROM (SELECT project_id, user_id, metric_id FROM public.metrics WHERE metric_type='funnel'
-    ) as T1 LEFT JOIN (SELECT filter, metric_id FROM public.metric_series) as T2 ON T1.metric_id = T2.metric_id"""
-    # Else
-    # funnels_query = "SELECT project_id, user_id, filter FROM public.funnels"
-
-    conn.execute(funnels_query)
+    conn.execute(FUNNELS_QUERY)
     res = conn.fetchall()
     return res
 
 
 def query_metrics(conn, **kwargs):
     """Gets Metrics (PG_database)"""
-    metrics_query = """SELECT metric_type, metric_of, metric_value, metric_format FROM public.metrics"""
-    conn.execute(metrics_query)
+    conn.execute(METRICS_QUERY)
     res = conn.fetchall()
     return res
 
 
 def query_with_filters(conn, **kwargs):
     """Gets Metrics with filters (PG database)"""
-    filters_query = """SELECT T1.metric_id as metric_id, project_id, name, metric_type, metric_of, filter FROM (
-    SELECT metric_id, project_id, name, metric_type, metric_of FROM metrics) as T1 INNER JOIN
-    (SELECT metric_id, filter FROM metric_series WHERE filter != '{}') as T2 ON T1.metric_id = T2.metric_id"""
-    conn.execute(filters_query)
+    conn.execute(FILTERS_QUERY)
     res = conn.fetchall()
     return res
 
@@ -1,42 +1,77 @@
 import time
 import argparse
+import glob
+import json
+import os
 from core import features
-from utils import pg_client
 import multiprocessing as mp
 from decouple import config
-import asyncio
 import pandas
 
 
-def features_ch(q):
-    q.put(features.get_features_clickhouse())
+# Names of the features written by each source
+FEATURES = {'postgres': ('funnels', 'metrics', 'filters'), 'clickhouse': ('sessions',)}
+# Filter values mix types within a batch (string lists of browser filters, integer ranges of duration filters...),
+# parquet needs a single type per column so they are stored as JSON strings
+JSON_COLUMNS = {'funnels': ('value',), 'filters': ('value',)}
 
-def features_pg(q):
-    q.put(features.get_features_postgres())
 
-def get_features():
-    #mp.set_start_method('spawn')
-    #q = mp.Queue()
-    #p1 = mp.Process(target=features_ch, args=(q,))
-    #p1.start()
-    pg_features = features.get_features_postgres()
-    ch_features = []#p1.join()
-    return [pg_features, ch_features]
+def write_partitions(batches, cache_dir, names):
+    """Writes every (name, batch) as its own parquet file {name}-{n}.parquet, so the memory used is bounded by
+    the batch size whatever the size of the history. Files are renamed into place once complete.
+    The partitions of a previous run are removed for all the names first, even the ones that are now empty,
+    otherwise they would be read as part of this run."""
+    for name in names:
+        for old_file in glob.glob(f'{cache_dir}/{name}-*.parquet') + glob.glob(f'{cache_dir}/{name}-*.parquet.tmp'):
+            os.remove(old_file)
+    counts = {name: 0 for name in names}
+    for name, batch in batches:
+        if not batch:
+            continue
+        file_name = f'{cache_dir}/{name}-{counts[name]:05d}.parquet'
+        frame = pandas.DataFrame(batch)
+        for column in JSON_COLUMNS.get(name, ()):
+            if column in frame:
+                frame[column] = frame[column].map(json.dumps)
+        frame.to_parquet(file_name + '.tmp', index=False)
+        os.replace(file_name + '.tmp', file_name)
+        counts[name] += 1
+    return counts
 
 
-parser = argparse.ArgumentParser(description='Gets and process data from Postgres and ClickHouse.')
-parser.add_argument('--batch_size', type=int, required=True, help='--batch_size max size of columns per file to be saved in opt/airflow/cache')
+def extract(source, batch_size, cache_dir):
+    t1 = time.time()
+    if source == 'postgres':
+        batches = features.iter_features_postgres(batch_size)
+    else:
+        batches = features.iter_features_clickhouse(batch_size)
+    counts = write_partitions(batches, cache_dir, FEATURES[source])
+    print(f'{source} features written in {time.time() - t1: .2f} seconds: {counts}')
+
 
-args = parser.parse_args()
+def get_features(batch_size, cache_dir):
+    """Extracts the Postgres and ClickHouse features concurrently, each in its own process"""
+    ctx = mp.get_context('spawn')
+    processes = [ctx.Process(target=extract, args=(source, batch_size, cache_dir), name=f'features-{source}')
+                 for source in FEATURES]
+    for p in processes:
+        p.start()
+    for p in processes:
+        p.join()
+    failed = [p.name for p in processes if p.exitcode != 0]
+    if failed:
+        raise RuntimeError(f'Features extraction failed: {", ".join(failed)}')
+
+
+parser = argparse.ArgumentParser(description='Gets and process data from Postgres and ClickHouse.')
+parser.add_argument('--batch_size', type=int, required=True, help='--batch_size max number of rows per file to be saved in opt/airflow/cache')
 
 if __name__ == '__main__':
-    asyncio.run(pg_client.init())
+    args = parser.parse_args()
     print(args)
     t1 = time.time()
-    data = get_features()
-    #print(data)
     cache_dir = config("data_dir", default=f"/opt/airflow/cache")
-    for d in data[0]:
-        pandas.DataFrame(d).to_csv(f'{cache_dir}/tmp-{hash(time.time())}', sep=',')
+    os.makedirs(cache_dir, exist_ok=True)
+    get_features(args.batch_size, cache_dir)
     t2 = time.time()
     print(f'DONE! information retrieved in {t2-t1: .2f} seconds')
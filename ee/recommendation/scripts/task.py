@@ -15,12 +15,12 @@ def transform_dict_string(s_dicts):
     return data
 
 def process_file(file_name):
-    return pandas.read_csv(file_name, sep=",")
+    return pandas.read_parquet(file_name)
 
 
 def read_batches():
     base_dir = config('dir_path', default='/opt/airflow/cache')
-    files = os.listdir(base_dir)
+    files = sorted(f for f in os.listdir(base_dir) if f.endswith('.parquet'))
     for file in files:
         yield process_file(f'{base_dir}/{file}')
 
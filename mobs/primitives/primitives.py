@@ -1,4 +1,5 @@
 import io
+from typing import Tuple
 
 class Codec:
     """
@@ -60,3 +61,138 @@ class Codec:
             return s.decode("utf-8", errors="replace").replace("\x00", "\uFFFD")
         except UnicodeDecodeError:
             return None
+
+    # Buffer/offset variants of the readers above. They work on a bytes-like
+    # object (bytes or memoryview) with an integer cursor and return the
+    # decoded value together with the offset right after it, so a whole batch
+    # can be decoded in one pass without a BytesIO.read call per byte.
+
+    @staticmethod
+    def decode_boolean(buf: memoryview, pos: int) -> Tuple[bool, int]:
+        return buf[pos] == 1, pos + 1
+
+    @staticmethod
+    def decode_uint(buf: memoryview, pos: int) -> Tuple[int, int]:
+        b = buf[pos]
+        pos += 1
+        if b < 0x80:
+            return b, pos
+        x = b & 0x7f
+        s = 7
+        while True:
+            b = buf[pos]
+            pos += 1
+            if b < 0x80:
+                if s > 63 or s == 63 and b > 1:
+                    raise OverflowError()
+                return x | b << s, pos
+            x |= (b & 0x7f) << s
+            s += 7
+
+    @staticmethod
+    def decode_size(buf: memoryview, pos: int) -> Tuple[int, int]:
+        return buf[pos] | buf[pos + 1] << 8 | buf[pos + 2] << 16, pos + 3
+
+    @staticmethod
+    def decode_int(buf: memoryview, pos: int) -> Tuple[int, int]:
+        ux, pos = Codec.decode_uint(buf, pos)
+        if ux & 1:
+            return - (ux >> 1) - 1, pos
+        return ux >> 1, pos
+
+    @staticmethod
+    def decode_string(buf: memoryview, pos: int) -> Tuple[str, int]:
+        length, pos = Codec.decode_uint(buf, pos)
+        end = pos + length
+        if end > len(buf):
+            raise IndexError('bytes out of range')
+        return str(buf[pos:end], "utf-8", "replace").replace("\x00", "\uFFFD"), end
+
+    @staticmethod
+    def decode_lazy_string(buf: memoryview, pos: int) -> Tuple['LazyString', int]:
+        length, pos = Codec.decode_uint(buf, pos)
+        end = pos + length
+        if end > len(buf):
+            raise IndexError('bytes out of range')
+        return LazyString(buf[pos:end]), end
+
+    @staticmethod
+    def skip_fields(buf: memoryview, pos: int, layout: str) -> int:
+        """
+        Move the cursor past a message payload without decoding it.
+        layout holds one letter per field: u(int), i(nt), b(oolean), s(tring)
+        """
+        for kind in layout:
+            if kind == 'b':
+                pos += 1
+            elif kind == 's':
+                length, pos = Codec.decode_uint(buf, pos)
+                pos += length
+            else:
+                while buf[pos] & 0x80:
+                    pos += 1
+                pos += 1
+        return pos
+
+
+class LazyString:
+    """
+    String field that keeps a slice of the batch buffer and is decoded (once)
+    the first time it is used. Behaves like the decoded str for comparison,
+    hashing, len, indexing and str methods; pickles and deep-copies as a
+    plain str.
+    """
+    __slots__ = ('_raw', '_value')
+
+    def __init__(self, raw: memoryview):
+        self._raw = raw
+        self._value = None
+
+    def __str__(self) -> str:
+        if self._value is None:
+            self._value = str(self._raw, "utf-8", "replace").replace("\x00", "\uFFFD")
+            self._raw = None
+        return self._value
+
+    def __repr__(self):
+        return repr(str(self))
+
+    def __eq__(self, other):
+        if isinstance(other, (str, LazyString)):
+            return str(self) == str(other)
+        return NotImplemented
+
+    def __lt__(self, other):
+        return str(self) < str(other)
+
+    def __hash__(self):
+        return hash(str(self))
+
+    def __len__(self):
+        return len(str(self))
+
+    def __bool__(self):
+        if self._value is None:
+            return len(self._raw) > 0
+        return len(self._value) > 0
+
+    def __getitem__(self, item):
+        return str(self)[item]
+
+    def __contains__(self, item):
+        return str(item) in str(self)
+
+    def __iter__(self):
+        return iter(str(self))
+
+    def __add__(self, other):
+        return str(self) + str(other)
+
+    def __radd__(self, other):
+        return str(other) + str(self)
+
+    def __getattr__(self, name):
+        return getattr(str(self), name)
+
+    def __reduce__(self):
+        return str, (str(self),)
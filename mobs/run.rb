@@ -132,4 +132,10 @@ Dir["templates/*.erb"].each do |tpl|
   # TODO: .gen subextention
   File.write(t, e.result)
   puts tpl + ' --> ' + t
+  # The python msgcodec is shared by the connectors and the quickwit consumer
+  if t.start_with? '../ee/connectors/msgcodec/'
+    q = t.sub('/connectors/', '/quickwit/')
+    File.write(q, e.result)
+    puts tpl + ' --> ' + q
+  end
 end